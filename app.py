@@ -1,15 +1,51 @@
-import pandas as pd
+import os
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from preprocess import get_agg_df
-from load_data import MatchSheet, PersonalSheet
-from st_aggrid import AgGrid, GridOptionsBuilder, JsCode
+from profiling import finish_run, stage, start_run
+from grid import paged_grid
+from charts import create_radar_chart, make_melted_df, create_group_bar_chart, create_player_line_chart, prepare_figure
+from preprocess import (
+    LEVEL_COLS, PER_GAME_COLS, PER_STUDENT_COLS,
+    add_key_cols, add_rate_cols, detect_date_col, get_agg_df, get_tabular_data,
+)
+from load_data import MatchSheet, PersonalSheet, SnapshotSheet
 
 LEVEL = ['학년', '반', '팀', '성별', '개인']
-NUMERIC_COLS = ['수비성공', '패스시도', '공격시도']
 
 st.set_page_config(page_title="JFLH 츄크볼", layout="wide")
+
+# --- 계측: ?debug=1 또는 JFLH_DEBUG=1 이면 메모리 추적 + 사이드바 패널 ---
+DEBUG = st.query_params.get("debug") == "1" or os.environ.get("JFLH_DEBUG") == "1"
+perf = start_run(trace_memory=DEBUG, debug=DEBUG)
+
+
+# --- 집계 캐시: 같은 원본/기준이면 재실행마다 groupby 하지 않음 ---
+@st.cache_data(show_spinner=False)
+def _cached_agg_df(df, selected_col, match_agg_cols):
+    return get_agg_df(df, selected_col, match_agg_cols)
+
+
+def cached_agg_df(df, selected_col, match_agg_cols):
+    # 캐시 적중 시에도 해시/역직렬화 비용이 보이도록 호출부를 계측
+    with stage("app.cached_agg_df"):
+        return _cached_agg_df(df, selected_col, match_agg_cols)
+
+
+@st.cache_data(show_spinner=False)
+def cached_tabular_df(df):
+    return get_tabular_data(df)
+
+
+def data_source():
+    # JFLH_SNAPSHOT 이 있으면 시트 대신 로컬 스냅샷(parquet)을 사용 (부하 테스트/오프라인)
+    snapshot = os.environ.get("JFLH_SNAPSHOT")
+    return SnapshotSheet(snapshot) if snapshot else PersonalSheet()
+
+
+def show_chart(fig, name):
+    with stage("app.plotly_chart"):
+        st.plotly_chart(prepare_figure(fig, name), use_container_width=True)
+
+
 st.title("🏐 2025. JFLH 츄크볼 리그전 누가기록")
 
 # --- 세션 상태 초기화 ---
@@ -19,10 +55,8 @@ if 'df' not in st.session_state:
 # --- 데이터 불러오기 버튼 ---
 if st.button("📥 데이터 가져오기"):
     try:
-        personal_df = PersonalSheet().fetch_df()   
-        personal_df['학년-반'] = personal_df['학년'].astype(str) + '_' + personal_df['반'].astype(str)  
-        personal_df['학년-반-번호'] = personal_df['학년'].astype(str) + '-' + personal_df['반'].astype(str) + '-' + personal_df['번호'].astype(str)   
-        st.session_state.df = personal_df      
+        personal_df = data_source().fetch_df()   
+        st.session_state.df = add_key_cols(personal_df)      
         st.success("데이터를 성공적으로 불러왔습니다.")
     except Exception as e:
         st.error(f"데이터를 불러오는 중 오류가 발생했습니다: {e}")
@@ -30,88 +64,40 @@ if st.button("📥 데이터 가져오기"):
 df = st.session_state.df
 
 # --- 날짜컬럼 자동 감지 ---
-date_col = None
-if df is not None:
-    for col in df.columns:
-        if '날짜' in col or 'date' in col.lower():
-            try:
-                df[col] = pd.to_datetime(df[col])
-                date_col = col
-                break
-            except:
-                pass
+date_col = detect_date_col(df) if df is not None else None
 
 if df is not None:
     # 탭 대신 라디오 버튼으로 대체 (탭 유지 방지)
     selected_tab = st.radio("📌 통계 기준 선택", LEVEL, horizontal=True)
  
     if selected_tab == '학년':
-        selected_col = '학년'
-        match_agg_cols = ['학년', '반', '팀명']
-        grouped = get_agg_df(df, selected_col, match_agg_cols)      
+        selected_col, match_agg_cols = LEVEL_COLS[selected_tab]
+        grouped = cached_agg_df(df, selected_col, match_agg_cols)      
         
         if grouped.empty:
             st.info("표시할 데이터가 없습니다.")
         else:
             # ───────────────────────────────            
-            grouped['수비성공_경기당'] = grouped['수비성공'] / grouped['경기수']
-            grouped['패스시도_경기당'] = grouped['패스시도'] / grouped['경기수']
-            grouped['공격시도_경기당'] = grouped['공격시도'] / grouped['경기수']
-            
-            grouped['수비성공_인원당'] = grouped['수비성공'] / grouped['학생수']
-            grouped['패스시도_인원당'] = grouped['패스시도'] / grouped['학생수']
-            grouped['공격시도_인원당'] = grouped['공격시도'] / grouped['학생수']
-
-            metrics = ['수비성공', '패스시도', '공격시도']
-
-            def create_radar_chart(df, value_cols, title):
-                fig = go.Figure()
-
-                for _, row in df.iterrows():
-                    values = [row[col] for col in value_cols]
-                    fig.add_trace(go.Scatterpolar(
-                        r=values + [values[0]],  # 닫힌 도형을 위해 첫 값 반복
-                        theta=metrics + [metrics[0]],
-                        fill='toself',
-                        name=f"{row['학년']}학년"
-                    ))
-
-                fig.update_layout(
-                    title=title,
-                    polar=dict(
-                        radialaxis=dict(visible=True),
-                    ),
-                    showlegend=True
-                )
-                return fig
+            grouped = add_rate_cols(grouped)
 
             col1, col2 = st.columns(2)
 
             with col1:
                 st.subheader("🎯 경기당 평균 지표 (학년별)")
-                radar1 = create_radar_chart(
-                    grouped,
-                    ['수비성공_경기당', '패스시도_경기당', '공격시도_경기당'],
-                    title="경기당 평균"
-                )
-                st.plotly_chart(radar1, use_container_width=True)
+                radar1 = create_radar_chart(grouped, PER_GAME_COLS, title="경기당 평균")
+                show_chart(radar1, "radar_per_game")
 
             with col2:
                 st.subheader("👤 인원당 평균 지표 (학년별)")
-                radar2 = create_radar_chart(
-                    grouped,
-                    ['수비성공_인원당', '패스시도_인원당', '공격시도_인원당'],
-                    title="인원당 평균"
-                )
-                st.plotly_chart(radar2, use_container_width=True)
+                radar2 = create_radar_chart(grouped, PER_STUDENT_COLS, title="인원당 평균")
+                show_chart(radar2, "radar_per_student")
 
             st.subheader(f"📊 {selected_tab} 기준 집계표")        
-            st.dataframe(grouped.drop(['수비성공_경기당', '패스시도_경기당', '공격시도_경기당','수비성공_인원당', '패스시도_인원당', '공격시도_인원당'], axis = 1))  
+            paged_grid(grouped.drop(PER_GAME_COLS + PER_STUDENT_COLS, axis = 1), key="grade")
 
     elif selected_tab == '반':
-        selected_col = '학년-반'
-        match_agg_cols = ['학년-반', '팀명']
-        grouped = get_agg_df(df, selected_col, match_agg_cols)
+        selected_col, match_agg_cols = LEVEL_COLS[selected_tab]
+        grouped = cached_agg_df(df, selected_col, match_agg_cols)
 
         st.subheader(f"📊 {selected_tab} 기준 집계표")
 
@@ -119,101 +105,60 @@ if df is not None:
             st.info("표시할 데이터가 없습니다.")
         else:
             # ─── 계산 컬럼 추가 ───
-            grouped['수비성공_경기당'] = grouped['수비성공'] / grouped['경기수']
-            grouped['패스시도_경기당'] = grouped['패스시도'] / grouped['경기수']
-            grouped['공격시도_경기당'] = grouped['공격시도'] / grouped['경기수']
-
-            grouped['수비성공_인원당'] = grouped['수비성공'] / grouped['학생수']
-            grouped['패스시도_인원당'] = grouped['패스시도'] / grouped['학생수']
-            grouped['공격시도_인원당'] = grouped['공격시도'] / grouped['학생수']
+            grouped = add_rate_cols(grouped)
 
             # ─── 그래프용 형태로 변환 ───
-            def make_melted_df(df, cols, value_name):
-                return df.melt(
-                    id_vars=['학년-반'],
-                    value_vars=cols,
-                    var_name='지표',
-                    value_name=value_name
-                )
-
             # 1) 경기당
-            game_avg_df = make_melted_df(
-                grouped,
-                ['수비성공_경기당', '패스시도_경기당', '공격시도_경기당'],
-                value_name='경기당 평균'
-            )
-            game_avg_df['지표'] = game_avg_df['지표'].str.replace('_경기당', '')
+            game_avg_df = make_melted_df(grouped, PER_GAME_COLS, value_name='경기당 평균', suffix='_경기당')
 
             # 2) 인원당
-            student_avg_df = make_melted_df(
-                grouped,
-                ['수비성공_인원당', '패스시도_인원당', '공격시도_인원당'],
-                value_name='인원당 평균'
-            )
-            student_avg_df['지표'] = student_avg_df['지표'].str.replace('_인원당', '')
+            student_avg_df = make_melted_df(grouped, PER_STUDENT_COLS, value_name='인원당 평균', suffix='_인원당')
 
             # ─── 시각화: 2열 구성 ───
             col1, col2 = st.columns(2)
 
             with col1:
                 st.subheader("🎯 경기당 평균 (반별)")
-                fig1 = px.bar(
-                    game_avg_df,
-                    x='학년-반',
-                    y='경기당 평균',
-                    color='지표',
-                    barmode='group',
-                    title='반별 경기당 평균 지표'
-                )
-                fig1.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig1, use_container_width=True)
+                fig1 = create_group_bar_chart(game_avg_df, '경기당 평균', title='반별 경기당 평균 지표')
+                show_chart(fig1, "bar_per_game")
 
             with col2:
                 st.subheader("👤 인원당 평균 (반별)")
-                fig2 = px.bar(
-                    student_avg_df,
-                    x='학년-반',
-                    y='인원당 평균',
-                    color='지표',
-                    barmode='group',
-                    title='반별 인원당 평균 지표'
-                )
-                fig2.update_layout(xaxis_tickangle=-45)
-                st.plotly_chart(fig2, use_container_width=True)
+                fig2 = create_group_bar_chart(student_avg_df, '인원당 평균', title='반별 인원당 평균 지표')
+                show_chart(fig2, "bar_per_student")
 
             # 마지막에 원래 표도 보여주기
-            st.dataframe(grouped.drop(columns=[
-                '수비성공_경기당', '패스시도_경기당', '공격시도_경기당',
-                '수비성공_인원당', '패스시도_인원당', '공격시도_인원당'
-            ]))
+            paged_grid(grouped.drop(columns=PER_GAME_COLS + PER_STUDENT_COLS), key="class")
 
     
     elif selected_tab == '팀':
-        selected_col = '팀명'
-        match_agg_cols = ['학년-반', '팀명']
-        grouped = get_agg_df(df, selected_col, match_agg_cols)
+        selected_col, match_agg_cols = LEVEL_COLS[selected_tab]
+        grouped = cached_agg_df(df, selected_col, match_agg_cols)
 
         st.subheader(f"📊 {selected_tab} 기준 집계표")
         if grouped.empty:
             st.info("표시할 데이터가 없습니다.")
         else:
-            st.dataframe(grouped)
+            paged_grid(grouped, key="team")
 
     elif selected_tab == '성별':
-        selected_col = '성별'
-        match_agg_cols = ['학년-반', '팀명']
-        grouped = get_agg_df(df, selected_col, match_agg_cols)
+        selected_col, match_agg_cols = LEVEL_COLS[selected_tab]
+        grouped = cached_agg_df(df, selected_col, match_agg_cols)
 
         st.subheader(f"📊 {selected_tab} 기준 집계표")
         if grouped.empty:
             st.info("표시할 데이터가 없습니다.")
         else:
-            st.dataframe(grouped)
+            paged_grid(grouped, key="gender")
 
     
     elif selected_tab == '개인':
         st.subheader("개인별 통계")
 
+        # 전체 학생 누적 기록표 (페이지 단위로만 전송)
+        with st.expander("📋 전체 학생 기록표"):
+            paged_grid(cached_tabular_df(df), key="students", default_sort="학년-반-번호")
+
         required_cols = ['이름', '학년', '반', '번호', '팀명']
         missing_cols = [c for c in required_cols if c not in df.columns]
         if missing_cols:
@@ -269,15 +214,20 @@ if df is not None:
                         player_df.sort_values(by=date_col, inplace=True)
 
                     if date_col and not player_df.empty:
-                        fig = px.line(
-                            player_df, 
-                            x=date_col, 
-                            y=NUMERIC_COLS, 
-                            markers=True,
-                            title=f"{selected_name} - 날짜별 통계 추이"
-                        )
-                        fig.update_xaxes(dtick="D1", tickformat="%Y-%m-%d")
-                        fig.update_layout(font=dict(family="Malgun Gothic"))
-                        st.plotly_chart(fig, use_container_width=True)
+                        fig = create_player_line_chart(player_df, date_col, title=f"{selected_name} - 날짜별 통계 추이")
+                        show_chart(fig, "player_line")
                     else:
                         st.info("해당 플레이어에 대한 시계열 데이터를 표시할 수 없습니다.")
+
+# --- 계측 결과 기록 / 디버그 패널 ---
+perf_record = finish_run(perf, extra={"tab": selected_tab if df is not None else None, "rows": 0 if df is None else len(df)})
+if DEBUG:
+    with st.sidebar:
+        st.subheader("🛠 재실행 계측")
+        st.metric("총 소요(ms)", perf_record["total_ms"])
+        if perf_record["stages"]:
+            st.dataframe(perf_record["stages"], use_container_width=True)
+        else:
+            st.caption("계측된 구간이 없습니다.")
+        if perf_record["metrics"]:
+            st.json(perf_record["metrics"])
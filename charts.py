@@ -0,0 +1,128 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from preprocess import NUMERIC_COLS
+from profiling import debugging, note, timed
+
+# 점 개수(행 × 지표)가 이 값을 넘으면 SVG 대신 WebGL 트레이스 사용
+WEBGL_POINT_THRESHOLD = 1000
+# 기간이 이보다 길면 일별 점을 주 단위 평균으로 묶음
+WEEKLY_RANGE_DAYS = 120
+# 일 단위 눈금(dtick=D1)은 이 기간 이하일 때만
+DAILY_TICK_MAX_DAYS = 31
+
+
+@timed("chart.radar")
+def create_radar_chart(df, value_cols, title, name_col="학년", name_suffix="학년"):
+    fig = go.Figure()
+
+    for _, row in df.iterrows():
+        values = [row[col] for col in value_cols]
+        fig.add_trace(go.Scatterpolar(
+            r=values + [values[0]],  # 닫힌 도형을 위해 첫 값 반복
+            theta=NUMERIC_COLS + [NUMERIC_COLS[0]],
+            fill='toself',
+            name=f"{row[name_col]}{name_suffix}"
+        ))
+
+    fig.update_layout(
+        title=title,
+        polar=dict(
+            radialaxis=dict(visible=True),
+        ),
+        showlegend=True
+    )
+    return fig
+
+
+def make_melted_df(df, cols, value_name, id_col='학년-반', suffix=''):
+    melted = df.melt(
+        id_vars=[id_col],
+        value_vars=cols,
+        var_name='지표',
+        value_name=value_name
+    )
+    if suffix:
+        melted['지표'] = melted['지표'].str.replace(suffix, '')
+    return melted
+
+
+@timed("chart.group_bar")
+def create_group_bar_chart(melted_df, y, title, x='학년-반'):
+    fig = px.bar(
+        melted_df,
+        x=x,
+        y=y,
+        color='지표',
+        barmode='group',
+        title=title
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+def downsample_weekly(player_df, date_col, value_cols=NUMERIC_COLS):
+    """날짜별 행을 주(월요일 시작) 단위 평균으로 묶는다."""
+    weekly = (
+        player_df.set_index(date_col)[value_cols]
+        .resample("W-MON", label="left", closed="left")
+        .mean()
+        .dropna(how="all")
+        .reset_index()
+    )
+    return weekly
+
+
+@timed("chart.player_line")
+def create_player_line_chart(player_df, date_col, title):
+    """
+    기간이 길면 주 단위로 묶고, 점이 많으면 WebGL로 그려서
+    기록이 몇 시즌이 쌓여도 그래프 JSON 크기가 일정 수준을 넘지 않게 한다.
+    """
+    dates = pd.to_datetime(player_df[date_col])
+    span_days = (dates.max() - dates.min()).days if len(dates) else 0
+
+    if span_days > WEEKLY_RANGE_DAYS:
+        player_df = downsample_weekly(player_df, date_col)
+        title = f"{title} (주 평균)"
+
+    n_points = len(player_df) * len(NUMERIC_COLS)
+    use_webgl = n_points > WEBGL_POINT_THRESHOLD
+
+    fig = px.line(
+        player_df[[date_col] + NUMERIC_COLS],
+        x=date_col,
+        y=NUMERIC_COLS,
+        markers=not use_webgl,
+        render_mode="webgl" if use_webgl else "svg",
+        title=title
+    )
+    if span_days <= DAILY_TICK_MAX_DAYS:
+        fig.update_xaxes(dtick="D1", tickformat="%Y-%m-%d")
+    else:
+        fig.update_xaxes(tickformat="%Y-%m-%d")
+    fig.update_layout(font=dict(family="Malgun Gothic"))
+    return fig
+
+
+def slim_figure(fig):
+    """
+    전송에 필요 없는 메타데이터 제거.
+    - layout.template: st.plotly_chart는 Streamlit 테마로 덮어쓰므로 기본 템플릿(수 KB)은 불필요
+    - px가 넣는 hovertemplate 대신 x/y만 보이는 기본 hover 사용
+    """
+    fig.layout.template = go.layout.Template()
+    fig.update_traces(hovertemplate=None)
+    return fig
+
+
+def figure_nbytes(fig):
+    return len(fig.to_json().encode("utf-8"))
+
+
+def prepare_figure(fig, name):
+    """slim_figure 적용 후, 디버그 계측 중이면 JSON 크기를 계측 기록(metrics)에 남긴다."""
+    slim_figure(fig)
+    if debugging():  # to_json()은 그래프 전체를 한 번 더 직렬화하므로 평소에는 생략
+        note(f"figure_bytes.{name}", figure_nbytes(fig))
+    return fig
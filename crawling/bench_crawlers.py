@@ -0,0 +1,220 @@
+"""
+크롤러 처리량 벤치마크(오프라인): replay_server를 같은 프로세스에 띄우고
+각 크롤러 진입점을 그 서버로 돌려 경기/분과 구간별 p50/p95를 비교한다.
+
+fixtures는 먼저 프록시 녹화로 만들어 둔다.
+    python replay_server.py --fixtures fixtures --upstream https://meet.sports.or.kr
+    MEET_BASE_URL=http://127.0.0.1:8765 python sido_record_match_crawling.py   # 다른 터미널
+
+    python bench_crawlers.py --fixtures fixtures                                  # 전체 시나리오
+    python bench_crawlers.py --only record_recrawl --workers 4 --latency-ms 150 --faults stale=0.05
+    python bench_crawlers.py --out bench.json --label after                       # 결과 누적 저장
+    python bench_crawlers.py --baseline bench.json                                # 직전 결과와 비교
+    python bench_crawlers.py --adaptive --latency-ms 300 --faults error=0.05      # politeness 스케줄러 켜고 비교
+
+같은 fixtures/seed/지연/장애 설정이면 사이트 상태와 무관하게 같은 입력이 재현된다.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+import telemetry
+from replay_server import Faults, fetch_stats, serve
+
+SCENARIOS = ("record_schedule", "record_recrawl", "tournament", "player_validation")
+
+
+def _scheduler(args):
+    if not args.adaptive:
+        return None
+    from politeness import AdaptiveScheduler
+    return AdaptiveScheduler(max_concurrency=max(1, args.workers), log=False)
+
+
+def _http_client(args, base_url, scheduler=None):
+    if not args.http:
+        return None
+    from http_client import MeetHttpClient
+    return MeetHttpClient(base_url=base_url, scheduler=scheduler)
+
+
+def run_record_schedule(ctx, args):
+    from sido_record_match_crawling import build_schedule_csv
+    df = build_schedule_csv(
+        ctx["driver"], out_csv=None, workers=args.workers,
+        http_client=ctx["http"], pool=ctx["pool"],
+        limit_dates=args.limit_dates, limit_sports_each=args.limit_sports,
+    )
+    ctx["schedule"] = df
+    telemetry.set_total(len(df))
+    return len(df)
+
+
+def run_record_recrawl(ctx, args):
+    from sido_record_match_crawling import build_schedule_csv, recrawl_all_with_retry
+    schedule = ctx.get("schedule")
+    if schedule is None:
+        # 이번 실행에서 일정 시나리오를 건너뛰었으면 일정부터(계측 없이) 만든다
+        schedule = build_schedule_csv(
+            ctx["driver"], out_csv=None, workers=args.workers, http_client=ctx["http"], pool=ctx["pool"],
+            limit_dates=args.limit_dates, limit_sports_each=args.limit_sports,
+        )
+    if args.limit:
+        schedule = schedule.head(args.limit)
+    recrawl_all_with_retry(
+        ctx["driver"], schedule, out_csv=None, workers=args.workers,
+        http_client=ctx["http"], pool=ctx["pool"], scheduler=ctx["scheduler"],
+    )
+    return len(schedule)
+
+
+def run_tournament(ctx, args):
+    from sido_tournament_crawling import (
+        click_load_more_if_exists, open_and_select_sido_all_dates,
+        parse_all_tables, parse_bracket_for_all_matches,
+    )
+    driver = ctx["driver"]
+    open_and_select_sido_all_dates(driver)
+    click_load_more_if_exists(driver, max_clicks=40)
+    schedule = parse_all_tables(driver)
+    n = min(len(schedule), args.limit) if args.limit else len(schedule)
+    telemetry.set_total(n)
+    parse_bracket_for_all_matches(driver, start_seq=1, max_rows=args.limit or None, scheduler=ctx["scheduler"])
+    return n
+
+
+def run_player_validation(ctx, args):
+    from player_validation import attach_truth_flag_fast
+    players = pd.read_csv(args.players)
+    parts = players["글로벌 PK"].astype(str).str.split("_")
+    df = pd.DataFrame({
+        "경기부문": parts.str[0], "종별": parts.str[1], "성명": players["선수명"],
+    }).drop_duplicates().head(args.limit or 50).reset_index(drop=True)
+    attach_truth_flag_fast(df, log=False, http_client=ctx["http"])
+    return len(df)
+
+
+RUNNERS = {
+    "record_schedule": run_record_schedule,
+    "record_recrawl": run_record_recrawl,
+    "tournament": run_tournament,
+    "player_validation": run_player_validation,
+}
+
+
+def run(args):
+    faults = Faults.parse(args.faults, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, seed=args.seed)
+    server, base_url = serve(args.fixtures, port=0, faults=faults)
+    # 크롤러 모듈은 import 시점에 MEET_BASE_URL을 읽으므로 서버를 띄운 뒤에 import 한다
+    os.environ["MEET_BASE_URL"] = base_url
+    from driver_manager import setup_driver
+    from sido_record_match_crawling import new_driver_pool
+
+    tmp = tempfile.mkdtemp(prefix="bench_crawlers_")
+    driver = setup_driver(headless=True)
+    pool = new_driver_pool(size=args.workers) if args.workers > 1 else None
+    scheduler = _scheduler(args)
+    ctx = {
+        "driver": driver, "pool": pool, "http": _http_client(args, base_url, scheduler),
+        "scheduler": scheduler, "schedule": None,
+    }
+    results = []
+    try:
+        for name in args.only or SCENARIOS:
+            events = os.path.join(tmp, f"{name}.jsonl")
+            before = fetch_stats(base_url)
+            telemetry.start(events, label=name)
+            t0 = time.perf_counter()
+            error = None
+            try:
+                units = RUNNERS[name](ctx, args)
+            except Exception as e:  # 한 시나리오가 죽어도 나머지는 계속
+                units, error = 0, f"{type(e).__name__}: {e}"
+            wall = time.perf_counter() - t0
+            report = telemetry.finish() or {}
+            after = fetch_stats(base_url)
+            results.append({
+                "scenario": name,
+                "units": units,
+                "wall_s": round(wall, 2),
+                "per_min": round(units / wall * 60, 2) if wall else None,
+                "stages": report.get("stages", {}),
+                "failures": report.get("failures", {}),
+                "server": {k: after.get(k, 0) - before.get(k, 0) for k in after},
+                "error": error,
+            })
+    finally:
+        if scheduler is not None:
+            from politeness import print_report
+            print_report(scheduler.report())
+        if ctx["http"] is not None:
+            ctx["http"].close()
+        if pool is not None:
+            pool.close()
+        driver.quit()
+        server.shutdown()
+    return {
+        "label": args.label,
+        "ts": round(time.time()),
+        "config": {
+            "workers": args.workers, "http": args.http, "adaptive": args.adaptive, "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms, "faults": faults.rates, "seed": args.seed, "limit": args.limit,
+        },
+        "results": results,
+    }
+
+
+def print_results(run_, baseline=None):
+    base = {r["scenario"]: r for r in (baseline or {}).get("results", [])}
+    print(f"\n[BENCH] {run_['label'] or '-'} | {run_['config']}")
+    print(f"{'scenario':>18} {'units':>6} {'wall(s)':>8} {'/min':>8} {'vs base':>8} {'fail':>6}  server")
+    for r in run_["results"]:
+        b = base.get(r["scenario"])
+        delta = ""
+        if b and b.get("per_min") and r["per_min"]:
+            delta = f"{(r['per_min'] / b['per_min'] - 1):+.0%}"
+        fails = sum(r["failures"].values())
+        print(f"{r['scenario']:>18} {r['units']:>6} {r['wall_s']:>8.1f} {r['per_min'] or 0:>8.1f} {delta:>8} {fails:>6}  {r['server']}")
+        if r["error"]:
+            print(f"{'':>18} ! {r['error']}")
+
+
+def _load_runs(path):
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="replay_server 기반 크롤러 처리량 벤치마크")
+    parser.add_argument("--fixtures", default="fixtures")
+    parser.add_argument("--only", nargs="*", choices=SCENARIOS)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--no-http", dest="http", action="store_false", help="HTTP 우선 경로 끄기(브라우저만)")
+    parser.add_argument("--adaptive", action="store_true", help="politeness 스케줄러(관측 타임아웃/AIMD/차단기) 사용")
+    parser.add_argument("--limit", type=int, default=0, help="시나리오별 최대 경기/선수 수(0이면 전체)")
+    parser.add_argument("--limit-dates", type=int, default=None)
+    parser.add_argument("--limit-sports", type=int, default=None)
+    parser.add_argument("--players", default="jeonnam_bracket_tournament.csv", help="player_validation 입력")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--faults", default="", help="예: alert=0.02,stale=0.05,empty=0.02,error=0.01")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--out", help="결과를 누적 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 결과 JSON(마지막 실행과 비교)")
+    args = parser.parse_args()
+
+    result = run(args)
+    prev = _load_runs(args.baseline)
+    print_results(result, prev[-1] if prev else None)
+    if args.out:
+        runs = _load_runs(args.out) + [result]
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(runs, f, ensure_ascii=False, indent=1)
+        print(f"[BENCH] {args.out} 에 저장({len(runs)}회)")
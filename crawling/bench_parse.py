@@ -0,0 +1,98 @@
+"""
+사이드 패널 파싱 비용 마이크로벤치마크(브라우저 없음).
+
+저장해 둔 페이지(driver.page_source를 파일로 저장한 것, 사이드 패널이 열린 상태)로
+경기 한 건당 파싱 비용을 세 가지 방식으로 비교한다.
+
+    page      BeautifulSoup(page_source) 전체 파싱 후 사이드 파싱(기존 방식)
+    strainer  SoupStrainer로 사이드 컨테이너만 트리로 만든 뒤 파싱
+    fragment  사이드 컨테이너 outerHTML만 받아 파싱(현재 크롤러 방식)
+
+    python bench_parse.py --page saved_tournament_page.html --kind tournament
+    python bench_parse.py --cache html_cache_tournament --kind tournament   # 캐시 전체(=reparse 속도)
+
+--cache는 html_cache에 쌓인 조각(예전 캐시라면 페이지 전체)을 그대로 재파싱한다.
+"""
+import argparse
+import statistics
+import time
+
+from dom import SIDE_STRAINER, parse_fragment
+from html_cache import HtmlCache
+
+
+def _parse_tournament(soup):
+    from sido_tournament_crawling import parse_side_players
+    return parse_side_players(soup, 0, "")[1]
+
+
+def _parse_record(soup):
+    from sido_record_match_crawling import _parse_record_table, _pick_second_record_table
+    target = _pick_second_record_table(soup)
+    return (_parse_record_table(target, 0, {}) or []) if target is not None else []
+
+
+PARSERS = {"tournament": _parse_tournament, "record": _parse_record}
+CACHE_KINDS = {"tournament": "tournament_side", "record": "record_side"}
+
+
+def _bench(fn, repeat):
+    ms = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        ms.append((time.perf_counter() - t0) * 1000)
+    return ms
+
+
+def bench_page(path, kind, repeat=50):
+    with open(path, encoding="utf-8") as f:
+        page = f.read()
+    parse = PARSERS[kind]
+    # 브라우저가 돌려줄 outerHTML과 같은 조각(사이드 컨테이너만)
+    fragment = "".join(str(el) for el in parse_fragment(page, SIDE_STRAINER).find_all("div", recursive=False))
+
+    n_rows = len(parse(parse_fragment(page)))
+    cases = {
+        "page": lambda: parse(parse_fragment(page)),
+        "strainer": lambda: parse(parse_fragment(page, SIDE_STRAINER)),
+        "fragment": lambda: parse(parse_fragment(fragment)),
+    }
+    print(f"[PAGE] {path} | page {len(page) / 1024:.0f}KB → fragment {len(fragment) / 1024:.1f}KB | 행 {n_rows}")
+    print(f"{'mode':>9} {'p50(ms)':>9} {'p90(ms)':>9} {'match/s':>9}")
+    for name, fn in cases.items():
+        ms = sorted(_bench(fn, repeat))
+        p50 = statistics.median(ms)
+        p90 = ms[int(len(ms) * 0.9) - 1] if len(ms) >= 10 else ms[-1]
+        print(f"{name:>9} {p50:>9.2f} {p90:>9.2f} {1000 / p50 if p50 else 0:>9.0f}")
+
+
+def bench_cache(root, kind):
+    cache = HtmlCache(root)
+    parse = PARSERS[kind]
+    items = [html for _, html in cache.iter_html(CACHE_KINDS[kind])]
+    if not items:
+        print(f"[CACHE] {root} 에 {CACHE_KINDS[kind]} 항목 없음")
+        return
+    t0 = time.perf_counter()
+    n_rows = sum(len(parse(parse_fragment(html, SIDE_STRAINER))) for html in items)
+    dt = time.perf_counter() - t0
+    size = sum(len(h) for h in items) / len(items) / 1024
+    print(f"[CACHE] {len(items)}건 (평균 {size:.1f}KB) → 행 {n_rows} | {dt:.2f}s | "
+          f"{dt / len(items) * 1000:.2f}ms/건 | {len(items) / dt if dt else 0:.0f}건/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사이드 패널 파싱 마이크로벤치마크")
+    parser.add_argument("--kind", choices=sorted(PARSERS), default="tournament")
+    parser.add_argument("--page", help="사이드 패널이 열린 상태로 저장한 page_source 파일")
+    parser.add_argument("--cache", help="html_cache 폴더")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    if not (args.page or args.cache):
+        parser.error("--page 또는 --cache 중 하나는 필요합니다")
+    if args.page:
+        bench_page(args.page, args.kind, args.repeat)
+    if args.cache:
+        bench_cache(args.cache, args.kind)
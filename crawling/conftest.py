@@ -0,0 +1,28 @@
+"""테스트 공용: 녹화 응답(replay_server)을 돌려주는 MeetHttpClient"""
+import pytest
+
+from http_client import MeetHttpClient
+from replay_server import FixtureStore, serve
+
+
+@pytest.fixture
+def replay(tmp_path):
+    """
+    replay({fixture_key: html, ...}) → 그 응답만 돌려주는 로컬 서버에 붙은 MeetHttpClient.
+    없는 요청은 404(HttpFetchError). 테스트가 끝나면 서버/세션을 닫는다.
+    """
+    opened = []
+
+    def start(pages, faults=None, **client_kw):
+        store = FixtureStore(str(tmp_path / f"fixtures{len(opened)}"))
+        for key, html in pages.items():
+            store.save(key, html)
+        server, base_url = serve(store.root, port=0, faults=faults)
+        client = MeetHttpClient(base_url=base_url, retries=0, **client_kw)
+        opened.append((server, client))
+        return client
+
+    yield start
+    for server, client in opened:
+        client.close()
+        server.shutdown()
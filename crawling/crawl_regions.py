@@ -0,0 +1,291 @@
+"""
+여러 시·도 동시 수집 + 시도별(파티션) 산출물 + 전체 통합(글로벌 PK 중복 제거).
+
+시도 하나는 프로세스 하나에서 기존 흐름 그대로 돈다(기록경기: 일정 → 재수집, 토너먼트: 일정 → 사이드바).
+시도마다 브라우저/HTTP 세션/저널/HTML 캐시/계측 파일이 따로라서 서로 간섭하지 않고,
+로그는 <out>/<시도>_crawl.log 로 빠지며 콘솔에는 시도별 완료 요약만 나온다.
+
+    python crawl_regions.py --regions all --concurrency 4 --workers 2 --site-concurrency 4
+    python crawl_regions.py --regions 전남,경북 --only tournament
+    python crawl_regions.py --regions all --combine-only           # 이미 받은 파티션만 다시 합치기
+
+산출물(<out>, 기본 regions/):
+    <시도>_schedule_matches.csv / <시도>_bracket_matches.csv          (기록경기)
+    <시도>_schedule_tournament.csv / <시도>_bracket_tournament.csv    (토너먼트)
+    <시도>_crawling_db_data.csv                                       (generate_sido_db.build_db)
+    all_<데이터셋>.csv                                                (통합본)
+
+한 경기는 참가한 시도마다(토너먼트는 양쪽 시도, 기록경기는 출전 시도 전부) 목록에 나오므로
+통합본은 글로벌 PK마다 그 경기의 결과 행을 가진 첫 시도(--regions 순서) 것만 남긴다
+(앞 시도에서 그 경기 수집이 실패했으면 다음 시도 것, 어느 시도에도 결과가 없으면 일정에 처음 나온 시도).
+한 시도 안에서 같은 글로벌 PK가 여러 행인 경우(여러 날에 걸친 경기가 일자별로 두 번 나옴)는 그대로 두고,
+로컬 PK는 통합본 기준으로 다시 매겨 일정/결과가 서로 맞도록 바꾼다. "수집 시도" 컬럼에 출처를 남긴다.
+"""
+import argparse
+import contextlib
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+import regions
+from politeness import AdaptiveScheduler, print_report as print_polite_report
+from regions import region_path
+from writers import ResultWriter, iter_batches
+
+KINDS = ("matches", "tournament")
+SOURCE_COL = "수집 시도"
+
+
+def _crawl_matches(sido, out_dir, workers, parse_procs, http, sched):
+    from driver_manager import LazyDriver
+    from sido_record_match_crawling import build_schedule_csv, new_driver_pool, open_sido_only, recrawl_all_with_retry
+    import telemetry
+
+    cache_dir = os.path.join(out_dir, f"html_cache_record_{sido.slug}")
+    # workers>1이면 풀 브라우저로 수집하고, 이 브라우저는 목록 HTTP 폴백(또는 순차 수집)에 필요할 때만 띄움
+    driver = LazyDriver(headless=True, on_start=lambda drv: open_sido_only(drv, sido))
+    pool = new_driver_pool(size=workers, sido=sido) if workers > 1 else None
+    telemetry.start(os.path.join(out_dir, f"crawl_events_record_{sido.slug}.jsonl"), label=f"record/{sido.name}")
+    try:
+        schedule_df = build_schedule_csv(
+            driver, out_csv=region_path(sido, "schedule_matches", out_dir),
+            search_result_timeout=60, max_load_more_clicks=40, load_more_timeout=4,
+            workers=workers, http_client=http, html_cache=cache_dir, pool=pool, sido=sido,
+        )
+        n = recrawl_all_with_retry(
+            driver, schedule=schedule_df, out_csv=region_path(sido, "bracket_matches", out_dir),
+            attempts_each=3, side_open_timeout=20, record_table_timeout=45, panel_settle_pause=0.15,
+            workers=workers, http_client=http, html_cache=cache_dir, pool=pool, parse_procs=parse_procs,
+            journal=region_path(sido, "bracket_matches", out_dir, ext=".journal.sqlite"),
+            sido=sido, scheduler=sched,
+        )
+        return {"schedule_matches": len(schedule_df), "bracket_matches": n}
+    finally:
+        telemetry.finish()
+        if pool is not None:
+            pool.close()
+        driver.quit()
+
+
+def _crawl_tournament(sido, out_dir, parse_procs, http, sched):
+    from driver_manager import setup_driver
+    from html_cache import HtmlCache
+    from sido_tournament_crawling import (
+        SCHEDULE_COLS, click_load_more_if_exists, open_and_select_sido_all_dates,
+        parse_all_tables, parse_bracket_for_all_matches,
+    )
+    import telemetry
+
+    cache_dir = os.path.join(out_dir, f"html_cache_tournament_{sido.slug}")
+    driver = setup_driver(headless=True)
+    telemetry.start(os.path.join(out_dir, f"crawl_events_tournament_{sido.slug}.jsonl"), label=f"tournament/{sido.name}")
+    try:
+        open_and_select_sido_all_dates(driver, sido)
+        click_load_more_if_exists(driver, max_clicks=40)
+        rows = parse_all_tables(driver, html_cache=HtmlCache(cache_dir))
+        with ResultWriter(region_path(sido, "schedule_tournament", out_dir), SCHEDULE_COLS) as w:
+            w.write(rows)
+        n = parse_bracket_for_all_matches(
+            driver, start_seq=1,
+            journal=region_path(sido, "bracket_tournament", out_dir, ext=".journal.sqlite"),
+            html_cache=cache_dir, parse_procs=parse_procs, scheduler=sched, http_client=http,
+            out_csv=region_path(sido, "bracket_tournament", out_dir),
+        )  # 저널 + out_csv → 로컬 PK 순서로 흘려 쓰고 행 수 반환
+        return {"schedule_tournament": len(rows), "bracket_tournament": n}
+    finally:
+        telemetry.finish()
+        driver.quit()
+
+
+def crawl_region(sido, out_dir="regions", kinds=KINDS, workers=2, parse_procs=1, use_http=True, build=True,
+                 adaptive=True, site_slots=None):
+    """
+    시도 하나 수집(프로세스 풀 워커에서 실행). 로그는 <out_dir>/<시도>_crawl.log.
+    site_slots: 시도 프로세스들이 함께 쓰는 세마포어(Manager 프록시) → 사이트 전체 동시 요청 상한
+    반환: {"sido", "counts": {데이터셋: 행 수}, "elapsed_s", "error"}
+    """
+    sido = regions.get(sido)
+    os.makedirs(out_dir, exist_ok=True)
+    t0 = time.perf_counter()
+    counts, error = {}, ""
+    log_path = region_path(sido, "crawl", out_dir, ext=".log")
+    with open(log_path, "a", encoding="utf-8") as log_f, \
+            contextlib.redirect_stdout(log_f), contextlib.redirect_stderr(log_f):
+        logging.basicConfig(
+            level=logging.INFO, stream=log_f, force=True,
+            format="%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S",
+        )
+        print(f"===== {sido.name}({sido.code}) 수집 시작: {time.strftime('%Y-%m-%d %H:%M:%S')} =====", flush=True)
+        http = None
+        # 동시 수(AIMD)/타임아웃/차단기는 시도 프로세스마다 따로, 사이트 전체 동시 요청은 site_slots로 합계 상한
+        sched = AdaptiveScheduler(max_concurrency=workers, shared=site_slots) if adaptive else None
+        try:
+            if use_http:
+                from http_client import MeetHttpClient
+                http = MeetHttpClient(record_dir=os.environ.get("MEET_RECORD") or None, scheduler=sched)
+            if "matches" in kinds:
+                counts.update(_crawl_matches(sido, out_dir, workers, parse_procs, http, sched))
+            if "tournament" in kinds:
+                counts.update(_crawl_tournament(sido, out_dir, parse_procs, http, sched))
+            if build and all(os.path.exists(region_path(sido, d, out_dir)) for d in regions.DATASETS):
+                from generate_sido_db import build_db
+                db = build_db(
+                    sido, in_dir=out_dir, out_csv=region_path(sido, "crawling_db_data", out_dir), out_xlsx=None,
+                )
+                counts["crawling_db_data"] = len(db)
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)[:200]}"
+            logging.exception(f"[REGION] {sido.name} 수집 중단")
+        finally:
+            if sched is not None:
+                print_polite_report(sched.report())
+            if http is not None:
+                http.close()
+    return {"sido": sido, "counts": counts, "elapsed_s": round(time.perf_counter() - t0, 1), "error": error}
+
+
+def crawl_regions(sidos, out_dir="regions", concurrency=4, site_concurrency=4, **kw):
+    """
+    시도 목록을 concurrency개 프로세스로 동시에 수집(시도당 브라우저 workers개 → 합계 concurrency×workers개).
+    adaptive(기본)이면 모든 시도 프로세스의 사이트 요청(사이드 패널/HTTP)을 합쳐 동시에 site_concurrency개까지만 보낸다.
+    끝나는 순서대로 요약을 출력하고 입력 순서대로 결과 목록 반환.
+    """
+    sidos = [regions.get(s) for s in sidos]
+    os.makedirs(out_dir, exist_ok=True)
+    concurrency = max(1, min(concurrency, len(sidos)))
+    adaptive = kw.get("adaptive", True)
+    print(f"[REGIONS] {len(sidos)}개 시도 | 동시 {concurrency} | "
+          f"사이트 동시 요청 {site_concurrency if adaptive else '제한 없음'} | 로그 {out_dir}/<시도>_crawl.log", flush=True)
+    t0 = time.perf_counter()
+    results = {}
+    # 시도 프로세스 안에서 다시 브라우저 스레드/파싱 프로세스를 띄우므로 spawn
+    ctx = multiprocessing.get_context("spawn")
+    with contextlib.ExitStack() as stack:
+        site_slots = None
+        if adaptive:
+            # Manager 세마포어 프록시는 pickle되므로 submit 인자로 각 시도 프로세스에 넘길 수 있다
+            site_slots = stack.enter_context(ctx.Manager()).Semaphore(max(1, site_concurrency))
+        ex = stack.enter_context(ProcessPoolExecutor(max_workers=concurrency, mp_context=ctx))
+        futures = {ex.submit(crawl_region, s, out_dir, site_slots=site_slots, **kw): s for s in sidos}
+        for fut in as_completed(futures):
+            s = futures[fut]
+            try:
+                r = fut.result()
+            except Exception as e:  # 프로세스 자체가 죽은 경우
+                r = {"sido": s, "counts": {}, "elapsed_s": None, "error": f"{type(e).__name__}: {e}"}
+            results[s] = r
+            counts = " ".join(f"{k}={v}" for k, v in r["counts"].items())
+            status = f"FAIL ({r['error']})" if r["error"] else "OK"
+            print(f"[REGIONS] {len(results)}/{len(sidos)} {s.name} {status} | {counts} | {r['elapsed_s']}s", flush=True)
+    print(f"[REGIONS] 완료 {time.perf_counter() - t0:.1f}s | 실패 {sum(1 for r in results.values() if r['error'])}", flush=True)
+    return [results[s] for s in sidos]
+
+
+# ================= 통합(글로벌 PK 중복 제거) =================
+def _combine_kind(out_dir, sidos, schedule_ds, results_ds, batch_rows=50000):
+    """
+    시도별 일정/결과 파티션 → all_<데이터셋>.csv. 글로벌 PK마다 주인 시도(결과 행이 있는 첫 시도,
+    없으면 일정에 처음 나온 시도)의 행만 남기고 로컬 PK를 (시도, 기존 로컬 PK) → 통합 순번으로 바꾼다.
+    반환: {데이터셋: (입력 행, 출력 행)}
+    """
+    owner = {}   # 글로벌 PK → 시도 슬러그
+    # 결과 파일의 글로벌 PK 컬럼만 먼저 훑어 결과가 있는 첫 시도를 주인으로
+    # (일정에는 나오지만 그 시도에서 사이드바 수집이 실패한 경기를 빈 채로 남기지 않도록)
+    for s in sidos:
+        path = region_path(s, results_ds, out_dir)
+        if not os.path.exists(path):
+            continue
+        for chunk in iter_batches(path, columns=["글로벌 PK"], batch_rows=batch_rows):
+            for g in chunk["글로벌 PK"].dropna().unique():
+                owner.setdefault(g, s.slug)
+    remap = {}   # (시도 슬러그, 기존 로컬 PK) → 통합 로컬 PK
+    frames, n_in = [], 0
+    for s in sidos:
+        path = region_path(s, schedule_ds, out_dir)
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path, dtype=str, encoding="utf-8-sig")
+        n_in += len(df)
+        for g in df["글로벌 PK"].dropna().unique():
+            owner.setdefault(g, s.slug)
+        df = df[df["글로벌 PK"].map(owner).eq(s.slug) | df["글로벌 PK"].isna()].copy()
+        start = len(remap) + 1
+        new_pk = range(start, start + len(df))
+        remap.update({(s.slug, old): str(new) for old, new in zip(df["로컬 PK"], new_pk)})
+        df["로컬 PK"] = list(new_pk)
+        df[SOURCE_COL] = s.name
+        frames.append(df)
+    if not frames:
+        return {}
+    sched = pd.concat(frames, ignore_index=True)
+    cols = list(sched.columns)
+    with ResultWriter(os.path.join(out_dir, f"all_{schedule_ds}.csv"), cols) as w:
+        w.write(sched)
+    stats = {schedule_ds: (n_in, len(sched))}
+
+    # 결과는 시도별 파일을 묶음 단위로 흘려 읽어(파일이 커도 메모리 일정) 주인 시도의 행만 옮겨 쓴다
+    writer, n_in, n_out = None, 0, 0
+    try:
+        for s in sidos:
+            path = region_path(s, results_ds, out_dir)
+            if not os.path.exists(path):
+                continue
+            for chunk in iter_batches(path, batch_rows=batch_rows):
+                n_in += len(chunk)
+                chunk = chunk[chunk["글로벌 PK"].map(owner).eq(s.slug) | chunk["글로벌 PK"].isna()].copy()
+                pk = chunk["로컬 PK"].str.replace(r"\.0$", "", regex=True)
+                chunk["로컬 PK"] = [remap.get((s.slug, p)) for p in pk]
+                chunk[SOURCE_COL] = s.name
+                if writer is None:
+                    writer = ResultWriter(os.path.join(out_dir, f"all_{results_ds}.csv"), list(chunk.columns))
+                writer.write(chunk)
+                n_out += len(chunk)
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    if writer is not None:
+        writer.close()
+        stats[results_ds] = (n_in, n_out)
+    return stats
+
+
+def combine(out_dir="regions", sidos=None):
+    """받아 둔 시도별 파티션을 all_*.csv 로 통합(결과가 있는 시도 중 --regions 순서가 중복 경기의 우선순위)"""
+    sidos = [regions.get(s) for s in (sidos or regions.SIDOS)]
+    stats = {}
+    stats.update(_combine_kind(out_dir, sidos, "schedule_matches", "bracket_matches"))
+    stats.update(_combine_kind(out_dir, sidos, "schedule_tournament", "bracket_tournament"))
+    for ds, (n_in, n_out) in stats.items():
+        print(f"[COMBINE] all_{ds}.csv | 시도별 합계 {n_in}행 → 중복 제거 {n_out}행", flush=True)
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="여러 시·도 동시 수집 + 시도별 파티션 + 통합")
+    parser.add_argument("--regions", default="all", help='"all" 또는 "전남,경북,14,jeju" (통합 시 앞 시도 우선)')
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 수집할 시도 수(프로세스 수)")
+    parser.add_argument("--workers", type=int, default=2, help="시도당 병렬 브라우저 수(기록경기)")
+    parser.add_argument("--site-concurrency", type=int, default=4,
+                        help="모든 시도를 합친 사이트 동시 요청 상한(--no-adaptive면 적용 안 됨)")
+    parser.add_argument("--parse-procs", type=int, default=1, help="시도당 파싱 프로세스 수")
+    parser.add_argument("--out", default="regions", help="산출물 폴더")
+    parser.add_argument("--only", choices=KINDS, help="기록경기/토너먼트 중 하나만")
+    parser.add_argument("--no-http", dest="http", action="store_false", help="HTTP 우선 경로 끄기(브라우저만)")
+    parser.add_argument("--no-db", dest="build", action="store_false", help="시도별 DB 표(build_db) 생략")
+    parser.add_argument("--no-adaptive", dest="adaptive", action="store_false", help="고정 타임아웃/동시 수(politeness 끄기)")
+    parser.add_argument("--combine-only", action="store_true", help="수집 없이 통합만")
+    args = parser.parse_args()
+
+    targets = regions.parse_list(args.regions)
+    if not args.combine_only:
+        crawl_regions(
+            targets, out_dir=args.out, concurrency=args.concurrency, site_concurrency=args.site_concurrency,
+            kinds=(args.only,) if args.only else KINDS, workers=args.workers,
+            parse_procs=args.parse_procs, use_http=args.http, build=args.build, adaptive=args.adaptive,
+        )
+    combine(args.out, targets)
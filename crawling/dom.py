@@ -0,0 +1,100 @@
+"""
+필요한 컨테이너만 잘라 읽는 DOM 헬퍼.
+
+driver.page_source는 일정 표 수백 행이 든 페이지 전체를 매번 직렬화/전송하고
+BeautifulSoup가 통째로 다시 파싱한다. 여기서는 브라우저 안에서 필요한 요소의
+outerHTML만 모아 넘기고, 페이지 전체를 받은 경우(HTTP 응답/예전 캐시)에는
+SoupStrainer로 관심 태그만 트리로 만든다.
+일정 행 메타데이터(라벨 값/종목/onclick)는 schedule_rows()가 JSON 한 번으로 돌려준다.
+"""
+from bs4 import BeautifulSoup, SoupStrainer
+
+# 일정 표 + 종목 라벨(h5)만
+SCHEDULE_STRAINER = SoupStrainer(["h5", "table"])
+# 사이드 패널(기록경기 / 토너먼트 참가선수)만
+SIDE_STRAINER = SoupStrainer(
+    "div", class_=lambda c: bool(c) and bool({"record", "record-match-area", "participating-players"} & set(c.split()))
+)
+
+# 앞에서 고른 요소 안에 들어 있는 요소는 중복으로 넣지 않는다
+_OUTER_HTML_JS = """
+const picked = [];
+for (const sel of arguments[0]) {
+    const el = document.querySelector(sel);
+    if (el && !picked.some(p => p.contains(el))) picked.push(el);
+}
+return picked.map(el => el.outerHTML).join('');
+"""
+
+# 캡션이 맞는 일정 표 목록 + 표마다 파서가 find_previous로 찾던 종목 라벨 h5(sportOf)
+_CAPTION_TABLES_JS = """
+const caption = arguments[0], allowUncaptioned = arguments[1];
+const h5s = Array.from(document.querySelectorAll('h5'));
+function before(el, test) {
+    let best = null;
+    for (const h of h5s) {
+        if (!(h.compareDocumentPosition(el) & Node.DOCUMENT_POSITION_FOLLOWING)) break;
+        if (test(h)) best = h;
+    }
+    return best;
+}
+const sportOf = t => before(t, h => h.id === 'classNm')
+    || before(t, h => h.classList.contains('subTit'))
+    || before(t, h => true);
+const tables = Array.from(document.querySelectorAll('table.tablesaw.tablesaw-stack')).filter(t => {
+    const cap = t.querySelector('caption');
+    return cap ? cap.textContent.includes(caption) : allowUncaptioned;
+});
+"""
+
+# 일정 표마다 종목 라벨 h5를 바로 앞에 붙여 반환
+_SCHEDULE_TABLES_JS = _CAPTION_TABLES_JS + """
+return tables.map(t => { const h5 = sportOf(t); return (h5 ? h5.outerHTML : '') + t.outerHTML; }).join('');
+"""
+
+# 일정 행 전부를 한 번에: 행 요소, 종목 라벨, 라벨→값(b.tablesaw-cell-label → span.tablesaw-cell-content),
+# 칸 값 목록, openSide 호출. 값은 textContent(숨김 포함) 그대로, 정규화는 파이썬 쪽에서
+_SCHEDULE_ROWS_JS = _CAPTION_TABLES_JS + """
+const out = [];
+for (const t of tables) {
+    const h5 = sportOf(t);
+    const sport = h5 ? h5.textContent : '';
+    for (const tr of t.querySelectorAll('tbody > tr')) {
+        const labels = {}, cells = [];
+        for (const td of tr.querySelectorAll(':scope > td')) {
+            const span = td.querySelector('span.tablesaw-cell-content');
+            let txt = span ? span.textContent : '';
+            if (!txt.trim()) txt = td.textContent;
+            cells.push(txt);
+            const b = td.querySelector('b.tablesaw-cell-label');
+            if (b && b.textContent.trim()) labels[b.textContent] = txt;
+        }
+        const td = tr.querySelector("td[onclick*='openSide']") || tr.querySelector('td');
+        out.push({el: tr, sport: sport, labels: labels, cells: cells, call: td ? (td.getAttribute('onclick') || '') : ''});
+    }
+}
+return out;
+"""
+
+
+def parse_fragment(html, strainer=None):
+    return BeautifulSoup(html or "", "lxml", parse_only=strainer)
+
+
+def outer_html(driver, *selectors):
+    """selectors 각각의 첫 요소 outerHTML을 이어 붙여 반환(없으면 빈 문자열)"""
+    return driver.execute_script(_OUTER_HTML_JS, list(selectors)) or ""
+
+
+def schedule_tables_html(driver, caption, allow_uncaptioned=False):
+    """캡션에 caption이 들어간 일정 표들(+종목 라벨 h5)의 outerHTML"""
+    return driver.execute_script(_SCHEDULE_TABLES_JS, caption, allow_uncaptioned) or ""
+
+
+def schedule_rows(driver, caption, allow_uncaptioned=False):
+    """
+    일정 표의 모든 행을 execute_script 1회로 읽는다(행마다 td/라벨/span/h5를 따로 찾지 않음).
+    [{"el": <tr WebElement>, "sport": 종목 라벨, "labels": {라벨: 값}, "cells": [칸 값], "call": onclick}, ...]
+    """
+    return driver.execute_script(_SCHEDULE_ROWS_JS, caption, allow_uncaptioned) or []
+
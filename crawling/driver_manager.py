@@ -0,0 +1,330 @@
+"""
+크롬 드라이버 공용 관리.
+
+- 드라이버 실행 파일 경로는 한 번 찾은 뒤 캐시 파일에 적어 두고 이후에는 네트워크 확인 없이 재사용
+  (CHROMEDRIVER_PATH 지정 시 그 경로 우선, 세션 생성 실패 시에만 다시 찾는다)
+- pageLoadStrategy=eager: DOMContentLoaded에서 바로 반환(이후 대기는 waits.py가 담당)
+- CDP Network.setBlockedURLs로 이미지/폰트/미디어 요청 차단.
+  CSS는 가시성 판정(visibility_of/invisibility_of)에 영향을 주므로 block에 "stylesheet"를 넣을 때만 차단
+- ManagedChrome: 연 페이지 수(count_page)/JS 힙 사용량이 기준을 넘으면 드라이버를 새로 띄워 교체
+- DriverPool: 워커들이 드라이버를 빌려 쓰고 돌려주는 풀(단계가 바뀌어도 브라우저를 다시 띄우지 않음)
+- LazyDriver: 처음 쓰일 때 띄우는 드라이버(HTTP 경로가 성공하면 끝까지 띄우지 않음)
+"""
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+DRIVER_CACHE = os.environ.get(
+    "CHROMEDRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "jw-crawler", "chromedriver.json"),
+)
+
+BLOCK_PATTERNS = {
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp"],
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.mp3", "*.m4a", "*.ogg"],
+    "stylesheet": ["*.css"],
+}
+DEFAULT_BLOCK = ("image", "font", "media")
+
+_path_lock = threading.Lock()
+
+
+def driver_path(refresh=False):
+    """chromedriver 경로. 캐시가 있으면 그대로, 없거나 refresh면 webdriver_manager로 한 번 내려받아 기록"""
+    env = os.environ.get("CHROMEDRIVER_PATH")
+    if env:
+        return env
+    with _path_lock:
+        if not refresh and os.path.exists(DRIVER_CACHE):
+            try:
+                with open(DRIVER_CACHE, encoding="utf-8") as f:
+                    path = json.load(f).get("path")
+                if path and os.path.exists(path):
+                    return path
+            except (OSError, ValueError):
+                pass
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(DRIVER_CACHE), exist_ok=True)
+        with open(DRIVER_CACHE, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "ts": round(time.time())}, f)
+        return path
+
+
+def chrome_options(headless=True, page_load_strategy="eager"):
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--window-size=1400,2400")
+    options.set_capability("unhandledPromptBehavior", "accept")
+    options.page_load_strategy = page_load_strategy
+    return options
+
+
+def block_resources(driver, kinds=DEFAULT_BLOCK):
+    urls = [p for k in kinds or () for p in BLOCK_PATTERNS.get(k, [])]
+    if not urls:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    except WebDriverException:
+        pass  # CDP 미지원 드라이버면 차단 없이 진행
+
+
+def setup_driver(headless=True, block=DEFAULT_BLOCK, page_load_strategy="eager"):
+    options = chrome_options(headless, page_load_strategy)
+    try:
+        driver = webdriver.Chrome(service=Service(driver_path()), options=options)
+    except SessionNotCreatedException:
+        # 크롬이 업데이트되어 캐시한 드라이버 버전이 안 맞는 경우 → 한 번만 다시 받기
+        driver = webdriver.Chrome(service=Service(driver_path(refresh=True)), options=chrome_options(headless, page_load_strategy))
+    block_resources(driver, block)
+    return driver
+
+
+def count_page(driver, n=1):
+    """검색/사이드 패널 열기처럼 페이지를 하나 쓸 때마다 호출. ManagedChrome이 띄운 드라이버가 아니면 무시"""
+    managed = getattr(driver, "_managed_chrome", None)
+    if managed is not None:
+        managed.tick(n)
+
+
+class ManagedChrome:
+    """드라이버 하나 + 처리 건수/메모리 기준 재시작. on_start(driver)는 새로 띄울 때마다 호출"""
+
+    def __init__(self, headless=True, block=DEFAULT_BLOCK, max_pages=300, max_heap_mb=800, on_start=None):
+        self.headless = headless
+        self.block = block
+        self.max_pages = max_pages      # 검색/사이드 패널 열기 기준(count_page로 센 수)
+        self.max_heap_mb = max_heap_mb
+        self.on_start = on_start
+        self.driver = None
+        self.pages = 0
+        self.restarts = 0
+        self.broken = False  # 세션이 죽은 것으로 보이면 다음 대여 전에 재시작
+        self._start()
+
+    def _start(self):
+        self.driver = setup_driver(headless=self.headless, block=self.block)
+        self.driver._managed_chrome = self  # count_page(driver)가 이 객체를 찾도록
+        self.pages = 0
+        self.broken = False
+        if self.on_start:
+            try:
+                self.on_start(self.driver)
+            except Exception:
+                self.quit()
+                raise
+
+    def tick(self, n=1):
+        """페이지 하나(검색 결과/사이드 패널 열기 등)를 쓸 때마다 호출. 드라이버만 가진 쪽은 count_page(driver)"""
+        self.pages += n
+
+    def heap_mb(self):
+        try:
+            used = self.driver.execute_script(
+                "return (performance.memory && performance.memory.usedJSHeapSize) || 0;"
+            )
+            return (used or 0) / (1024 * 1024)
+        except WebDriverException:
+            return 0.0
+
+    def should_recycle(self):
+        if self.broken:
+            return True
+        if self.max_pages and self.pages >= self.max_pages:
+            return True
+        return bool(self.max_heap_mb) and self.heap_mb() >= self.max_heap_mb
+
+    def recycle(self):
+        reason = "세션 오류" if self.broken else f"pages={self.pages}"
+        self.quit()
+        self.restarts += 1
+        print(f"[DRIVER] 재시작 #{self.restarts} ({reason})", flush=True)
+        self._start()
+
+    def check(self):
+        """세션이 응답하는지 확인. 죽었으면 broken으로 표시해 다음 maybe_recycle에서 재시작"""
+        if self.driver is None:
+            self.broken = True
+            return False
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except WebDriverException:
+            self.broken = True
+            return False
+
+    def maybe_recycle(self):
+        if self.should_recycle():
+            self.recycle()
+            return True
+        return False
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+
+
+class DriverPool:
+    """
+    최대 size개의 ManagedChrome을 필요할 때 띄워 빌려준다.
+
+        with pool.checkout() as driver:
+            ...
+    빌려 간 쪽이 검색/사이드 패널을 열 때마다 count_page(driver)로 센 수가 max_pages를 넘거나
+    JS 힙이 max_heap_mb를 넘은 드라이버는 다음 대여 전에 재시작한다(한 번 빌려 묶음 하나를 통째로 처리하므로
+    대여 횟수가 아니라 연 페이지 수로 센다).
+    """
+
+    def __init__(self, size=4, headless=True, block=DEFAULT_BLOCK, max_pages=300, max_heap_mb=800, on_start=None):
+        self.size = size
+        self._kw = dict(headless=headless, block=block, max_pages=max_pages, max_heap_mb=max_heap_mb, on_start=on_start)
+        self._idle = queue.Queue()
+        self._all = []
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new(self):
+        """자리만 잠금 안에서 잡고, 브라우저 기동은 잠금 밖에서(여러 개 동시에 뜨도록)"""
+        with self._lock:
+            if self._created >= self.size:
+                return None
+            self._created += 1
+        try:
+            m = ManagedChrome(**self._kw)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        with self._lock:
+            self._all.append(m)
+        return m
+
+    def warm(self, n=None):
+        """n개(기본 size)까지 미리 병렬로 띄워 둔다"""
+        n = min(self.size, n or self.size) - self._created
+        def start():
+            m = self._new()
+            if m is not None:
+                self._idle.put(m)
+
+        threads = [threading.Thread(target=start) for _ in range(max(0, n))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return self
+
+    def _discard(self, m):
+        """재시작에 실패한 드라이버는 풀에서 빼고 자리를 비운다(다음 대여 때 새로 띄움)"""
+        m.quit()
+        with self._lock:
+            if m in self._all:
+                self._all.remove(m)
+                self._created -= 1
+
+    def _acquire(self):
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            m = self._new()
+            if m is not None:
+                return m
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue  # 그사이 버려진 드라이버 자리가 생겼을 수 있음
+
+    @contextmanager
+    def checkout(self):
+        m = self._acquire()
+        try:
+            m.maybe_recycle()
+        except Exception:
+            self._discard(m)
+            raise
+        try:
+            yield m.driver
+        except WebDriverException:
+            m.broken = True
+            raise
+        finally:
+            self._idle.put(m)
+
+    def close(self):
+        with self._lock:
+            for m in self._all:
+                m.quit()
+            self._all.clear()
+        self._idle = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LazyDriver:
+    """
+    처음 쓰일 때 브라우저를 띄우는 드라이버 대리 객체. on_start(driver)는 띄운 직후 한 번(예: 시도 선택).
+    속성/메서드는 실제 WebDriver로 넘기므로 driver 자리에 그대로 넘기면 되고, 띄운 적 없으면 quit()은 아무것도 안 한다.
+
+        driver = LazyDriver(on_start=lambda drv: open_sido_only(drv, sido))
+        ...                      # HTTP 경로만 쓰면 브라우저는 뜨지 않음
+        driver.quit()
+    """
+
+    def __init__(self, headless=True, block=DEFAULT_BLOCK, on_start=None):
+        self._driver = None
+        self._kw = dict(headless=headless, block=block)
+        self._on_start = on_start
+        self._lock = threading.Lock()
+
+    @property
+    def started(self):
+        return self._driver is not None
+
+    def start(self):
+        """실제 WebDriver 반환(없으면 지금 띄움)"""
+        with self._lock:
+            if self._driver is None:
+                driver = setup_driver(**self._kw)
+                if self._on_start:
+                    try:
+                        self._on_start(driver)
+                    except Exception:
+                        driver.quit()
+                        raise
+                self._driver = driver
+            return self._driver
+
+    def __getattr__(self, name):
+        if name.startswith("__"):  # copy/pickle 등의 탐색으로 브라우저가 뜨지 않도록
+            raise AttributeError(name)
+        return getattr(self.start(), name)
+
+    def quit(self):
+        with self._lock:
+            if self._driver is not None:
+                self._driver.quit()
+                self._driver = None
@@ -1,7 +1,11 @@
 import json
+import os
 import numpy as np
 import pandas as pd
 
+import regions
+from regions import JEONNAM, region_path
+
 
 def split_affil_and_grade(df, col="소속[학년]"):
     # 소속(아무 문자) + 선택적으로 [학년숫자] 캡처 (전각/반각 숫자 모두)
@@ -183,9 +187,12 @@ def add_structured_date_columns(
     return df, new_cols
 
 
-
-
-if __name__ == "__main__":
+def build_db(sido=JEONNAM, in_dir=".", out_csv="sido_crawling_db_data.csv", out_xlsx="sido_crawling_db_data.xlsx"):
+    """
+    시도 하나의 크롤링 결과 4종(<시도>_*.csv, in_dir)을 합쳐 DB 적재용 표를 만든다.
+    선수목록은 그 시도 선수만, 상대 시도는 '시도' 짝(예: '전남 : 세종')에서 그 시도가 아닌 쪽.
+    """
+    sido = regions.get(sido)
     # 스케줄
     schedule_cols = [
         "글로벌 PK",
@@ -198,8 +205,8 @@ if __name__ == "__main__":
         "경기장",
         "시도",
     ]
-    schedule_tournament = pd.read_csv("jeonnam_schedule_tournament.csv")
-    schedule_matches = pd.read_csv("jeonnam_schedule_matches.csv")
+    schedule_tournament = pd.read_csv(region_path(sido, "schedule_tournament", in_dir))
+    schedule_matches = pd.read_csv(region_path(sido, "schedule_matches", in_dir))
 
     schedule_df = pd.concat(
         [schedule_tournament[schedule_cols], schedule_matches[schedule_cols]]
@@ -209,13 +216,13 @@ if __name__ == "__main__":
     # 선수목록
     bracket_cols = ["글로벌 PK", "선수명", "소속", "학년", "시도"]
     bracket_tournament = split_affil_and_grade(
-        pd.read_csv("jeonnam_bracket_tournament.csv")
+        pd.read_csv(region_path(sido, "bracket_tournament", in_dir))
     ).rename(columns={"팀 구분": "시도"})
-    bracket_matches = pd.read_csv("jeonnam_bracket_matches.csv")
+    bracket_matches = pd.read_csv(region_path(sido, "bracket_matches", in_dir))
     bracket_df = pd.concat(
         [bracket_tournament[bracket_cols], bracket_matches[bracket_cols]]
     ).reset_index(drop=True)
-    bracket_df = bracket_df[bracket_df["시도"] == "전남"]
+    bracket_df = bracket_df[bracket_df["시도"] == sido.name]
     bracket_json_df = players_per_match(bracket_df)
 
     # 조인
@@ -225,7 +232,7 @@ if __name__ == "__main__":
         date_col="일자",
         schedule_col="경기장 및 시간",
         sido_col="시도",
-        our_team="전남",
+        our_team=sido.name,
         fill_if_not_match=""   # 빈칸으로 두고 싶으면 "", 아니면 np.nan
     )
 
@@ -266,6 +273,7 @@ if __name__ == "__main__":
     db_data["메달 여부"] = pd.Series(pd.NA, index=db_data.index, dtype="string")
     db_data.loc[cond, "메달 여부"] = "메달발생"
 
+    # DB 적재 컬럼 순서
     df = db_data[
         [
             "이름",
@@ -285,6 +293,21 @@ if __name__ == "__main__":
         ]
     ]
 
+    if out_csv:
+        df.to_csv(out_csv, index=False)
+    if out_xlsx:
+        df.to_excel(out_xlsx, index=False)
+    return df
+
 
-    db_data.to_csv("sido_crawling_db_data.csv", index=False)
-    db_data.to_excel("sido_crawling_db_data.xlsx", index=False)
+if __name__ == "__main__":
+    # MEET_SIDO=경북 → 경북 결과(gyeongbuk_*.csv)로 생성. 기본 전남은 기존 파일 이름 그대로
+    sido = regions.get(os.environ.get("MEET_SIDO") or JEONNAM)
+    if sido == JEONNAM:
+        build_db(sido)
+    else:
+        build_db(
+            sido,
+            out_csv=region_path(sido, "crawling_db_data"),
+            out_xlsx=region_path(sido, "crawling_db_data", ext=".xlsx"),
+        )
@@ -0,0 +1,99 @@
+"""
+크롤링한 HTML 원본 캐시(내용 주소 방식, gzip 압축).
+
+    root/
+      blobs/ab/<sha1>.html.gz   같은 내용은 한 번만 저장
+      index.jsonl               {"kind", "global_pk", "filter", "local_pk", "hash", "meta", "ts"} 한 줄씩 추가
+
+수집 중에는 패널/일정 조각을 받을 때마다 put()으로 저장하고, 파서를 고친 뒤에는
+entries()/iter_html()로 같은 키의 최신 조각만 다시 읽어 브라우저 없이 CSV를 재생성한다.
+
+kind 예: "record_schedule", "record_side", "tournament_schedule", "tournament_side"
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+INDEX_FILE = "index.jsonl"
+
+
+def page_filter(date_str="", class_cd="", class_nm=""):
+    """(필터_일자, 필터_종목코드, 필터_종목명) → 캐시 키용 문자열"""
+    return f"{date_str}|{class_cd}|{class_nm}"
+
+
+class HtmlCache:
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()  # 병렬 브라우저 워커들이 같은 캐시에 기록
+        os.makedirs(os.path.join(root, "blobs"), exist_ok=True)
+
+    @classmethod
+    def open(cls, cache):
+        """경로 문자열/HtmlCache/None 을 받아 HtmlCache 또는 None 반환"""
+        if cache is None or isinstance(cache, HtmlCache):
+            return cache
+        return cls(cache)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, "blobs", digest[:2], digest + ".html.gz")
+
+    def put(self, kind, html, global_pk="", filter="", local_pk=None, meta=None):
+        """HTML 조각 저장 후 내용 해시 반환. 같은 내용이 이미 있으면 인덱스만 추가"""
+        data = html.encode("utf-8") if isinstance(html, str) else html
+        digest = hashlib.sha1(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp, path)
+        entry = {
+            "kind": kind,
+            "global_pk": global_pk or "",
+            "filter": filter or "",
+            "local_pk": None if local_pk is None else int(local_pk),
+            "hash": digest,
+            "meta": meta or {},
+            "ts": round(time.time(), 3),
+        }
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with open(os.path.join(self.root, INDEX_FILE), "a", encoding="utf-8") as f:
+                f.write(line)
+        return digest
+
+    def get(self, digest):
+        with gzip.open(self._blob_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def entries(self, kind):
+        """kind의 (글로벌 PK, 필터, 로컬 PK)별 최신 항목(마지막 저장 순서)"""
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.exists(path):
+            return []
+        latest = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    e = json.loads(line)
+                except ValueError:
+                    continue  # 기록 중 중단된 마지막 줄
+                if e.get("kind") != kind:
+                    continue
+                key = (e["global_pk"], e["filter"], e["local_pk"])
+                latest.pop(key, None)
+                latest[key] = e
+        return list(latest.values())
+
+    def iter_html(self, kind):
+        """(항목, HTML) 순회. 본문 파일이 없는 항목은 건너뜀"""
+        for e in self.entries(kind):
+            try:
+                yield e, self.get(e["hash"])
+            except FileNotFoundError:
+                continue
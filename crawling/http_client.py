@@ -0,0 +1,193 @@
+"""
+브라우저 없이 meet.sports.or.kr 데이터 요청을 직접 보내는 HTTP 클라이언트.
+
+일정 목록/사이드 패널(openSide)/일자 목록(getGmDtList)/종목 목록(selectClassCd)은
+화면 JS가 보내는 폼 POST(XHR)의 HTML 조각이므로, 같은 요청을 requests 세션(커넥션 풀)으로
+재현하고 반환 HTML은 기존 파서(기록경기 _parse_record_table, 토너먼트 parse_side_players 등)가 그대로 읽는다.
+실패하거나 응답이 요청한 경기/묶음의 것이 아니면 HttpFetchError(또는 실패 사유)를 내고, 호출부는 Selenium 경로로 폴백한다.
+
+엔드포인트 경로와 폼 필드명은 ENDPOINTS 기본값을 쓰되, 사이트 변경 시
+MEET_ENDPOINTS(JSON 파일 경로)로 덮어쓴다. 위치 인자(openSide('a','b',..))는 fields 순서대로 이름을 붙인다.
+scheduler(politeness.AdaptiveScheduler)를 주면 엔드포인트별 타임아웃/동시 요청 수/차단을 그쪽에서 정한다.
+"""
+import json
+import os
+import re
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from politeness import CircuitOpen, classify_http
+from replay_server import FixtureStore, fixture_key
+
+BASE_URL = os.environ.get("MEET_BASE_URL", "https://meet.sports.or.kr").rstrip("/")
+
+ENDPOINTS = {
+    # 일정 화면 본문(검색 결과 표 포함)
+    "schedule_R": {"path": "/national/schedule/scheduleR.do", "fields": []},
+    "schedule_T": {"path": "/national/schedule/scheduleT.do", "fields": []},
+    # getGmDtList(sidoCd, sidoNm) → 일자 목록 <li>
+    "gm_dt_list": {"path": "/national/schedule/getGmDtList.do", "fields": ["sidoCd", "sidoNm"]},
+    # getClassCdList(gmDt, gmDt) → 종목 목록 <li onclick="selectClassCd(..)">
+    "class_cd_list": {"path": "/national/schedule/getClassCdList.do", "fields": ["gmDt", "gmDtNm"]},
+    # openSide(...) → 사이드 패널 HTML 조각
+    "side": {"path": "/national/schedule/scheduleSide.do", "fields": ["gmCd", "classCd", "detailClassCd", "gameSeq"]},
+    # 토너먼트 화면의 openSide(...) → 사이드바(참가선수). 기록경기와 같은 요청으로 보고 시작(다르면 MEET_ENDPOINTS)
+    "side_T": {"path": "/national/schedule/scheduleSide.do", "fields": ["gmCd", "classCd", "detailClassCd", "gameSeq"]},
+    # 선수 검색
+    "player": {"path": "/national/search/player.do", "fields": []},
+}
+
+# 검색 폼 필드명(일정 화면)
+SCHEDULE_FORM = {"sido": "sidoCd", "date": "gmDt", "class_cd": "classCd", "page_size": "pageSize"}
+# 검색 폼 필드명(선수 검색 화면: 시도 선택 + #searchKorNm)
+PLAYER_FORM = {"sido": "sidoCd", "name": "searchKorNm", "page_size": "pageSize"}
+
+_JS_ARG_RE = re.compile(r"""'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)"|([-\w.]+)""")
+
+
+class HttpFetchError(Exception):
+    def __init__(self, message, kind="error"):
+        super().__init__(message)
+        self.kind = kind  # "timeout"/"throttle"/"error" (politeness 스케줄러 신호)
+
+
+def load_endpoints(path=None):
+    eps = {k: dict(v) for k, v in ENDPOINTS.items()}
+    path = path or os.environ.get("MEET_ENDPOINTS")
+    if path and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for k, v in json.load(f).items():
+                eps.setdefault(k, {}).update(v)
+    return eps
+
+
+def parse_js_call(call):
+    """"openSide('1','A', 3);" → ('openSide', ['1', 'A', '3'])"""
+    m = re.match(r"\s*(?:javascript:)?\s*([\w$.]+)\s*\((.*)\)\s*;?\s*$", call or "", re.S)
+    if not m:
+        return None, []
+    args = []
+    for a, b, c in _JS_ARG_RE.findall(m.group(2)):
+        args.append(a or b or c)
+    return m.group(1), args
+
+
+class MeetHttpClient:
+    def __init__(self, base_url=BASE_URL, endpoints=None, pool_size=8, timeout=15, retries=2, record_dir=None,
+                 scheduler=None):
+        self.base_url = base_url.rstrip("/")
+        self.endpoints = endpoints or load_endpoints()
+        self.timeout = timeout
+        self.scheduler = scheduler
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries, backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504), allowed_methods=None,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": "Mozilla/5.0 (jw-crawler)",
+            "X-Requested-With": "XMLHttpRequest",
+        })
+        # record_dir 지정 시 응답을 replay_server용 fixtures로 저장
+        self.recorder = FixtureStore(record_dir) if record_dir else None
+
+    # ---------- 저수준 ----------
+    def request(self, name, form=None, method="POST"):
+        if self.scheduler is None:
+            return self._request(name, form, method, self.timeout)
+        try:
+            # 차단 중이면 기다리지 않고 바로 실패 → 호출부가 브라우저로 폴백
+            with self.scheduler.slot(name, wait=False) as call:
+                try:
+                    return self._request(name, form, method, self.scheduler.timeout(name, self.timeout))
+                except HttpFetchError as e:
+                    call.fail(e.kind)
+                    raise
+        except CircuitOpen as e:
+            raise HttpFetchError(str(e), kind="throttle") from e
+
+    def _request(self, name, form, method, timeout):
+        ep = self.endpoints.get(name)
+        if not ep:
+            raise HttpFetchError(f"엔드포인트 미정의: {name}")
+        url = self.base_url + ep["path"]
+        form = {k: v for k, v in (form or {}).items() if v is not None}
+        try:
+            if method == "GET":
+                r = self.session.get(url, params=form, timeout=timeout)
+            else:
+                r = self.session.post(url, data=form, timeout=timeout, headers={"Referer": url})
+        except requests.exceptions.RetryError as e:  # 5xx 재시도 소진
+            raise HttpFetchError(f"{name}: {type(e).__name__}: {e}", kind="throttle") from e
+        except requests.RequestException as e:
+            raise HttpFetchError(f"{name}: {type(e).__name__}: {e}", kind=classify_http(exc=e)) from e
+        if r.status_code != 200:
+            raise HttpFetchError(f"{name}: HTTP {r.status_code}", kind=classify_http(r.status_code))
+        # charset이 없으면 requests가 text/*를 ISO-8859-1로 가정해 한글이 깨진다 → 사이트 기본 utf-8로 디코드
+        if "charset=" in r.headers.get("Content-Type", "").lower():
+            html = r.text
+        else:
+            html = r.content.decode("utf-8", "replace")
+        if self.recorder is not None:
+            path = ep["path"] + ("?" + urlencode(form) if method == "GET" and form else "")
+            self.recorder.save(
+                fixture_key(method, path, None if method == "GET" else form), r.content,
+                status=r.status_code, content_type=r.headers.get("Content-Type", "text/html; charset=utf-8"),
+            )
+        if not html.strip():
+            raise HttpFetchError(f"{name}: 빈 응답")
+        return html
+
+    def call(self, name, args):
+        """JS 함수의 위치 인자를 ENDPOINTS[name].fields 순서로 폼에 매핑해 POST"""
+        fields = self.endpoints.get(name, {}).get("fields") or []
+        if len(args) > len(fields):
+            raise HttpFetchError(f"{name}: 인자 {len(args)}개 > 필드 {len(fields)}개 (MEET_ENDPOINTS 확인)")
+        return self.request(name, dict(zip(fields, args)))
+
+    # ---------- 화면 단위 ----------
+    def gm_dt_list_html(self, sido_cd, sido_nm):
+        return self.call("gm_dt_list", [sido_cd, sido_nm])
+
+    def class_cd_list_html(self, date_str):
+        return self.call("class_cd_list", [date_str, date_str])
+
+    def schedule_html(self, kind, sido_cd, date_str="", class_cd="", page_size=1000):
+        """kind: 'R'(기록경기) / 'T'(토너먼트). 더보기 없이 한 번에 받도록 큰 pageSize 요청"""
+        form = {
+            SCHEDULE_FORM["sido"]: sido_cd,
+            SCHEDULE_FORM["date"]: date_str,
+            SCHEDULE_FORM["class_cd"]: class_cd,
+            SCHEDULE_FORM["page_size"]: page_size,
+        }
+        return self.request(f"schedule_{kind}", form)
+
+    def player_search_html(self, sido_cd, name, page_size=1000):
+        """선수 검색 폼 제출(시도 + 성명) → 결과 화면 HTML('선수명 검색 결과' 표 포함)"""
+        form = {
+            PLAYER_FORM["sido"]: sido_cd,
+            PLAYER_FORM["name"]: name,
+            PLAYER_FORM["page_size"]: page_size,
+        }
+        return self.request("player", form)
+
+    def side_html(self, side_call, endpoint="side"):
+        """side_call: openSide 호출 문자열 또는 인자 목록. endpoint: "side"(기록경기)/"side_T"(토너먼트)"""
+        if isinstance(side_call, str):
+            fn, args = parse_js_call(side_call)
+            if fn and not fn.endswith("openSide"):
+                raise HttpFetchError(f"openSide 호출이 아님: {fn}")
+        else:
+            args = list(side_call or [])
+        if not args:
+            raise HttpFetchError("openSide 인자 없음")
+        return self.call(endpoint, args)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,90 @@
+"""
+대회 기간 중 증분 갱신: 이전 스케줄 스냅샷과 새 스케줄을 글로벌 PK 기준으로 비교해
+새로 생겼거나 상태/일시가 바뀐 경기만 사이드 패널을 다시 긁고, 결과는 기존 데이터에 합친다.
+
+같은 글로벌 PK가 여러 행일 수 있으므로(같은 경기구분 재경기 등) 비교 키는
+"글로벌 PK#등장순번"으로 만든다. 로컬 PK는 새 경기가 끼어들면 밀리므로
+기존 결과의 로컬 PK는 비교 키를 거쳐 새 스케줄 번호로 다시 매긴다.
+"""
+import pandas as pd
+
+DIFF_COLS = ("상태", "일시")
+FINAL_STATUS = "종료"
+
+
+def match_keys(schedule, key="글로벌 PK"):
+    s = schedule.sort_values("로컬 PK", kind="mergesort")
+    keys = s[key].astype(str) + "#" + s.groupby(key).cumcount().astype(str)
+    return keys.reindex(schedule.index)
+
+
+def diff_schedule(prev, cur, prev_results=None, cols=DIFF_COLS):
+    """
+    cur에 "변경" 컬럼을 붙여 반환: "신규" / "변경" / "결과없음" / "" (그대로)
+    결과없음: 상태가 종료인데 이전 결과에 행이 하나도 없던 경기(지난번 수집 실패 등)
+    """
+    cur = cur.copy()
+    cur["_key"] = match_keys(cur)
+    if prev is None or prev.empty:
+        cur["변경"] = "신규"
+        return cur.drop(columns="_key")
+
+    prev = prev.copy()
+    prev["_key"] = match_keys(prev)
+    cols = [c for c in cols if c in cur.columns and c in prev.columns]
+    # 빈 칸은 CSV를 거치면 NaN이 되므로 ""로 맞춘 뒤 비교("nan" != "" 로 변경 처리되지 않도록)
+    before = prev.set_index("_key")[cols].fillna("").astype(str)
+    after = cur.set_index("_key")[cols].fillna("").astype(str)
+
+    is_new = ~cur["_key"].isin(before.index)
+    common = after.index.intersection(before.index)
+    changed_keys = common[(after.loc[common] != before.loc[common]).any(axis=1).to_numpy()]
+    is_changed = cur["_key"].isin(changed_keys)
+
+    is_missing = pd.Series(False, index=cur.index)
+    if prev_results is not None and "로컬 PK" in prev_results.columns:
+        have = set(prev.loc[prev["로컬 PK"].isin(prev_results["로컬 PK"]), "_key"])
+        is_missing = (cur["상태"].astype(str) == FINAL_STATUS) & ~cur["_key"].isin(have)
+
+    cur["변경"] = ""
+    cur.loc[is_missing, "변경"] = "결과없음"
+    cur.loc[is_changed, "변경"] = "변경"
+    cur.loc[is_new, "변경"] = "신규"
+    return cur.drop(columns="_key")
+
+
+def summarize(plan):
+    counts = plan["변경"].value_counts()
+    return " | ".join(
+        f"{label or '그대로'} {int(counts.get(label, 0))}건" for label in ("신규", "변경", "결과없음", "")
+    )
+
+
+def merge_results(prev_results, new_results, prev_schedule, cur_schedule, refreshed_pks):
+    """
+    prev_results: 이전 결과(로컬 PK는 prev_schedule 기준)
+    new_results: 이번에 다시 긁은 경기 결과(로컬 PK는 cur_schedule 기준)
+    refreshed_pks: 이번에 다시 긁은 경기의 로컬 PK(cur 기준). 이 중 새 결과가 실제로 있는 경기와
+                   새 스케줄에서 사라진 경기의 이전 결과는 버리고, 나머지는 로컬 PK만 새 번호로 바꿔 유지
+                   (재수집이 실패한 경기는 이전 결과를 그대로 둔다)
+    """
+    frames = []
+    replaced = set(refreshed_pks)
+    if new_results is not None and not new_results.empty:
+        replaced &= set(new_results["로컬 PK"].astype(int))
+    else:
+        replaced = set()
+    if prev_results is not None and not prev_results.empty and prev_schedule is not None:
+        old_key = dict(zip(prev_schedule["로컬 PK"], match_keys(prev_schedule)))
+        cur_pk = dict(zip(match_keys(cur_schedule), cur_schedule["로컬 PK"]))
+        kept = prev_results.copy()
+        kept["로컬 PK"] = kept["로컬 PK"].map(lambda pk: cur_pk.get(old_key.get(pk)))
+        kept = kept[kept["로컬 PK"].notna() & ~kept["로컬 PK"].isin(replaced)]
+        kept["로컬 PK"] = kept["로컬 PK"].astype(int)
+        frames.append(kept)
+    if new_results is not None and not new_results.empty:
+        frames.append(new_results)
+    if not frames:
+        return pd.DataFrame(columns=list(getattr(new_results, "columns", [])))
+    merged = pd.concat(frames, ignore_index=True)
+    return merged.sort_values("로컬 PK", kind="mergesort").reset_index(drop=True)
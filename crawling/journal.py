@@ -0,0 +1,138 @@
+"""
+경기 단위 체크포인트 저널(SQLite, 추가 전용).
+
+경기 하나를 끝낼 때마다 (로컬 PK, 글로벌 PK, 성공 여부, 실패 사유, 추출 행 JSON)을
+한 줄 INSERT 하고 바로 commit 한다. 중간에 죽어도 끝난 경기는 남아 있으므로,
+같은 저널로 다시 실행하면 성공한 경기는 건너뛰고 실패/미처리 경기만 다시 수집한다.
+최종 CSV는 materialize()로 저널에서 만든다(로컬 PK 순서로 흘려 씀).
+
+    journal = CrawlJournal("jeonnam_bracket_matches.journal.sqlite")
+    if not journal.is_done(local_pk, global_pk):
+        rows, ok, reason = ...
+        journal.record(local_pk, global_pk, rows, ok, reason)
+    journal.materialize("jeonnam_bracket_matches.csv", columns)
+
+로컬 PK는 스케줄 순번이라 재실행 사이에 바뀔 수 있으므로, 글로벌 PK가 다르면 완료로 보지 않는다.
+"""
+import json
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from writers import ResultWriter
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    local_pk  INTEGER NOT NULL,
+    global_pk TEXT,
+    ok        INTEGER NOT NULL,
+    reason    TEXT,
+    n_rows    INTEGER NOT NULL,
+    rows_json TEXT NOT NULL,
+    ts        REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_local_pk ON events(local_pk);
+"""
+
+# 경기별 최신 기록 중 성공한 것만
+_LATEST_OK = (
+    "SELECT {cols} FROM events WHERE id IN (SELECT MAX(id) FROM events GROUP BY local_pk) "
+    "AND ok = 1 ORDER BY local_pk"
+)
+
+
+class CrawlJournal:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()  # 병렬 브라우저 워커들이 같은 저널에 기록
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._done = {
+            pk: gpk for pk, gpk in self._conn.execute(_LATEST_OK.format(cols="local_pk, global_pk"))
+        }
+        if self._done:
+            print(f"[JOURNAL] {path} | 완료 {len(self._done)}건 이어받기", flush=True)
+
+    @classmethod
+    def open(cls, journal):
+        """경로 문자열/CrawlJournal/None 을 받아 CrawlJournal 또는 None 반환"""
+        if journal is None or isinstance(journal, CrawlJournal):
+            return journal
+        return cls(journal)
+
+    def is_done(self, local_pk, global_pk=None):
+        local_pk = int(local_pk)
+        if local_pk not in self._done:
+            return False
+        return global_pk is None or self._done[local_pk] == global_pk
+
+    def done_count(self):
+        return len(self._done)
+
+    def record(self, local_pk, global_pk, rows, ok, reason=""):
+        local_pk = int(local_pk)
+        payload = json.dumps(rows or [], ensure_ascii=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO events (local_pk, global_pk, ok, reason, n_rows, rows_json, ts) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (local_pk, global_pk, int(bool(ok)), reason or "", len(rows or []), payload, time.time()),
+            )
+            self._conn.commit()
+            if ok:
+                self._done[local_pk] = global_pk
+            else:
+                self._done.pop(local_pk, None)
+
+    def rows(self):
+        """성공한 경기들의 행을 로컬 PK 순서로 펼쳐서 반환"""
+        return list(self.iter_rows())
+
+    def iter_rows(self):
+        """rows()와 같은 순서로 경기 하나씩 풀어 내보냄(전체를 메모리에 올리지 않음)"""
+        with self._lock:
+            cur = self._conn.execute(_LATEST_OK.format(cols="rows_json"))
+            for (payload,) in cur:
+                yield from json.loads(payload)
+
+    def failures(self):
+        """최신 상태가 실패인 경기 목록(로컬 PK, 글로벌 PK, 사유, 시도 횟수)"""
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT e.local_pk, e.global_pk, e.reason, "
+                "(SELECT COUNT(*) FROM events x WHERE x.local_pk = e.local_pk) "
+                "FROM events e WHERE e.id IN (SELECT MAX(id) FROM events GROUP BY local_pk) AND e.ok = 0 "
+                "ORDER BY e.local_pk"
+            )
+            return [
+                {"로컬 PK": pk, "글로벌 PK": gpk, "실패 사유": reason, "시도 횟수": n}
+                for pk, gpk, reason, n in cur
+            ]
+
+    def materialize(self, out_csv, columns):
+        """
+        저널 → 최종 CSV/Parquet. out_csv가 있으면 경기 순서대로 흘려 쓰고(writers.ResultWriter) 행 수 반환,
+        None이면 저장 없이 DataFrame 반환
+        """
+        if out_csv:
+            with ResultWriter(out_csv, columns) as w:
+                for row in self.iter_rows():
+                    w.write([row])
+            result = n = w.rows
+        else:
+            result = pd.DataFrame(self.rows(), columns=columns)
+            n = len(result)
+        fails = self.failures()
+        print(f"[JOURNAL] {out_csv} | {n}행 | 완료 경기 {len(self._done)}건 | 실패 {len(fails)}건", flush=True)
+        for f in fails[:20]:
+            print(f"  - 실패 {f['로컬 PK']} ({f['글로벌 PK']}) x{f['시도 횟수']}: {f['실패 사유']}", flush=True)
+        return result
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
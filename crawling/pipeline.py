@@ -0,0 +1,196 @@
+"""
+가져오기(브라우저) → 파싱(프로세스 풀) → 기록(writer) 3단계 파이프라인.
+
+브라우저 워커는 사이드 패널 outerHTML만 받아 submit()으로 넘기고 바로 다음 경기로 간다.
+BeautifulSoup 파싱은 프로세스 풀에서, 결과 기록(저널/행 누적)은 writer 스레드 하나에서 한다.
+
+    pipe = ParsePipeline(parse_side_html, sink, processes=4, label="record")
+    pipe.submit(key, html, local_pk, meta, fetch_ms=...)   # 브라우저 스레드(큐가 차면 대기)
+    ...
+    pipe.close()                                            # 남은 작업 처리 후 단계별 처리량 출력
+
+parse_fn(*args)는 (rows, success, reason)을 돌려주는 모듈 최상위 함수여야 한다(프로세스로 넘김).
+sink(key, rows, success, reason)는 writer 스레드에서 순서대로 호출된다.
+processes=0이면 파싱도 스레드에서 한다(디버깅용).
+"""
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+_DONE = object()
+
+
+def _timed_call(fn, args):
+    t0 = time.perf_counter()
+    try:
+        out = fn(*args)
+    except Exception as e:
+        out = ([], False, f"파싱 예외: {type(e).__name__}: {e}")
+    return out, (time.perf_counter() - t0) * 1000
+
+
+class StageStats:
+    def __init__(self):
+        self.n = 0
+        self.busy_ms = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, ms):
+        with self._lock:
+            self.n += 1
+            self.busy_ms += ms or 0
+
+
+class ParsePipeline:
+    def __init__(self, parse_fn, sink, processes=2, max_pending=64, label=""):
+        self.parse_fn = parse_fn
+        self.sink = sink
+        self.label = label
+        self.processes = processes
+        self.max_pending = max_pending
+        self.stats = {"fetch": StageStats(), "parse": StageStats(), "write": StageStats()}
+        self.high_water = 0
+        self.errors = 0
+        self.t0 = time.perf_counter()
+
+        self._frags = queue.Queue(maxsize=max_pending)
+        self._results = queue.Queue()
+        self._slots = max(1, processes) * 2  # 풀에 동시에 올려 둘 작업 수
+        self._inflight = threading.BoundedSemaphore(self._slots)
+        self._pool = self._new_pool() if processes > 0 else None
+        self.pool_restarts = 0
+        self._feeder = threading.Thread(target=self._feed, name="pipeline-feed", daemon=True)
+        self._writer = threading.Thread(target=self._write, name="pipeline-write", daemon=True)
+        self._feeder.start()
+        self._writer.start()
+        self._closed = False
+
+    def _new_pool(self):
+        # 브라우저 스레드가 도는 중에 fork하지 않도록 spawn
+        return ProcessPoolExecutor(max_workers=self.processes, mp_context=multiprocessing.get_context("spawn"))
+
+    def _put(self, item):
+        # feeder가 죽었으면 큐가 다시 비지 않으므로 무한 대기 대신 오류
+        while True:
+            try:
+                self._frags.put(item, timeout=1)
+                return
+            except queue.Full:
+                if not self._feeder.is_alive():
+                    raise RuntimeError(f"[PIPELINE{' ' + self.label if self.label else ''}] 파싱 단계 중단됨")
+
+    # ---------- 가져오기(브라우저 워커) ----------
+    def submit(self, key, *args, fetch_ms=None):
+        """원본 조각을 큐에 넣는다. 큐가 가득 차면 파싱이 따라올 때까지 브라우저 쪽이 기다린다"""
+        self._put((key, args))
+        self.stats["fetch"].add(fetch_ms)
+        self.high_water = max(self.high_water, self._frags.qsize())
+
+    # ---------- 파싱 ----------
+    def _feed(self):
+        try:
+            while True:
+                item = self._frags.get()
+                if item is _DONE:
+                    break
+                key, args = item
+                self._inflight.acquire()
+                if self._pool is None:
+                    self._parsed(key, _timed_call(self.parse_fn, args))
+                    continue
+                fut = err = None
+                for _ in range(2):
+                    try:
+                        fut = self._pool.submit(_timed_call, self.parse_fn, args)
+                        break
+                    except Exception as e:
+                        # 앞 조각에서 파싱 프로세스가 죽으면(OOM/lxml segfault) 풀이 BrokenProcessPool
+                        # → 풀을 새로 만들고 이 조각은 새 풀에 다시 제출(죽은 조각은 _parsed에서 실패 처리됨)
+                        err = e
+                        self._restart_pool()
+                if fut is None:
+                    self._parsed(key, (([], False, f"파싱 프로세스 오류: {type(err).__name__}: {err}"), 0))
+                    continue
+                fut.add_done_callback(lambda f, key=key: self._parsed(key, f))
+            # 풀에 올라간 작업이 모두 끝날 때까지(슬롯을 전부 회수) 기다린 뒤 writer 종료
+            for _ in range(self._slots):
+                self._inflight.acquire()
+        finally:
+            self._results.put(_DONE)
+
+    def _restart_pool(self):
+        old, self._pool = self._pool, self._new_pool()
+        self.pool_restarts += 1
+        print(f"[PIPELINE{' ' + self.label if self.label else ''}] 파싱 프로세스 풀 재시작({self.pool_restarts}회)", flush=True)
+        old.shutdown(wait=False, cancel_futures=True)
+
+    def _parsed(self, key, fut):
+        try:
+            out, ms = fut if isinstance(fut, tuple) else fut.result()
+        except Exception as e:
+            out, ms = ([], False, f"파싱 프로세스 오류: {type(e).__name__}: {e}"), 0
+        self.stats["parse"].add(ms)
+        self._results.put((key, out))
+        self._inflight.release()
+
+    # ---------- 기록 ----------
+    def _write(self):
+        while True:
+            item = self._results.get()
+            if item is _DONE:
+                break
+            key, (rows, ok, reason) = item
+            t0 = time.perf_counter()
+            try:
+                self.sink(key, rows, ok, reason)
+            except Exception as e:
+                self.errors += 1
+                print(f"[PIPELINE] 기록 실패 {key}: {type(e).__name__}: {e}", flush=True)
+            self.stats["write"].add((time.perf_counter() - t0) * 1000)
+
+    def close(self):
+        """남은 조각을 모두 파싱/기록하고 종료. 단계별 처리량 dict 반환"""
+        if self._closed:
+            return self.report()
+        self._closed = True
+        if self._feeder.is_alive():
+            try:
+                self._put(_DONE)
+            except RuntimeError:
+                pass
+        self._feeder.join()
+        self._writer.join()
+        if self._pool is not None:
+            self._pool.shutdown()
+        report = self.report()
+        print_report(report)
+        return report
+
+    def report(self):
+        wall = max(time.perf_counter() - self.t0, 1e-6)
+        stages = {}
+        for name, s in self.stats.items():
+            stages[name] = {
+                "n": s.n,
+                "per_s": round(s.n / wall, 2),
+                "mean_ms": round(s.busy_ms / s.n, 1) if s.n else None,
+                "busy_s": round(s.busy_ms / 1000, 1),
+            }
+        return {
+            "label": self.label, "wall_s": round(wall, 1), "processes": self.processes,
+            "queue_max": self.high_water, "queue_cap": self.max_pending, "errors": self.errors,
+            "pool_restarts": self.pool_restarts,
+            "stages": stages,
+        }
+
+
+def print_report(report):
+    print(f"\n[PIPELINE{' ' + report['label'] if report['label'] else ''}] {report['wall_s']}s | "
+          f"파싱 프로세스 {report['processes']} | 큐 최대 {report['queue_max']}/{report['queue_cap']}"
+          f"{' | 기록 실패 ' + str(report['errors']) if report['errors'] else ''}"
+          f"{' | 풀 재시작 ' + str(report['pool_restarts']) if report.get('pool_restarts') else ''}")
+    for name, s in report["stages"].items():
+        mean = f"{s['mean_ms']:.1f}ms/건" if s["mean_ms"] is not None else "-"
+        print(f"{name:>8} {s['n']:>6}건 | {s['per_s']:>7.2f}건/s | {mean:>12} | 누적 {s['busy_s']}s")
@@ -1,11 +1,14 @@
-import re, time
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from bs4 import BeautifulSoup
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.alert import Alert
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -13,24 +16,27 @@ from selenium.common.exceptions import (
     UnexpectedAlertPresentException,
     JavascriptException,
 )
-from webdriver_manager.chrome import ChromeDriverManager
-
-URL_PLAYER = "https://meet.sports.or.kr/national/search/player.do"
+from driver_manager import ManagedChrome
+from http_client import BASE_URL, HttpFetchError, MeetHttpClient
+from politeness import AdaptiveScheduler
+import regions
+from regions import JEONNAM
+from waits import EMPTY_MARKERS, mark_stale, wait_for, wait_rows_or_empty
+
+URL_PLAYER = f"{BASE_URL}/national/search/player.do"
+RESULT_ROWS_CSS = "table.tablesaw.tablesaw-stack tbody tr"
+
+# a = {want}: 보이는 div.search-select 가 있음(want=true)/없음(want=false) 상태가 되면 반환
+VISIBLE_SELECTS_JS = """function(a) {
+    const boxes = Array.from(document.querySelectorAll('div.search-select')).filter(el => {
+        const st = getComputedStyle(el);
+        return st.display !== 'none' && el.offsetWidth > 0 && el.offsetHeight > 0 && st.opacity !== '0';
+    });
+    return (boxes.length > 0) === a.want ? {state: 'ready', count: boxes.length} : null;
+}"""
 
 
 # ===== 공통 =====
-def setup_driver(headless=True):
-    opt = Options()
-    if headless:
-        opt.add_argument("--headless=new")
-    opt.add_argument("--no-sandbox")
-    opt.add_argument("--disable-dev-shm-usage")
-    opt.add_argument("--window-size=1400,2400")
-    opt.set_capability("unhandledPromptBehavior", "accept")
-    return webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()), options=opt
-    )
-
 
 def accept_alert_if_present(driver, timeout=2):
     try:
@@ -42,8 +48,9 @@ def accept_alert_if_present(driver, timeout=2):
 
 
 def _normalize(s: str) -> str:
-    if s is None:
+    if s is None or (isinstance(s, float) and pd.isna(s)):
         return ""
+    s = str(s)
     s = s.replace("\xa0", " ").replace("　", " ")
     s = s.translate(str.maketrans("０１２３４５６７８９", "0123456789"))
     return re.sub(r"\s+", " ", s).strip()
@@ -60,10 +67,9 @@ def open_player_search(driver):
     WebDriverWait(driver, 15).until(
         EC.presence_of_element_located((By.CSS_SELECTOR, "div.searchBox01"))
     )
-    time.sleep(0.2)
 
 
-# ===== 시/도 = 전남 전용 선택기 (단순·고속) =====
+# ===== 시/도 선택기 (단순·고속, 기본 전남) =====
 def _get_visible_selects(driver):
     return driver.execute_script(
         """
@@ -76,27 +82,24 @@ def _get_visible_selects(driver):
     )
 
 
-def select_sido_jeonnam(driver, open_timeout=6, close_timeout=4):
+def select_sido(driver, sido=JEONNAM, open_timeout=6, close_timeout=4):
+    sido = regions.get(sido)
     # 1) 시도 버튼 열기
     btn = WebDriverWait(driver, 10).until(
         EC.element_to_be_clickable((By.ID, "sidoCdBtn"))
     )
     _click_js(driver, btn)
 
-    # 2) 보이는 select 박스 찾기
-    box = None
-    end = time.time() + open_timeout
-    while time.time() < end:
-        boxes = _get_visible_selects(driver)
-        if boxes:
-            box = boxes[0]
-            break
-        time.sleep(0.1)
-    if box is None:
+    # 2) 보이는 select 박스 찾기(열리는 순간까지 이벤트 대기)
+    if wait_for(driver, VISIBLE_SELECTS_JS, {"want": True}, timeout=open_timeout)["state"] != "ready":
+        return False
+    boxes = _get_visible_selects(driver)
+    if not boxes:
         return False
+    box = boxes[0]
 
-    # 3) '전남' 항목 클릭 (텍스트/onclick 폴백)
-    want = _normalize("전남")
+    # 3) 시도 항목 클릭 (텍스트/onclick 폴백)
+    want = _normalize(sido.name)
     lis = box.find_elements(By.CSS_SELECTOR, "ul > li")
     target = None
     for li in lis:
@@ -110,7 +113,7 @@ def select_sido_jeonnam(driver, open_timeout=6, close_timeout=4):
     if target is None:
         for li in lis:
             oc = li.get_attribute("onclick") or ""
-            if "전남" in oc:
+            if sido.name in oc:
                 target = li
                 break
     if target is None:
@@ -119,23 +122,20 @@ def select_sido_jeonnam(driver, open_timeout=6, close_timeout=4):
     _click_js(driver, target)
 
     # 4) 닫힘(비가시) 대기
-    end2 = time.time() + close_timeout
-    while time.time() < end2:
-        if not _get_visible_selects(driver):
-            break
-        time.sleep(0.1)
+    wait_for(driver, VISIBLE_SELECTS_JS, {"want": False}, timeout=close_timeout)
     return True
 
 
-def ensure_sido_is_jeonnam(driver):
+def ensure_sido(driver, sido=JEONNAM):
+    sido = regions.get(sido)
     try:
         btn = driver.find_element(By.ID, "sidoCdBtn")
         cur = _normalize(btn.text)
-        if cur == _normalize("전남"):
+        if cur == _normalize(sido.name):
             return True
     except Exception:
         pass
-    return select_sido_jeonnam(driver)
+    return select_sido(driver, sido)
 
 
 # ===== 입력/검색 =====
@@ -146,6 +146,8 @@ def set_name_input(driver, name):
 
 
 def click_search(driver):
+    # 직전 검색 결과는 '이전 결과'로 표시 → 새 결과/빈 결과만 대기 대상
+    mark_stale(driver, f"#printDiv tr, #printDiv {EMPTY_MARKERS.replace(', ', ', #printDiv ')}")
     for xp in [
         "//button[normalize-space()='검색']",
         "//a[normalize-space()='검색']",
@@ -159,25 +161,28 @@ def click_search(driver):
 
 
 # ===== 결과 대기/판독 =====
-def wait_result_table_soup(driver, open_timeout=8, table_timeout=15, poll=0.2):
+def _wait_result(driver, open_timeout=8, table_timeout=15):
+    """(상태, soup). 상태: ready(행 있음, soup) / empty(검색 결과 없음) / timeout / alert"""
     try:
         WebDriverWait(driver, open_timeout).until(
             EC.presence_of_element_located((By.ID, "printDiv"))
         )
     except TimeoutException:
-        return None
-    end = time.time() + table_timeout
-    while time.time() < end:
-        try:
-            box = driver.find_element(By.ID, "printDiv")
-            html = box.get_attribute("outerHTML")
-            soup = BeautifulSoup(html, "lxml")
-            if soup.select("table.tablesaw.tablesaw-stack tbody tr"):
-                return soup
-        except UnexpectedAlertPresentException:
-            accept_alert_if_present(driver, 2)
-        time.sleep(poll)
-    return None
+        return "timeout", None
+    res = wait_rows_or_empty(driver, RESULT_ROWS_CSS, root="#printDiv", timeout=table_timeout)
+    if res["state"] != "ready":
+        return res["state"], None
+    try:
+        html = driver.find_element(By.ID, "printDiv").get_attribute("outerHTML")
+    except UnexpectedAlertPresentException:
+        accept_alert_if_present(driver, 2)
+        return "alert", None
+    return "ready", BeautifulSoup(html, "lxml")
+
+
+def wait_result_table_soup(driver, open_timeout=8, table_timeout=15):
+    """결과표 행 또는 빈 결과 표시가 뜨는 순간 반환(MutationObserver). 행이 있을 때만 soup, 아니면 None"""
+    return _wait_result(driver, open_timeout, table_timeout)[1]
 
 
 def _td_content_soup(td):
@@ -197,33 +202,209 @@ def _find_player_result_table(soup):
     return None
 
 
-def any_row_matches_by_skn(soup, sport, kind, name):
-    """표에서 (종목/종별/선수명) 완전일치 1건 이상 여부"""
-    sport = _normalize(sport)
-    kind = _normalize(kind)
-    name = _normalize(name)
-
+def index_result_table(soup):
+    """결과표 전체 → {(종목, 종별, 선수명)} 집합. 성명 한 번 검색한 결과로 그 성명의 모든 행을 판정한다"""
+    keys = set()
     table = _find_player_result_table(soup)
     if table is None:
-        return False
+        return keys
 
-    rows = table.select("tbody > tr")
-    for tr in rows:
+    for tr in table.select("tbody > tr"):
         tds = tr.find_all("td")
         if len(tds) < 6:
             continue
 
         # ✳️ 라벨(b.tablesaw-cell-label)은 무시하고 content span만 사용
-        td_sport = _td_content_soup(tds[0])  # 종목
-        td_kind = _td_content_soup(tds[1])  # 종별
-        td_name = _td_content_soup(tds[4])  # 선수명
+        keys.add((
+            _td_content_soup(tds[0]),  # 종목
+            _td_content_soup(tds[1]),  # 종별
+            _td_content_soup(tds[4]),  # 선수명
+        ))
+    return keys
+
+
+def any_row_matches_by_skn(soup, sport, kind, name):
+    """표에서 (종목/종별/선수명) 완전일치 1건 이상 여부"""
+    return (_normalize(sport), _normalize(kind), _normalize(name)) in index_result_table(soup)
 
-        if td_sport == sport and td_kind == kind and td_name == name:
-            return True
-    return False
+
+# ===== 성명 검색 결과 캐시 =====
+class LookupCache:
+    """
+    성명 → 결과표 (종목, 종별, 성명) 키 집합을 SQLite에 저장(키는 "<시도코드>:<성명>", _cache_key).
+    재실행하면 캐시에 있는 성명은 브라우저 검색 없이 답한다(브라우저로 확인한 빈 결과도 저장, 타임아웃은 저장 안 함).
+    max_age_days를 주면 그보다 오래된 기록은 다시 검색한다.
+    """
+
+    def __init__(self, path, max_age_days=None):
+        self.path = path
+        self.max_age_s = max_age_days * 86400 if max_age_days else None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS lookups (name TEXT PRIMARY KEY, keys_json TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def open(cls, cache, **kw):
+        """경로 문자열/LookupCache/None 을 받아 LookupCache 또는 None 반환"""
+        if cache is None or isinstance(cache, LookupCache):
+            return cache
+        return cls(cache, **kw)
+
+    def get(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT keys_json, ts FROM lookups WHERE name = ?", (name,)).fetchone()
+        if row is None or (self.max_age_s and time.time() - row[1] > self.max_age_s):
+            return None
+        return {tuple(k) for k in json.loads(row[0])}
+
+    def put(self, name, keys):
+        payload = json.dumps(sorted(keys), ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lookups (name, keys_json, ts) VALUES (?, ?, ?)", (name, payload, time.time())
+            )
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM lookups").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _cache_key(sido, name):
+    # 같은 성명이라도 시도마다 결과표가 다르다
+    return f"{regions.get(sido).code}:{name}"
+
+
+# ===== 메인: 진위확인(시도+성명만으로 검색) =====
+def search_name_keys(driver, name, open_timeout=8, table_timeout=15, sido=JEONNAM):
+    """성명 1회 검색 → ((종목, 종별, 성명) 키 집합 또는 None, 실패 사유). 검색 결과 없음은 빈 집합"""
+    try:
+        # 혹시 페이지 리셋되면 시도 다시 확인
+        ensure_sido(driver, sido)
+
+        set_name_input(driver, name)
+        click_search(driver)
+
+        state, soup = _wait_result(driver, open_timeout=open_timeout, table_timeout=table_timeout)
+        if state == "ready":
+            return index_result_table(soup), ""
+        if state == "empty":
+            return set(), ""
+        return None, "결과표 미등장/타임아웃" if state == "timeout" else f"결과표 {state}"
+    except JavascriptException as e:
+        return None, f"JS 예외: {str(e)[:120]}"
+    except TimeoutException as e:
+        return None, f"대기 타임아웃: {str(e)[:120]}"
+    except Exception as e:
+        return None, f"예외: {type(e).__name__}: {str(e)[:120]}"
+
+
+def search_name_keys_http(http_client, name, sido=JEONNAM):
+    """HTTP 폼 제출로 성명 1회 검색 → (키 집합 또는 None, 실패 사유). None이면 브라우저로 폴백"""
+    try:
+        html = http_client.player_search_html(regions.get(sido).code, name)
+    except HttpFetchError as e:
+        return None, f"HTTP: {e}"
+    soup = BeautifulSoup(html, "lxml")
+    if _find_player_result_table(soup) is None:
+        # 폼 필드가 바뀌었거나 빈 결과를 표 없이 돌려준 경우 → 화면에서 다시 확인
+        return None, "HTTP: 결과표 없음"
+    keys = index_result_table(soup)
+    # 성명 필드가 무시되면(필드명 변경 등) 빈 표나 다른 선수 목록이 온다 → 빈 결과도 화면에서 확인
+    if not any(k[2] == _normalize(name) for k in keys):
+        return None, "HTTP: 결과 없음/성명 불일치"
+    return keys, ""
+
+
+def _start_player_search(drv, sido=JEONNAM):
+    sido = regions.get(sido)
+    open_player_search(drv)
+    # 새 브라우저마다 1회 시도 세팅
+    if not ensure_sido(drv, sido):
+        raise RuntimeError(f"시/도 '{sido.name}' 선택 실패")
+
+
+def _search_shard(shard, names, index, cache, log, headless, open_timeout, table_timeout, max_searches_per_driver,
+                  http_client=None, sido=JEONNAM):
+    """
+    성명 묶음 하나를 검색해 index에 채우고 샤드 요약 반환.
+    http_client가 있으면 HTTP 폼 제출 우선, 실패한 성명만 브라우저 하나(시도 선택 유지)로 다시 검색.
+    브라우저는 처음 필요할 때 띄운다.
+    """
+    tag = f"S{shard} " if shard else ""
+    t0 = time.perf_counter()
+    failures = []
+    chrome = None
+    via_http = 0
+    try:
+        for i, nm in enumerate(names, 1):
+            keys, from_http = None, False
+            if http_client is not None:
+                keys, reason = search_name_keys_http(http_client, nm, sido=sido)
+                from_http = keys is not None
+                via_http += from_http
+            if keys is None:
+                if chrome is None:
+                    chrome = ManagedChrome(
+                        headless=headless, max_pages=max_searches_per_driver,
+                        on_start=lambda drv: _start_player_search(drv, sido),
+                    )
+                chrome.maybe_recycle()
+                chrome.tick()
+                keys, reason = search_name_keys(
+                    chrome.driver, nm, open_timeout=open_timeout, table_timeout=table_timeout, sido=sido,
+                )
+                if keys is None:
+                    chrome.check()  # search_name_keys가 예외를 삼키므로 세션이 죽었는지 따로 확인
+            index[nm] = keys
+            if keys is None:
+                failures.append((nm, reason))
+            elif cache is not None and (keys or not from_http):
+                # HTTP 빈 결과는 저장하지 않음(브라우저로 확인한 빈 결과만 저장)
+                cache.put(_cache_key(sido, nm), keys)
+            if log:
+                result = f"FAIL ({reason})" if keys is None else f"결과 {len(keys)}건"
+                print(f"[{tag}{i:>4}/{len(names)}] 조회요청 | 성명={nm} … {result}", flush=True)
+    except Exception as e:
+        # 브라우저 기동/시도 선택 실패 등으로 샤드가 멈추면 남은 성명은 실패 처리
+        reason = f"샤드 중단: {type(e).__name__}: {str(e)[:120]}"
+        for nm in names:
+            if nm not in index:
+                index[nm] = None
+                failures.append((nm, reason))
+    finally:
+        restarts = chrome.restarts if chrome is not None else 0
+        if chrome is not None:
+            chrome.quit()
+    return {
+        "shard": shard, "names": len(names), "failures": failures, "http": via_http,
+        "elapsed_s": round(time.perf_counter() - t0, 1), "restarts": restarts,
+    }
+
+
+def _print_shard_report(reports):
+    for r in reports:
+        rate = r["names"] / r["elapsed_s"] if r["elapsed_s"] else 0
+        print(
+            f"[SHARD{' S' + str(r['shard']) if r['shard'] else ''}] 성명 {r['names']} | HTTP {r['http']} | "
+            f"실패 {len(r['failures'])} | "
+            f"{r['elapsed_s']}s ({rate:.2f}건/s) | 재시작 {r['restarts']}",
+            flush=True,
+        )
+    failures = [f for r in reports for f in r["failures"]]
+    for nm, reason in failures[:20]:
+        print(f"  - 실패 {nm}: {reason}", flush=True)
+    if len(failures) > 20:
+        print(f"  … 외 {len(failures) - 20}건", flush=True)
 
 
-# ===== 메인: 진위확인(전남+성명만으로 검색) =====
 def attach_truth_flag_fast(
     df,
     sport_col="경기부문",
@@ -232,80 +413,79 @@ def attach_truth_flag_fast(
     headless=True,
     open_timeout=8,
     table_timeout=15,
-    poll=0.2,
     log=True,
+    max_searches_per_driver=300,  # 검색 N건마다(또는 JS 힙이 커지면) 브라우저 새로 띄움
+    cache=None,                   # LookupCache/경로: 성명별 검색 결과 저장(재실행 시 검색 생략)
+    workers=1,                    # 브라우저 수. 2 이상이면 검색할 성명을 나눠(샤드) 병렬 검색
+    http_client=None,             # MeetHttpClient: 폼 POST로 먼저 검색, 실패 시 브라우저
+    sido=JEONNAM,                 # 검색할 시도(Sido/코드/이름)
 ):
     """
-    시도=전남만 선택하고 성명만 입력해서 검색 → 결과표에서 (종목/종별/성명) 일치 여부 확인.
-    '진위확인' 0/1 컬럼 추가해 반환.
+    시도 하나만 선택하고 성명만 입력해서 검색 → 결과표에서 (종목/종별/성명) 일치 여부 확인.
+    같은 성명은 한 번만 검색하고, 결과표 전체를 (종목, 종별, 성명) 키로 만들어 그 성명의 모든 행을 판정한다.
+    workers>1이면 성명을 workers개 샤드로 나눠 브라우저마다(각자 시도 선택 유지) 검색한 뒤 합친다.
+    http_client가 있으면 성명마다 HTTP 검색을 먼저 하고, 결과표를 못 받은 성명만 브라우저로 검색한다.
+    '진위확인' 0/1 컬럼 추가해 원래 행 순서대로 반환.
     """
-    driver = setup_driver(headless=headless)
-    try:
-        open_player_search(driver)
-        # 최초 1회 전남 세팅
-        if not ensure_sido_is_jeonnam(driver):
-            raise RuntimeError("시/도 '전남' 선택 실패")
-
-        truth = []
-        n = len(df)
-
-        for idx, row in df.iterrows():
-            sport = row[sport_col]
-            kind = row[kind_col]
-            name = row[name_col]
-
-            # --- 로그 프리픽스
-            if log:
-                print(
-                    f"[{idx+1:>4}/{n}] 조회요청 | 종목={sport} | 종별={kind} | 성명={name} … ",
-                    end="",
-                    flush=True,
-                )
-
-            try:
-                # 혹시 페이지 리셋되면 전남 다시 확인
-                ensure_sido_is_jeonnam(driver)
-
-                set_name_input(driver, name)
-                click_search(driver)
-
-                soup = wait_result_table_soup(
-                    driver,
-                    open_timeout=open_timeout,
-                    table_timeout=table_timeout,
-                    poll=poll,
-                )
-                if soup is None:
-                    truth.append(0)
-                    if log:
-                        print("FAIL (결과표 미등장/타임아웃)")
-                    continue
-
-                ok = any_row_matches_by_skn(soup, sport, kind, name)
-                truth.append(1 if ok else 0)
-                if log:
-                    print("OK" if ok else "NO MATCH")
-
-            except JavascriptException as e:
-                truth.append(0)
-                if log:
-                    print(f"FAIL (JS 예외: {str(e)[:120]})")
-            except TimeoutException as e:
-                truth.append(0)
-                if log:
-                    print(f"FAIL (대기 타임아웃: {str(e)[:120]})")
-            except Exception as e:
-                truth.append(0)
-                if log:
-                    print(f"FAIL (예외: {type(e).__name__}: {str(e)[:120]})")
-
-        out = df.copy()
-        out["진위확인"] = truth
-        return out
-    finally:
-        driver.quit()
+    sido = regions.get(sido)
+    cache = LookupCache.open(cache)
+    names = df[name_col].map(_normalize)
+    distinct = [nm for nm in dict.fromkeys(names) if nm]
+
+    index = {}  # 성명 → 키 집합(검색 실패면 None)
+    todo = []
+    for nm in distinct:
+        hit = cache.get(_cache_key(sido, nm)) if cache is not None else None
+        if hit is None:
+            todo.append(nm)
+        else:
+            index[nm] = hit
+    if log:
+        print(f"[VALIDATE] 행 {len(df)} | 성명 {len(distinct)}개 | 캐시 {len(index)}개 | 검색 {len(todo)}개", flush=True)
+
+    opts = dict(
+        index=index, cache=cache, log=log, headless=headless, open_timeout=open_timeout,
+        table_timeout=table_timeout, max_searches_per_driver=max_searches_per_driver, http_client=http_client,
+        sido=sido,
+    )
+    workers = max(1, min(int(workers or 1), len(todo)))
+    if workers > 1:
+        # 라운드로빈으로 나눠 샤드별 성명 수를 맞춘다(샤드마다 브라우저 하나)
+        shards = [todo[i::workers] for i in range(workers)]
+        if log:
+            print(f"[VALIDATE] 샤드 {workers}개 | 샤드당 성명 {len(shards[-1])}~{len(shards[0])}개", flush=True)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(_search_shard, i + 1, names_, **opts) for i, names_ in enumerate(shards)]
+            reports = [f.result() for f in futures]
+        if log:
+            _print_shard_report(reports)
+    elif todo:
+        report = _search_shard(0, todo, **opts)
+        if log and report["failures"]:
+            _print_shard_report([report])
+
+    truth = []
+    for (_, row), nm in zip(df.iterrows(), names):
+        keys = index.get(nm)
+        key = (_normalize(row[sport_col]), _normalize(row[kind_col]), nm)
+        truth.append(1 if keys and key in keys else 0)
+    if log:
+        failed = sum(1 for nm in names if nm and index.get(nm) is None)
+        print(f"[VALIDATE] 일치 {sum(truth)} | 불일치 {len(truth) - sum(truth) - failed} | 검색 실패 {failed}", flush=True)
+
+    out = df.copy()
+    out["진위확인"] = truth
+    return out
 
 if __name__ == "__main__":
+    # MEET_HTTP=0 이면 브라우저만 사용, MEET_RECORD=폴더 이면 응답을 replay_server용으로 저장
+    # MEET_SIDO=경북 → 다른 시도로 검색(기본 전남)
+    sido = regions.get(os.environ.get("MEET_SIDO") or JEONNAM)
+    # MEET_ADAPTIVE=0 이면 HTTP 검색도 고정 타임아웃(그 외에는 관측 p95 타임아웃 + 과부하 시 동시 요청 감소)
+    sched = None if os.environ.get("MEET_ADAPTIVE") == "0" else AdaptiveScheduler(max_concurrency=4)
+    http = None if os.environ.get("MEET_HTTP") == "0" else MeetHttpClient(
+        record_dir=os.environ.get("MEET_RECORD") or None, scheduler=sched,
+    )
     df = pd.read_excel(
         "선수참가현황검증.xlsx",
         sheet_name="학생선수 참가 명단",
@@ -324,7 +504,12 @@ if __name__ == "__main__":
         headless=True,
         open_timeout=8,
         table_timeout=15,
-        poll=0.2,  # 필요하면 늘리면 됨
         log=True,
+        cache="player_lookup.cache.sqlite",  # 재실행 시 이미 검색한 성명은 건너뜀
+        workers=4,                           # 브라우저 4개로 성명 나눠 검색
+        http_client=http,                    # HTTP 우선, 실패 시 브라우저
+        sido=sido,
     )
-    checked.to_excel("전남_성명검증_결과.xlsx", index=False)
\ No newline at end of file
+    if http is not None:
+        http.close()
+    checked.to_excel(f"{sido.name}_성명검증_결과.xlsx", index=False)
\ No newline at end of file
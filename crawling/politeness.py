@@ -0,0 +1,285 @@
+"""
+적응형 요청 스케줄러: 엔드포인트별 응답 시간/실패율을 재서 타임아웃, 동시 요청 수, 재시도 간격을 스스로 맞춘다.
+
+    sched = AdaptiveScheduler(max_concurrency=4)
+    with sched.slot("side_panel") as call:           # 허용 동시 수(AIMD) 안에서만 진행, 차단 중이면 대기
+        t = sched.timeout("side_open", 20)           # 최근 p95 × 2 (표본이 모자라면 20)
+        ...
+        sched.observe("side_open", elapsed, ok)      # 구간 하나만 따로 잴 때
+        call.fail("timeout")                         # 시간 초과/과부하(HTTP 429·5xx) → 동시 수 절반
+    sched.backoff("side_panel", attempt)             # 재시도 전 지수 백오프(지터 포함)
+
+- 타임아웃: 엔드포인트마다 최근 window개 소요 시간의 p95 × timeout_mult. 시간 초과는 그때 쓴 타임아웃 값을
+  표본으로 넣으므로, 사이트가 빠르면 짧아지고 시간 초과가 이어지면 다시 늘어난다. 기본값 × [min_factor, max_factor]로 자른다.
+- 동시 수(AIMD): 성공마다 +1/현재값(대략 한 바퀴 돌 때마다 +1), 시간 초과/과부하면 × decrease(cooldown_s 안에서는 1회만).
+  같은 서버를 치므로 브라우저/HTTP 모두 사이트 전체에 하나를 쓴다. slot은 재진입 불가(안에서 다시 slot을 잡지 말 것).
+  여러 프로세스가 같은 사이트를 칠 때(crawl_regions.py)는 shared(프로세스 사이 세마포어)로 전체 동시 수 상한을 함께 건다.
+- 회로 차단기: 한 엔드포인트가 연속 breaker_failures번 실패하면 open_s 동안 막는다(다시 열릴 때마다 2배, 최대 max_open_s).
+  시간이 지나면 요청 하나만 시험(half-open)해서 성공하면 닫고 실패하면 다시 막는다.
+  wait=False로 잡으면 막혀 있을 때 CircuitOpen을 바로 던진다(HTTP 경로 → 브라우저 폴백용).
+"""
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+from telemetry import percentile
+
+# 동시 수를 줄이는 실패 종류(서버가 느리거나 거절). 그 밖의 실패("error")는 차단기에만 센다
+SLOW_KINDS = ("timeout", "throttle")
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+def classify_http(status=None, exc=None):
+    """HTTP 응답 코드/예외 → "throttle"/"timeout"/"error" """
+    if status in (429, 503) or (status is not None and status >= 500):
+        return "throttle"
+    if exc is not None and "Timeout" in type(exc).__name__:
+        return "timeout"
+    return "error"
+
+
+class EndpointStats:
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)  # (소요 초, 성공 여부)
+        self.n = 0
+        self.failures = 0
+        self.consecutive = 0
+        self.state = "closed"                # closed / open / half_open
+        self.open_until = 0.0
+        self.trips = 0
+        self.probing = False
+
+    def error_rate(self):
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples) if self.samples else 0.0
+
+
+class Call:
+    def __init__(self):
+        self.kind = None
+
+    def fail(self, kind="error"):
+        """이 요청을 실패로 기록(kind: "timeout"/"throttle"/"error")"""
+        self.kind = kind
+
+
+def maybe_slot(scheduler, name, wait=True):
+    """scheduler가 None이면 아무 일도 하지 않는 slot(호출부에서 분기 없이 쓰도록)"""
+    return scheduler.slot(name, wait) if scheduler is not None else nullcontext(Call())
+
+
+class AdaptiveScheduler:
+    def __init__(
+        self,
+        max_concurrency=4,
+        min_concurrency=1,
+        initial_concurrency=None,  # 기본: max의 절반에서 시작해 늘려 감
+        window=200,                # 엔드포인트별 최근 표본 수
+        min_samples=10,            # 이보다 적으면 기본 타임아웃 사용
+        timeout_pct=95,
+        timeout_mult=2.0,
+        min_timeout=1.0,
+        min_factor=0.1,            # 타임아웃 하한 = max(min_timeout, 기본값 × min_factor)
+        max_factor=2.0,            # 타임아웃 상한 = 기본값 × max_factor
+        decrease=0.5,
+        cooldown_s=2.0,            # 동시 수 감소 후 이 시간 동안은 다시 줄이지 않음
+        breaker_failures=8,
+        open_s=10.0,
+        max_open_s=300.0,
+        backoff_base=0.3,
+        backoff_max=30.0,
+        shared=None,               # acquire()/release() 세마포어(multiprocessing Manager 등): 프로세스 합계 상한
+        log=True,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        start = initial_concurrency or max(self.min_concurrency, self.max_concurrency // 2)
+        self.limit = float(min(max(start, self.min_concurrency), self.max_concurrency))
+        self.window = window
+        self.min_samples = min_samples
+        self.timeout_pct = timeout_pct
+        self.timeout_mult = timeout_mult
+        self.min_timeout = min_timeout
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.decrease = decrease
+        self.cooldown_s = cooldown_s
+        self.breaker_failures = breaker_failures
+        self.open_s = open_s
+        self.max_open_s = max_open_s
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.shared = shared
+        self.log = log
+
+        self.inflight = 0
+        self.limit_low = self.limit
+        self.limit_high = self.limit
+        self.decreases = 0
+        self.wait_s = 0.0
+        self._last_decrease = 0.0
+        self._stats = {}
+        self._cond = threading.Condition()
+
+    def _ep(self, name):
+        st = self._stats.get(name)
+        if st is None:
+            st = self._stats[name] = EndpointStats(self.window)
+        return st
+
+    # ---------- 타임아웃/대기 ----------
+    def timeout(self, name, default):
+        """최근 소요 시간 p95 × timeout_mult → [하한, default × max_factor]. 표본이 모자라면 default"""
+        with self._cond:
+            st = self._stats.get(name)
+            values = [s for s, _ in st.samples] if st is not None else []
+        if len(values) < self.min_samples:
+            return default
+        t = percentile(values, self.timeout_pct) * self.timeout_mult
+        floor = max(self.min_timeout, default * self.min_factor)
+        return round(min(max(t, floor), default * self.max_factor), 2)
+
+    def settle(self, name, default):
+        """클릭 직후 고정 정지: 최근 실패가 없으면 0, 실패율이 10%를 넘으면 default"""
+        with self._cond:
+            st = self._stats.get(name)
+            degraded = st is not None and st.error_rate() > 0.1
+        return default if degraded else 0.0
+
+    def backoff(self, name, attempt, sleep=True):
+        """재시도 전 대기: backoff_base × 2^(attempt-1)까지 무작위(full jitter). 차단 중이면 풀릴 때까지"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** max(0, attempt - 1)))
+        with self._cond:
+            st = self._stats.get(name)
+            if st is not None and st.state == "open":
+                delay = max(delay, st.open_until - time.monotonic())
+        if sleep and delay > 0:
+            time.sleep(delay)
+        return delay
+
+    # ---------- 동시 수 + 차단기 ----------
+    def _admit(self, st, wait):
+        """차단기 확인(호출 시 self._cond 보유). 들어가도 되면 True, 시험 요청이면 st.probing"""
+        while True:
+            now = time.monotonic()
+            if st.state == "open" and now >= st.open_until:
+                st.state = "half_open"
+            if st.state == "closed" or (st.state == "half_open" and not st.probing):
+                if st.state == "half_open":
+                    st.probing = True
+                return True
+            if not wait:
+                return False
+            self._cond.wait(timeout=max(0.05, st.open_until - now) if st.state == "open" else 0.5)
+
+    @contextmanager
+    def slot(self, name, wait=True):
+        """허용 동시 수 안에서 요청 하나 실행. 예외가 나거나 call.fail()을 부르면 실패로 기록"""
+        t_wait = time.perf_counter()
+        with self._cond:
+            st = self._ep(name)
+            if not self._admit(st, wait):
+                raise CircuitOpen(f"{name}: 회로 차단 중({st.open_until - time.monotonic():.0f}s 남음)")
+            probe = st.state == "half_open"
+            while self.inflight >= int(self.limit):
+                self._cond.wait(timeout=0.5)
+            self.inflight += 1
+            self.wait_s += time.perf_counter() - t_wait
+        call = Call()
+        held, shared_wait = False, 0.0
+        t0 = time.perf_counter()
+        try:
+            if self.shared is not None:
+                t_shared = time.perf_counter()
+                self.shared.acquire()  # 다른 프로세스 몫까지 합친 상한(로컬 동시 수 안에서 잡음)
+                held = True
+                shared_wait = time.perf_counter() - t_shared
+                t0 = time.perf_counter()  # 소요 시간에는 전역 대기를 넣지 않음(타임아웃 계산용)
+            yield call
+        except BaseException:
+            if call.kind is None:
+                call.fail("error")
+            raise
+        finally:
+            if held:
+                self.shared.release()
+            with self._cond:
+                self.wait_s += shared_wait
+                self.inflight -= 1
+                if probe:
+                    st.probing = False
+                self._record(name, time.perf_counter() - t0, call.kind)
+                self._cond.notify_all()
+
+    def observe(self, name, seconds, ok=True, kind=None):
+        """slot 안의 구간 하나의 소요 시간만 기록(타임아웃 계산용, 동시 수/차단기는 slot 결과로만 움직임)"""
+        with self._cond:
+            self._record(name, seconds, None if ok else (kind or "timeout"), control=False)
+
+    def _record(self, name, seconds, kind, control=True):
+        st = self._ep(name)
+        ok = kind is None
+        st.samples.append((seconds, ok))
+        st.n += 1
+        if not ok:
+            st.failures += 1
+        if not control:
+            return
+        now = time.monotonic()
+        if ok:
+            st.consecutive = 0
+            if st.state != "closed":
+                st.state = "closed"
+                if self.log:
+                    print(f"[POLITE] {name} 차단 해제", flush=True)
+            self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+        else:
+            st.consecutive += 1
+            if kind in SLOW_KINDS and now - self._last_decrease >= self.cooldown_s:
+                self._last_decrease = now
+                self.decreases += 1
+                self.limit = max(self.min_concurrency, self.limit * self.decrease)
+                if self.log:
+                    print(f"[POLITE] {name} {kind} → 동시 {int(self.limit)}", flush=True)
+            if st.state == "half_open" or st.consecutive >= self.breaker_failures:
+                if st.state != "open":
+                    st.trips += 1
+                st.state = "open"
+                st.open_until = now + min(self.max_open_s, self.open_s * 2 ** (st.trips - 1))
+                st.consecutive = 0
+                if self.log:
+                    print(f"[POLITE] {name} 연속 실패 → {st.open_until - now:.0f}s 차단({st.trips}회째)", flush=True)
+        self.limit_low = min(self.limit_low, self.limit)
+        self.limit_high = max(self.limit_high, self.limit)
+
+    # ---------- 요약 ----------
+    def report(self):
+        with self._cond:
+            endpoints = {}
+            for name, st in self._stats.items():
+                values = [s for s, _ in st.samples]
+                endpoints[name] = {
+                    "n": st.n, "failures": st.failures, "error_rate": round(st.error_rate(), 3),
+                    "p50_s": round(percentile(values, 50), 2) if values else None,
+                    "p95_s": round(percentile(values, 95), 2) if values else None,
+                    "state": st.state, "trips": st.trips,
+                }
+            return {
+                "limit": round(self.limit, 2), "limit_low": round(self.limit_low, 2),
+                "limit_high": round(self.limit_high, 2), "max": self.max_concurrency,
+                "decreases": self.decreases, "wait_s": round(self.wait_s, 1), "endpoints": endpoints,
+            }
+
+
+def print_report(report):
+    print(f"\n[POLITE] 동시 {report['limit']} (범위 {report['limit_low']}~{report['limit_high']}/{report['max']}) | "
+          f"감소 {report['decreases']}회 | 슬롯 대기 누적 {report['wait_s']}s")
+    for name, e in report["endpoints"].items():
+        p50 = f"{e['p50_s']:.2f}" if e["p50_s"] is not None else "-"
+        p95 = f"{e['p95_s']:.2f}" if e["p95_s"] is not None else "-"
+        print(f"{name:>16} {e['n']:>6}건 | 실패 {e['failures']:>4} ({e['error_rate']:.0%}) | "
+              f"p50 {p50}s p95 {p95}s | {e['state']}{' 차단 ' + str(e['trips']) + '회' if e['trips'] else ''}")
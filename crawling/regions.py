@@ -0,0 +1,67 @@
+"""
+시·도 목록과 시도별(파티션) 산출물 경로.
+
+사이트의 시도 선택 목록(ul#sidoCdList)은 li onclick="getGmDtList('코드','이름')" 형태이고,
+코드는 전국체전 시도 순번(전남=13)이다. 크롤러/DB 생성 함수는 sido(Sido 또는 코드/이름/슬러그)를
+받아 화면 선택, HTTP 폼, 파일 이름을 정한다. 기본값은 전남.
+
+    sido = get("경북")                                     # Sido(code='14', name='경북', slug='gyeongbuk')
+    region_path(sido, "schedule_matches")                   # gyeongbuk_schedule_matches.csv
+    region_path(JEONNAM, "bracket_matches", out_dir="regions")  # regions/jeonnam_bracket_matches.csv
+
+전남 경로는 기존 파일 이름(jeonnam_*.csv)과 같다.
+"""
+import os
+from collections import namedtuple
+
+Sido = namedtuple("Sido", "code name slug")
+
+SIDOS = (
+    Sido("01", "서울", "seoul"),
+    Sido("02", "부산", "busan"),
+    Sido("03", "대구", "daegu"),
+    Sido("04", "인천", "incheon"),
+    Sido("05", "광주", "gwangju"),
+    Sido("06", "대전", "daejeon"),
+    Sido("07", "울산", "ulsan"),
+    Sido("08", "경기", "gyeonggi"),
+    Sido("09", "강원", "gangwon"),
+    Sido("10", "충북", "chungbuk"),
+    Sido("11", "충남", "chungnam"),
+    Sido("12", "전북", "jeonbuk"),
+    Sido("13", "전남", "jeonnam"),
+    Sido("14", "경북", "gyeongbuk"),
+    Sido("15", "경남", "gyeongnam"),
+    Sido("16", "제주", "jeju"),
+    Sido("17", "세종", "sejong"),
+)
+_BY_KEY = {k: s for s in SIDOS for k in (s.code, s.name, s.slug)}
+
+# 시도별로 나눠 쓰는 데이터셋(기존 jeonnam_<이름>.csv)
+DATASETS = ("schedule_matches", "bracket_matches", "schedule_tournament", "bracket_tournament")
+
+
+def get(sido):
+    """Sido/코드('13')/이름('전남')/슬러그('jeonnam') → Sido"""
+    if isinstance(sido, Sido):
+        return sido
+    key = str(sido).strip()
+    if key not in _BY_KEY:
+        raise ValueError(f"알 수 없는 시도: {sido} (가능: {', '.join(s.name for s in SIDOS)})")
+    return _BY_KEY[key]
+
+
+def parse_list(spec):
+    """"all" 또는 "전남,경북,14" → [Sido, ...] (순서 유지, 중복 제거)"""
+    if not spec or str(spec).strip().lower() == "all":
+        return list(SIDOS)
+    out = [get(part) for part in str(spec).split(",") if part.strip()]
+    return list(dict.fromkeys(out))
+
+
+def region_path(sido, dataset, out_dir=".", ext=".csv"):
+    name = f"{get(sido).slug}_{dataset}{ext}"
+    return name if out_dir in (None, "", ".") else os.path.join(out_dir, name)
+
+
+JEONNAM = get("전남")
@@ -0,0 +1,263 @@
+"""
+녹화한 응답을 그대로 돌려주는 로컬 스텁 서버(지연/장애 주입, 프록시 녹화 포함).
+
+MeetHttpClient(record_dir=...)로 실제 사이트를 한 번 호출하면 요청별 응답이
+fixtures 폴더에 저장되고, 이 서버가 같은 (메서드, 경로, 폼) 요청에 같은 응답을 돌려준다.
+브라우저 경로(scheduleT.do/scheduleR.do/player.do 화면, JS/CSS 포함)는 --upstream 프록시 모드로
+크롤러를 한 번 돌려 녹화한다(없는 fixture만 원본 사이트에서 받아 저장).
+
+    python replay_server.py --fixtures fixtures --upstream https://meet.sports.or.kr   # 녹화
+    python replay_server.py --fixtures fixtures --latency-ms 120 --jitter-ms 80 --faults alert=0.02,stale=0.05
+    MEET_BASE_URL=http://127.0.0.1:8765 python sido_record_match_crawling.py
+
+장애 주입(HTML 응답에만, 비율 0~1)
+    alert  본문 끝에 alert() 스크립트 삽입(경고창)
+    stale  같은 경로로 직전에 보낸 응답을 다시 보냄(이전 경기 패널이 그대로 남은 상황)
+    empty  모든 <tbody>를 '데이터가 없습니다' 한 줄로 교체
+    error  HTTP 500
+주입 여부는 (seed, 요청 키, 같은 키의 n번째 요청)으로 정해지므로 스레드 순서와 관계없이 재현된다.
+GET /__stats 로 적중/미적중/주입 횟수를 JSON으로 확인한다.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+INDEX_FILE = "index.json"
+FAULT_KINDS = ("alert", "stale", "empty", "error")
+EMPTY_TBODY = '<tbody><tr><td class="nodata" colspan="20">데이터가 없습니다.</td></tr></tbody>'.encode("utf-8")
+ALERT_SCRIPT = "<script>alert('잠시 후 다시 시도하세요.');</script>".encode("utf-8")
+_TBODY_RE = re.compile(rb"<tbody\b[^>]*>.*?</tbody>", re.S | re.I)
+# 프록시로 전달할 요청 헤더(나머지는 버림)
+_FORWARD_HEADERS = ("Content-Type", "Cookie", "X-Requested-With", "Accept", "Accept-Language", "User-Agent")
+
+
+def fixture_key(method, path, body=None):
+    """(메서드, 경로+쿼리, 폼) → 정규화된 키. 폼/쿼리 항목 순서는 무시."""
+    parts = urlsplit(path)
+    query = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    if isinstance(body, (bytes, bytearray)):
+        body = body.decode("utf-8", "replace")
+    if isinstance(body, dict):
+        form = sorted((str(k), str(v)) for k, v in body.items())
+    else:
+        form = sorted(parse_qsl(body or "", keep_blank_values=True))
+    return f"{method.upper()} {parts.path}?{urlencode(query)}#{urlencode(form)}"
+
+
+class FixtureStore:
+    """fixtures 폴더: index.json(키 → 파일/상태/콘텐츠 타입) + 응답 본문 파일들"""
+
+    def __init__(self, root):
+        self.root = root
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        path = os.path.join(root, INDEX_FILE)
+        self.index = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def save(self, key, body, status=200, content_type="text/html; charset=utf-8"):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16] + ".bin"
+        with self._lock:
+            with open(os.path.join(self.root, name), "wb") as f:
+                f.write(body)
+            self.index[key] = {"file": name, "status": status, "content_type": content_type}
+            with open(os.path.join(self.root, INDEX_FILE), "w", encoding="utf-8") as f:
+                json.dump(self.index, f, ensure_ascii=False, indent=1)
+
+    def load(self, key):
+        entry = self.index.get(key)
+        if not entry:
+            return None
+        with open(os.path.join(self.root, entry["file"]), "rb") as f:
+            return entry["status"], entry["content_type"], f.read()
+
+
+class Faults:
+    """응답 지연 + 장애 주입 설정. rates: {"alert": 0.02, ...}, paths: 주입 대상 경로 부분 문자열(None이면 전부)"""
+
+    def __init__(self, latency_ms=0, jitter_ms=0, rates=None, paths=None, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rates = {k: float(v) for k, v in (rates or {}).items() if k in FAULT_KINDS and float(v) > 0}
+        self.paths = tuple(paths or ())
+        self.seed = seed
+        self._seen = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec, **kw):
+        """"alert=0.02,stale=0.05" → Faults"""
+        rates = {}
+        for part in filter(None, (spec or "").split(",")):
+            k, _, v = part.partition("=")
+            if k.strip() not in FAULT_KINDS:
+                raise ValueError(f"알 수 없는 장애 종류: {k} (가능: {', '.join(FAULT_KINDS)})")
+            rates[k.strip()] = float(v or 0)
+        return cls(rates=rates, **kw)
+
+    def plan(self, key, path):
+        """(지연 초, 장애 종류 또는 None). 같은 키의 n번째 요청이면 항상 같은 결과"""
+        with self._lock:
+            self._seen[key] += 1
+            nth = self._seen[key]
+        rng = random.Random(f"{self.seed}|{key}|{nth}")
+        delay = max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+        fault = None
+        if self.rates and (not self.paths or any(p in path for p in self.paths)):
+            roll = rng.random()
+            for kind in FAULT_KINDS:
+                rate = self.rates.get(kind, 0)
+                if roll < rate:
+                    fault = kind
+                    break
+                roll -= rate
+        return delay, fault
+
+
+def _inject(fault, payload, last):
+    if fault == "alert":
+        i = payload.lower().rfind(b"</body>")
+        return payload[:i] + ALERT_SCRIPT + payload[i:] if i >= 0 else payload + ALERT_SCRIPT
+    if fault == "empty":
+        return _TBODY_RE.sub(EMPTY_TBODY, payload)
+    if fault == "stale":
+        return last if last is not None else payload
+    return payload
+
+
+def _proxy(upstream, method, path, body, headers):
+    """원본 사이트로 그대로 전달 → (status, content_type, payload, set_cookies)"""
+    req = urllib.request.Request(upstream + path, data=body if method == "POST" else None, method=method)
+    for h in _FORWARD_HEADERS:
+        if headers.get(h):
+            req.add_header(h, headers[h])
+    try:
+        with urllib.request.urlopen(req, timeout=30) as r:
+            return r.status, r.headers.get("Content-Type", ""), r.read(), r.headers.get_all("Set-Cookie") or []
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("Content-Type", ""), e.read(), []
+
+
+def make_handler(store, faults=None, upstream=None):
+    faults = faults or Faults()
+    upstream = upstream.rstrip("/") if upstream else None
+    stats = Counter()
+    last_by_path = {}
+    lock = threading.Lock()
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        def _send(self, status, content_type, payload, cookies=()):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type or "application/octet-stream")
+            self.send_header("Content-Length", str(len(payload)))
+            for c in cookies:
+                self.send_header("Set-Cookie", c)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _serve(self, body=None):
+            if self.path == "/__stats":
+                with lock:
+                    snapshot = dict(stats)
+                self._send(200, "application/json", json.dumps(snapshot).encode("utf-8"))
+                return
+            key = fixture_key(self.command, self.path, body)
+            hit = store.load(key)
+            cookies = ()
+            if hit is None and upstream:
+                status, content_type, payload, cookies = _proxy(upstream, self.command, self.path, body, self.headers)
+                if "html" in content_type or "javascript" in content_type:
+                    payload = payload.replace(upstream.encode("utf-8"), b"")  # 절대 경로도 재생 서버로
+                if status == 200:
+                    store.save(key, payload, status=status, content_type=content_type)
+                with lock:
+                    stats["recorded"] += 1
+                hit = (status, content_type, payload)
+            if hit is None:
+                with lock:
+                    stats["miss"] += 1
+                self.send_error(404, "no fixture")
+                return
+
+            status, content_type, payload = hit
+            path = urlsplit(self.path).path
+            delay, fault = faults.plan(key, path)
+            if delay:
+                time.sleep(delay)
+            if "html" not in (content_type or ""):
+                fault = None
+            with lock:
+                stats["hit"] += 1
+                last = last_by_path.get(path)
+                if content_type and "html" in content_type:
+                    last_by_path[path] = payload
+                if fault:
+                    stats[fault] += 1
+            if fault == "error":
+                self.send_error(500, "injected")
+                return
+            self._send(status, content_type, _inject(fault, payload, last), cookies)
+
+        def do_GET(self):
+            self._serve()
+
+        def do_POST(self):
+            n = int(self.headers.get("Content-Length") or 0)
+            self._serve(self.rfile.read(n) if n else b"")
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return ReplayHandler
+
+
+def serve(fixtures, host="127.0.0.1", port=8765, faults=None, upstream=None):
+    """백그라운드 스레드로 서버 시작 → (server, base_url). 끝나면 server.shutdown()."""
+    server = ThreadingHTTPServer((host, port), make_handler(FixtureStore(fixtures), faults, upstream))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def fetch_stats(base_url):
+    with urllib.request.urlopen(base_url + "/__stats", timeout=5) as r:
+        return json.load(r)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="녹화 응답 재생 서버")
+    parser.add_argument("--fixtures", default="fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--upstream", help="없는 fixture를 이 사이트에서 받아 녹화(예: https://meet.sports.or.kr)")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--faults", default="", help="예: alert=0.02,stale=0.05,empty=0.02,error=0.01")
+    parser.add_argument("--fault-paths", default="", help="주입 대상 경로(쉼표 구분, 부분 일치). 비우면 전체 HTML")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    store = FixtureStore(args.fixtures)
+    faults = Faults.parse(
+        args.faults, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        paths=[p for p in args.fault_paths.split(",") if p], seed=args.seed,
+    )
+    httpd = ThreadingHTTPServer((args.host, args.port), make_handler(store, faults, args.upstream))
+    mode = f" | 녹화 ← {args.upstream}" if args.upstream else ""
+    print(f"[REPLAY] http://{args.host}:{args.port} | fixtures={args.fixtures} ({len(store.index)}건){mode}")
+    if args.latency_ms or faults.rates:
+        print(f"[REPLAY] 지연 {args.latency_ms:.0f}±{args.jitter_ms:.0f}ms | 장애 {faults.rates or '-'} | seed={args.seed}")
+    httpd.serve_forever()
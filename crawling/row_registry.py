@@ -0,0 +1,76 @@
+"""
+경기 행 핸들 캐시.
+
+화면(일자/종목 검색 결과)을 연 뒤 경기 행(<tr>)을 한 번만 찾아 두고, 각 행의 openSide(...) 인자로
+식별자를 붙인다. 경기마다 표 전체를 XPath로 다시 훑지 않고, 사이드 패널은 식별자로 바로 연다.
+행 요소와 행 메타데이터(라벨 값/종목 라벨)는 dom.schedule_rows로 execute_script 1회에 함께 받는다.
+
+    reg = RowRegistry(driver, SCHEDULE_CAPTION)     # 화면 로딩 직후 1회
+    i = reg.index_of(side_call, fallback=row_index)  # 저장해 둔 openSide 호출(없으면 화면 순번)
+    reg.open(i)                                      # openSide 직접 호출, 실패 시 행 클릭
+
+행 요소가 다시 그려지면(StaleElement) 그때만 refresh()로 다시 찾는다.
+"""
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException
+
+from dom import schedule_rows
+from http_client import parse_js_call
+
+
+def row_key(call):
+    """"openSide('1','A',3);" → ('1', 'A', '3'). openSide 호출이 아니면 None"""
+    fn, args = parse_js_call(call or "")
+    if not fn or not fn.endswith("openSide"):
+        return None
+    return tuple(args)
+
+
+class RowRegistry:
+    def __init__(self, driver, caption):
+        self.driver = driver
+        self.caption = caption
+        self.resolves = 0
+        self.refresh()
+
+    def refresh(self):
+        self.items = schedule_rows(self.driver, self.caption)
+        self.rows = [it["el"] for it in self.items]
+        self.calls = [(it.get("call") or "").strip().rstrip(";") for it in self.items]
+        self.keys = [row_key(c) for c in self.calls]
+        self._by_key = {}
+        for i, k in enumerate(self.keys):
+            if k is not None:
+                self._by_key.setdefault(k, i)
+        self.resolves += 1
+        return self
+
+    def __len__(self):
+        return len(self.rows)
+
+    def index_of(self, side_call=None, fallback=None):
+        """openSide 호출(문자열/인자 튜플)로 행 번호를 찾고, 없으면 fallback(화면 순번)"""
+        key = side_call if isinstance(side_call, tuple) else row_key(side_call) if side_call else None
+        i = self._by_key.get(key) if key is not None else None
+        if i is None and fallback is not None and 0 <= fallback < len(self.rows):
+            i = fallback
+        return i
+
+    def open(self, i):
+        """i번째 행의 사이드 패널 열기. openSide를 직접 호출하고, 안 되면 행 첫 칸 클릭(stale이면 1회 재해석)"""
+        call = self.calls[i]
+        if call and row_key(call) is not None:
+            try:
+                self.driver.execute_script(call)
+                return
+            except JavascriptException:
+                pass
+        try:
+            self._click(i)
+        except StaleElementReferenceException:
+            self.refresh()
+            self._click(i)
+
+    def _click(self, i):
+        td = self.rows[i].find_element(By.XPATH, "./td[1]")
+        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'}); arguments[0].click();", td)
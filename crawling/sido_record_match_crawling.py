@@ -1,30 +1,47 @@
-import time, re
+import os, sys, time, re
+import queue
+import threading
 import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.alert import Alert
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, JavascriptException, UnexpectedAlertPresentException
-
-URL_R = "https://meet.sports.or.kr/national/schedule/scheduleR.do"
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, JavascriptException
+from http_client import BASE_URL, HttpFetchError, MeetHttpClient
+from driver_manager import DriverPool, LazyDriver, count_page
+from dom import SCHEDULE_STRAINER, SIDE_STRAINER, outer_html, parse_fragment, schedule_tables_html
+from html_cache import HtmlCache, page_filter
+from incremental import diff_schedule, merge_results, summarize
+from journal import CrawlJournal
+from pipeline import ParsePipeline
+from politeness import AdaptiveScheduler, maybe_slot, print_report as print_polite_report
+import regions
+from regions import JEONNAM, region_path
+from writers import ResultWriter, upsert
+from row_registry import RowRegistry
+import telemetry
+from waits import (
+    EMPTY_MARKERS, expand_list, mark_stale, set_page_size, wait_caption_table,
+    wait_rows_or_empty, wait_side_table,
+)
+
+URL_R = f"{BASE_URL}/national/schedule/scheduleR.do"
+SCHEDULE_CAPTION = "시·도 토너먼트 경기일정"
+SCHEDULE_ROWS_CSS = "table.tablesaw.tablesaw-stack tbody > tr"
+SIDE_CSS = "div.record-match-area, div.record"
+SCHEDULE_COLS = [
+    "로컬 PK","글로벌 PK","필터_일자","필터_종목코드","필터_종목명",
+    "종목정보","종별","세부종목","경기구분","상태","일시","경기장","시도","사이드_호출"
+]
+RECORD_COLS = [
+    "로컬 PK","글로벌 PK","필터_일자","필터_종목코드","필터_종목명",
+    "순위","시도","선수명","소속","학년","기록","신기록/비고"
+]
+LIST_PAGE_SIZE = 1000
+LOAD_MORE_XPATH = "//button[normalize-space()='더보기' or contains(.,'더보기')] | //a[normalize-space()='더보기' or contains(.,'더보기')]"
 
 # ================= 공통 =================
-def setup_driver(headless=True):
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1400,2400")
-    options.set_capability("unhandledPromptBehavior", "accept")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    return driver
-
 def accept_alert_if_present(driver, timeout=2):
     try:
         WebDriverWait(driver, timeout).until(EC.alert_is_present())
@@ -54,36 +71,27 @@ def _build_global_pk(sport, kind, subkind, matchtype):
     # 필요하면 슬래시 등 특수문자 치환을 넣어도 됨(현재는 normalize만)
     return f"{_normalize(sport)}_{_normalize(kind)}_{_normalize(subkind)}_{_normalize(matchtype)}"
 
-def click_load_more_if_exists(driver, max_clicks=30, per_click_pause=0.8):
-    wait_short = WebDriverWait(driver, 4)
-    clicks = 0
-    while clicks < max_clicks:
-        try:
-            more = wait_short.until(EC.element_to_be_clickable((
-                By.XPATH, "//button[normalize-space()='더보기' or contains(.,'더보기')] | //a[normalize-space()='더보기' or contains(.,'더보기')]"
-            )))
-            driver.execute_script("arguments[0].click();", more)
-            time.sleep(per_click_pause)  # ✅ 클릭마다 대기 시간 조절
-            clicks += 1
-        except Exception:
-            break
-    return clicks
+def click_load_more_if_exists(driver, max_clicks=30, grow_timeout=4):
+    """
+    '더보기'를 끝까지 펼친다(브라우저 안에서 클릭 → 행 증가 감지 → 다음 클릭, WebDriver 왕복 1회).
+    로드된 행 수와 '총 N건'을 비교해 출력하고 expand_list 결과 dict 반환
+    """
+    res = expand_list(driver, SCHEDULE_ROWS_CSS, LOAD_MORE_XPATH, max_clicks=max_clicks, grow_timeout=grow_timeout)
+    expected = res["expected"]
+    short = expected is not None and res["count"] < expected
+    print(f"  - [LIST] 행 {res['count']}/{expected if expected is not None else '?'} 로드 "
+          f"(더보기 {res['clicks']}회, {res['state']}){' ⚠ 덜 펼쳐짐' if short else ''}", flush=True)
+    return res
 
 def wait_tables(driver, timeout=45):
-    end = time.time() + timeout
-    while time.time() < end:
-        try:
-            if driver.find_elements(By.XPATH, "//table[.//caption[contains(normalize-space(),'시·도 토너먼트 경기일정')]]"):
-                return True
-        except UnexpectedAlertPresentException:
-            accept_all_alerts(driver)
-        time.sleep(0.5)
-    return False
-
-def wait_search_results(driver, appear_timeout=40, settle_pause=0.5):
+    """검색 결과 표(행 있음) 또는 빈 결과 표시가 뜨는 즉시 반환. 표가 있으면 True"""
+    res = wait_caption_table(driver, SCHEDULE_CAPTION, timeout=timeout)
+    return res["state"] == "ready"
+
+def wait_search_results(driver, appear_timeout=40, settle_pause=0):
     """
-    1) 결과 표가 나타날 때까지 대기
-    2) 표가 뜬 뒤 약간 더 대기(애니메이션/DOM 정착)
+    1) 결과 표가 나타날 때까지 대기(이벤트 기반, 빈 결과면 즉시 False)
+    2) settle_pause > 0 이면 표가 뜬 뒤 추가 대기(기본 0)
     """
     ok = wait_tables(driver, timeout=appear_timeout)
     if not ok:
@@ -94,29 +102,60 @@ def wait_search_results(driver, appear_timeout=40, settle_pause=0.5):
 
 
 # ================= 사이드(기록경기 2번째 표) =================
-def wait_record_panel_and_table(driver, open_timeout=15, table_timeout=20, poll=0.25):
+def wait_record_panel(driver, open_timeout=15, table_timeout=20, ev=None, scheduler=None):
     """
     1) 사이드 패널(scoreTop) 등장 대기
-    2) '기록경기' 두 번째 표가 생길 때까지 폴링
-    성공 시 해당 <table> BeautifulSoup 노드 반환, 실패 시 None
+    2) '기록경기' 두 번째 표에 행이 생기거나 빈 결과 표시가 뜨는 순간까지 대기(MutationObserver)
+    "ready"(행 있음) / "empty"(빈 결과) 반환, 시간 초과 시 None
+    scheduler가 있으면 두 구간 소요 시간을 side_open / record_table 로 기록(다음 타임아웃 계산용)
     """
+    ev = ev or telemetry.attempt(None)
+    t0 = time.perf_counter()
     try:
-        WebDriverWait(driver, open_timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.record-match-area .scoreTop, div.record .scoreTop"))
-        )
+        with ev.stage("panel_open"):
+            WebDriverWait(driver, open_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div.record-match-area .scoreTop, div.record .scoreTop"))
+            )
     except Exception:
+        if scheduler is not None:
+            scheduler.observe("side_open", time.perf_counter() - t0, ok=False)
         return None
+    t1 = time.perf_counter()
+    if scheduler is not None:
+        scheduler.observe("side_open", t1 - t0)
 
-    end = time.time() + table_timeout
-    while time.time() < end:
-        try:
-            target = _pick_second_record_table_fast(driver)
-            if target is not None:
-                return target
-        except UnexpectedAlertPresentException:
-            accept_all_alerts(driver)
-        time.sleep(poll)
-    return None
+    with ev.stage("table_ready"):
+        res = wait_side_table(driver, SIDE_CSS, "기록경기", pick=1, empty=EMPTY_MARKERS, timeout=table_timeout)
+    if scheduler is not None:
+        scheduler.observe("record_table", time.perf_counter() - t1, ok=res["state"] != "timeout")
+    return None if res["state"] == "timeout" else res["state"]
+
+
+def wait_record_panel_and_table(driver, open_timeout=15, table_timeout=20, ev=None, scheduler=None):
+    """
+    wait_record_panel 후 (해당 <table> BeautifulSoup 노드, 사이드 패널 outerHTML) 반환(파싱은 1회),
+    실패 시 (None, None). ev: telemetry 시도 객체(panel_open / table_ready / parse 구간 기록)
+    """
+    ev = ev or telemetry.attempt(None)
+    if wait_record_panel(driver, open_timeout, table_timeout, ev, scheduler) is None:
+        return None, None
+    with ev.stage("parse"):
+        return _pick_second_record_table_fast(driver)
+
+
+def _close_side_panel(driver, ev=None):
+    ev = ev or telemetry.attempt(None)
+    try:
+        with ev.stage("close"):
+            close_btn = WebDriverWait(driver, 5).until(
+                EC.element_to_be_clickable((By.XPATH, "//button[contains(@class,'closeBtn')]"))
+            )
+            driver.execute_script("arguments[0].click();", close_btn)
+            WebDriverWait(driver, 5).until(
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, "div.record-match-area, div.record"))
+            )
+    except TimeoutException:
+        pass
 
 
 def _cell_content(td):
@@ -124,13 +163,6 @@ def _cell_content(td):
     txt = span.get_text(" ", strip=True) if span else td.get_text(" ", strip=True)
     return _normalize(txt)
 
-def _cell_text_el(td_el):
-    try:
-        span = td_el.find_element(By.CSS_SELECTOR, "span.tablesaw-cell-content")
-        return _normalize(span.text)
-    except Exception:
-        return _normalize(td_el.text)
-
 def _get_sport_label_for(table):
     h5 = table.find_previous("h5", id="classNm")
     if not h5:
@@ -138,8 +170,9 @@ def _get_sport_label_for(table):
     return (h5.get_text(" ", strip=True) if h5 else "").strip()
 
 # ================= 초기 진입/필터 =================
-def open_jeonnam_only(driver):
-    print("[INIT] 페이지 오픈 및 전남 선택")
+def open_sido_only(driver, sido=JEONNAM):
+    sido = regions.get(sido)
+    print(f"[INIT] 페이지 오픈 및 {sido.name} 선택")
     wait = WebDriverWait(driver, 20)
     driver.get(URL_R)
 
@@ -151,38 +184,49 @@ def open_jeonnam_only(driver):
         btn = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(@class,'search-cities-provinces')]")))
         driver.execute_script("arguments[0].click();", btn)
 
-    # '전남' 클릭 → 일자 리스트 채워짐
+    # 시도 클릭 → 일자 리스트 채워짐
     try:
-        jeonnam_li = wait.until(EC.element_to_be_clickable((
-            By.XPATH, "//ul[@id='sidoCdList']//li[contains(@onclick, \"getGmDtList('13','전남')\")]"
+        sido_li = wait.until(EC.element_to_be_clickable((
+            By.XPATH, f"//ul[@id='sidoCdList']//li[contains(@onclick, \"getGmDtList('{sido.code}','{sido.name}')\")]"
         )))
-        driver.execute_script("arguments[0].click();", jeonnam_li)
+        driver.execute_script("arguments[0].click();", sido_li)
     except Exception:
-        jeonnam_li = wait.until(EC.element_to_be_clickable((
-            By.XPATH, "//ul[@id='sidoCdList']//li/a[normalize-space()='전남']/parent::li"
+        sido_li = wait.until(EC.element_to_be_clickable((
+            By.XPATH, f"//ul[@id='sidoCdList']//li/a[normalize-space()='{sido.name}']/parent::li"
         )))
-        driver.execute_script("arguments[0].click();", jeonnam_li)
+        # 이름으로만 찾았으면 코드가 다를 수 있음 → HTTP 폼(sidoCd)이 다른 시도를 받게 되므로 경고
+        print(f"  - [WARN] {sido.name} 코드 불일치 의심(onclick={sido_li.get_attribute('onclick')}) → regions.SIDOS 확인")
+        driver.execute_script("arguments[0].click();", sido_li)
 
     accept_all_alerts(driver)
-    print("  - 전남 선택 완료 (아직 '검색' 안 누름)")
+    print(f"  - {sido.name} 선택 완료 (아직 '검색' 안 누름)")
 
 def list_dates(driver):
     btn = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "gmDtBtn")))
     driver.execute_script("arguments[0].click();", btn)
-    time.sleep(0.2)
-    soup = BeautifulSoup(driver.page_source, "lxml")
+    wait_rows_or_empty(driver, "#gmDtList > li:not(.all)", empty=None, timeout=5)
+    out = _parse_date_items(parse_fragment(outer_html(driver, "#gmDtList"))) or []
+    print(f"[DATES] {len(out)}개 발견: {', '.join(out)}")
+    return out
+
+def _parse_date_items(soup):
+    """#gmDtList → 일자 문자열 목록. 목록 자체가 없으면 None(빈 목록과 구분)"""
+    ul = soup.select_one("#gmDtList")
+    if ul is None:
+        return None
     out = []
-    for li in soup.select("#gmDtList > li"):
+    for li in ul.select(":scope > li"):
         if "all" in (li.get("class") or []):
             continue
         txt = li.get_text(" ", strip=True)
         if txt and txt != "전체":
             out.append(txt)
-    print(f"[DATES] {len(out)}개 발견: {', '.join(out)}")
     return out
 
 def select_date(driver, date_str):
     print(f"\n=== 날짜 선택: {date_str} ===")
+    # 일자 변경 → 종목 목록(#classCdList)이 다시 그려지는 순간까지 대기
+    mark_stale(driver, "#classCdList > li")
     try:
         driver.execute_script("getClassCdList(arguments[0], arguments[0]);", date_str)
     except JavascriptException:
@@ -192,16 +236,24 @@ def select_date(driver, date_str):
             By.XPATH, f"//ul[@id='gmDtList']//li[a[normalize-space()='{date_str}']]"
         )))
         driver.execute_script("arguments[0].click();", li)
-    time.sleep(0.4)
+    wait_rows_or_empty(driver, "#classCdList > li:not(.all)", empty=None, timeout=5)
 
 def list_sports_for_current_date(driver):
     btn = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((By.ID, "classCdBtn")))
     driver.execute_script("arguments[0].click();", btn)
-    time.sleep(0.2)
+    wait_rows_or_empty(driver, "#classCdList > li:not(.all)", empty=None, timeout=5)
 
-    soup = BeautifulSoup(driver.page_source, "lxml")
+    items = _parse_sport_items(parse_fragment(outer_html(driver, "#classCdList"))) or []
+    print(f"[SPORTS] {len(items)}개 발견: {', '.join(n for _, n in items)}")
+    return items
+
+def _parse_sport_items(soup):
+    """#classCdList → [(종목코드, 종목명)]. 목록 자체가 없으면 None(빈 목록과 구분)"""
+    ul = soup.select_one("#classCdList")
+    if ul is None:
+        return None
     items = []
-    for li in soup.select("#classCdList > li"):
+    for li in ul.select(":scope > li"):
         if "all" in (li.get("class") or []):
             continue
         onclick = li.get("onclick") or ""
@@ -211,7 +263,6 @@ def list_sports_for_current_date(driver):
         else:
             code, name = "", li.get_text(" ", strip=True)
         items.append((code, name))
-    print(f"[SPORTS] {len(items)}개 발견: {', '.join(n for _, n in items)}")
     return items
 
 def select_sport(driver, code, name):
@@ -229,6 +280,10 @@ def select_sport(driver, code, name):
     driver.execute_script("arguments[0].click();", li)
 
 def click_search(driver):
+    # 이전 검색 결과를 표시해 두어 새 결과/빈 결과만 대기 대상이 되게 함
+    mark_stale(driver, f"table.tablesaw.tablesaw-stack tr, {EMPTY_MARKERS}")
+    # 폼에 페이지 크기 필드가 있으면 한 번에 받도록(없으면 더보기로 펼침)
+    set_page_size(driver, LIST_PAGE_SIZE)
     try:
         search_btn = WebDriverWait(driver, 10).until(EC.element_to_be_clickable((
             By.XPATH, "//button[contains(@class,'searchBtn') or @onclick='javascript:search();']"
@@ -236,17 +291,27 @@ def click_search(driver):
         driver.execute_script("arguments[0].click();", search_btn)
     except Exception:
         pass
+    count_page(driver)
     accept_all_alerts(driver, tries=3, wait_each=1)
 
 # ================= 스케줄 생성 =================
 def parse_schedule_current_page(driver, start_seq, flt_date, flt_code, flt_name):
-    soup = BeautifulSoup(driver.page_source, "lxml")
-    seq = start_seq
-    rows = []
+    soup = parse_fragment(schedule_tables_html(driver, SCHEDULE_CAPTION))
+    return parse_schedule_soup(soup, start_seq, flt_date, flt_code, flt_name)
+
+def _schedule_tables(soup):
+    out = []
     for table in soup.select("table.tablesaw.tablesaw-stack"):
         cap = table.select_one("caption")
-        if not (cap and "시·도 토너먼트 경기일정" in cap.get_text(strip=True)):
-            continue
+        if cap and SCHEDULE_CAPTION in cap.get_text(strip=True):
+            out.append(table)
+    return out
+
+def parse_schedule_soup(soup, start_seq, flt_date, flt_code, flt_name):
+    """브라우저 page_source/HTTP 응답 공용: 경기일정 표 → 행 목록(사이드 호출 문자열 포함)"""
+    seq = start_seq
+    rows = []
+    for table in _schedule_tables(soup):
         sport_label = _get_sport_label_for(table)
         tbody = table.find("tbody")
         if not tbody:
@@ -268,31 +333,145 @@ def parse_schedule_current_page(driver, start_seq, flt_date, flt_code, flt_name)
                 "필터_일자": flt_date,
                 "필터_종목코드": flt_code,
                 "필터_종목명": flt_name,
+                # openSide(...) 호출 문자열(HTTP로 사이드 패널 직접 요청 시 사용)
+                "사이드_호출": _normalize(tds[0].get("onclick") or "").rstrip(";"),
             }
             r["글로벌 PK"] = _build_global_pk(r["종목정보"], r["종별"], r["세부종목"], r["경기구분"])
             rows.append(r)
             seq += 1
     return rows, seq
 
-def build_schedule_csv(
-    driver,
-    out_csv="jeonnam_schedule_split.csv",
-    limit_dates=None,
-    limit_sports_each=None,
-    # ✅ 추가된 파라미터들
-    search_result_timeout=40,   # 검색 후 표 등장까지 최대 대기
-    results_settle_pause=0.6,   # 표 등장 후 안정화 대기
-    max_load_more_clicks=20,    # '더보기' 클릭 최대 횟수
-    load_more_pause=0.8         # '더보기' 클릭 사이 간격
+def _cache_schedule(html_cache, html, d, code, name, order):
+    if html_cache is not None and html:
+        html_cache.put(
+            "record_schedule", html, filter=page_filter(d, code, name),
+            meta={"필터_일자": d, "필터_종목코드": code, "필터_종목명": name, "order": order},
+        )
+
+_DATE_RE = re.compile(r"\d{4}[/.-]\d{1,2}[/.-]\d{1,2}")
+
+def _ymd(s):
+    y, m, d = re.split(r"[/.-]", s)
+    return f"{y}/{int(m):02d}/{int(d):02d}"
+
+def _check_schedule_rows(rows, d, name, sido):
+    """
+    HTTP 일정 행이 요청한 (시도, 일자, 종목)의 것인지 확인. 아니면 HttpFetchError
+    (폼 필드가 무시되면 서버 기본 일정이 오는데, 그대로 두면 요청 라벨로 잘못 저장된다)
+    """
+    want_date = _ymd(d) if _DATE_RE.fullmatch(d or "") else None
+    for r in rows:
+        if r["종목정보"] != _normalize(name):
+            raise HttpFetchError(f"종목 불일치: 요청 {name} / 응답 {r['종목정보']}")
+        dates = sorted(_ymd(x) for x in _DATE_RE.findall(r["일시"]))
+        # 여러 날에 걸친 경기("09/25 ~ 09/27")는 기간 안에만 들면 됨
+        if want_date and dates and not dates[0] <= want_date <= dates[-1]:
+            raise HttpFetchError(f"일자 불일치: 요청 {d} / 응답 {r['일시']}")
+        # 기록경기는 시도 칸이 비어 있는 경우가 많다 → 값이 있을 때만 확인
+        if r["시도"] and sido.name not in r["시도"]:
+            raise HttpFetchError(f"시도 불일치: 요청 {sido.name} / 응답 {r['시도']}")
+
+def _search_schedule_bucket_http(http_client, d, code, name, html_cache=None, order=None, sido=JEONNAM):
+    """HTTP로 (일자, 종목) 일정 표를 한 번에 받아 파싱. 표가 없거나 요청과 다른 일정이면 HttpFetchError"""
+    sido = regions.get(sido)
+    html = http_client.schedule_html("R", sido.code, d, code)
+    soup = parse_fragment(html, SCHEDULE_STRAINER)
+    if not _schedule_tables(soup):
+        raise HttpFetchError("응답에 경기일정 표 없음")
+    rows, _ = parse_schedule_soup(soup, 0, d, code, name)
+    _check_schedule_rows(rows, d, name, sido)
+    _cache_schedule(html_cache, html, d, code, name, order)
+    print(f"  - [HTTP] 경기일정 {len(rows)}건 파싱 (일자={d} | 종목={name})")
+    return rows
+
+def _search_schedule_bucket(
+    driver, d, code, name,
+    select_date_first=False,
+    search_result_timeout=40,
+    results_settle_pause=0,
+    max_load_more_clicks=20,
+    load_more_timeout=4,
+    http_client=None,
+    html_cache=None,
+    order=None,                 # 묶음 순번(재파싱 시 로컬 PK 순서 복원용)
+    sido=JEONNAM,
 ):
-    open_jeonnam_only(driver)
+    """(일자, 종목) 한 묶음 검색 → 경기일정 행 목록(로컬 PK는 호출부에서 다시 매김)"""
+    if http_client is not None:
+        try:
+            return _search_schedule_bucket_http(http_client, d, code, name, html_cache, order, sido=sido)
+        except HttpFetchError as e:
+            print(f"  - [HTTP] 실패 → 브라우저 폴백: {e}")
+        select_date_first = True  # HTTP 경로는 화면 상태를 바꾸지 않으므로 일자부터 다시 선택
+    if select_date_first:
+        select_date(driver, d)
+    print(f"\n[SEARCH] 일자={d} | 종목={name}({code}) → 검색 실행")
+    select_sport(driver, code, name)
+    click_search(driver)
+
+    # ✅ 검색 결과 대기 (파라미터로 제어)
+    if not wait_search_results(
+        driver,
+        appear_timeout=search_result_timeout,
+        settle_pause=results_settle_pause
+    ):
+        print("  - 결과 표 없음(빈 결과일 수 있음)")
+        return []
+
+    # ✅ 더보기 클릭도 간격 제어
+    click_load_more_if_exists(
+        driver,
+        max_clicks=max_load_more_clicks,
+        grow_timeout=load_more_timeout
+    )
+
+    html = schedule_tables_html(driver, SCHEDULE_CAPTION)
+    _cache_schedule(html_cache, html, d, code, name, order)
+    sched_rows, _ = parse_schedule_soup(parse_fragment(html), 0, d, code, name)
+    print(f"  - 경기일정 {len(sched_rows)}건 파싱 (일자={d} | 종목={name})")
+    return sched_rows
+
+def _list_schedule_buckets_http(http_client, limit_dates=None, limit_sports_each=None, sido=JEONNAM):
+    sido = regions.get(sido)
+    dates = _parse_date_items(parse_fragment(http_client.gm_dt_list_html(sido.code, sido.name)))
+    if dates is None:
+        raise HttpFetchError("응답에 #gmDtList 없음")
+    if not dates:
+        raise HttpFetchError("일자 목록 비어 있음")
+    if limit_dates:
+        dates = dates[:limit_dates]
+    buckets = []
+    for d in dates:
+        sports = _parse_sport_items(parse_fragment(http_client.class_cd_list_html(d)))
+        if sports is None:
+            raise HttpFetchError(f"응답에 #classCdList 없음(일자={d})")
+        if limit_sports_each:
+            sports = sports[:limit_sports_each]
+        buckets.extend((d, code, name) for code, name in sports)
+    print(f"[HTTP] 일자 {len(dates)}개 | 묶음 {len(buckets)}개")
+    return buckets
+
+def list_schedule_buckets(driver, limit_dates=None, limit_sports_each=None, http_client=None, sido=JEONNAM):
+    """시도 선택 후 (일자, 종목코드, 종목명) 묶음을 화면 순서대로 나열"""
+    if http_client is not None:
+        try:
+            buckets = _list_schedule_buckets_http(http_client, limit_dates, limit_sports_each, sido=sido)
+            # 폴백/순차 수집 대비 브라우저도 같은 상태로. LazyDriver는 폴백이 필요해 처음 띄울 때 on_start가 시도를 선택
+            if not isinstance(driver, LazyDriver):
+                open_sido_only(driver, sido)
+            return buckets
+        except HttpFetchError as e:
+            print(f"[HTTP] 일자/종목 목록 실패 → 브라우저 폴백: {e}")
+    if isinstance(driver, LazyDriver) and not driver.started:
+        driver.start()  # on_start에서 시도 선택까지
+    else:
+        open_sido_only(driver, sido)
 
     dates = list_dates(driver)
     if limit_dates:
         dates = dates[:limit_dates]
 
-    all_sched = []
-    seq = 1
+    buckets = []
     for d in dates:
         select_date(driver, d)
         sports = list_sports_for_current_date(driver)
@@ -301,88 +480,152 @@ def build_schedule_csv(
             continue
         if limit_sports_each:
             sports = sports[:limit_sports_each]
+        buckets.extend((d, code, name) for code, name in sports)
+    return buckets
 
-        for code, name in sports:
-            print(f"\n[SEARCH] 일자={d} | 종목={name}({code}) → 검색 실행")
-            select_sport(driver, code, name)
-            click_search(driver)
+def build_schedule_csv(
+    driver,
+    out_csv="jeonnam_schedule_split.csv",
+    limit_dates=None,
+    limit_sports_each=None,
+    # ✅ 추가된 파라미터들
+    search_result_timeout=40,   # 검색 후 표 등장까지 최대 대기
+    results_settle_pause=0,     # 표 등장 후 추가 대기(이벤트 기반 대기라 기본 0)
+    max_load_more_clicks=20,    # '더보기' 클릭 최대 횟수
+    load_more_timeout=4,        # '더보기' 클릭 후 행 증가 최대 대기
+    workers=1,                  # ✅ 병렬 브라우저 수(1이면 기존처럼 driver 하나로 순차 처리)
+    headless=True,
+    http_client=None,           # ✅ MeetHttpClient: HTTP 우선, 실패 시 브라우저
+    html_cache=None,            # ✅ HtmlCache/경로: 일정 표 원본 저장(재파싱용)
+    pool=None,                  # ✅ DriverPool: 병렬 수집 시 드라이버 재사용
+    sido=JEONNAM,               # ✅ 시도(Sido/코드/이름). pool은 같은 시도로 만든 것이어야 함
+):
+    html_cache = HtmlCache.open(html_cache)
+    buckets = list_schedule_buckets(driver, limit_dates, limit_sports_each, http_client=http_client, sido=sido)
+    opts = dict(
+        sido=sido,
+        http_client=http_client,
+        html_cache=html_cache,
+        search_result_timeout=search_result_timeout,
+        results_settle_pause=results_settle_pause,
+        max_load_more_clicks=max_load_more_clicks,
+        load_more_timeout=load_more_timeout,
+    )
 
-            # ✅ 검색 결과 대기 (파라미터로 제어)
-            if not wait_search_results(
-                driver,
-                appear_timeout=search_result_timeout,
-                settle_pause=results_settle_pause
-            ):
-                print("  - 결과 표 없음(빈 결과일 수 있음)")
-                continue
+    if workers and workers > 1:
+        per_bucket = run_buckets_parallel(
+            list(enumerate(buckets)),
+            lambda drv, ib: _search_schedule_bucket(drv, *ib[1], select_date_first=True, order=ib[0], **opts),
+            workers=workers,
+            headless=headless,
+            pool=pool,
+            sido=sido,
+        )
+    else:
+        per_bucket = []
+        cur_date = None
+        for i, b in enumerate(buckets):
+            per_bucket.append(_search_schedule_bucket(driver, *b, select_date_first=(b[0] != cur_date), order=i, **opts))
+            cur_date = b[0]
 
-            # ✅ 더보기 클릭도 간격 제어
-            click_load_more_if_exists(
-                driver,
-                max_clicks=max_load_more_clicks,
-                per_click_pause=load_more_pause
-            )
+    return _save_schedule(per_bucket, out_csv)
 
-            sched_rows, next_seq = parse_schedule_current_page(driver, seq, d, code, name)
-            n_matches = next_seq - seq
-            print(f"  - 경기일정 {n_matches}건 파싱")
-            all_sched.extend(sched_rows)
-            seq = next_seq
+def _save_schedule(per_bucket, out_csv):
+    # 묶음 순서(=화면 순서)대로 로컬 PK 재부여 → 순차 실행과 같은 번호
+    all_sched = []
+    seq = 1
+    for rows in per_bucket:
+        for r in rows or []:
+            r["로컬 PK"] = seq
+            all_sched.append(r)
+            seq += 1
 
     if all_sched:
-        df_s = pd.DataFrame(all_sched)[[
-            "로컬 PK","글로벌 PK","필터_일자","필터_종목코드","필터_종목명",
-            "종목정보","종별","세부종목","경기구분","상태","일시","경기장","시도"
-        ]]
-        df_s.to_csv(out_csv, index=False, encoding="utf-8-sig")
-        print(f"\n[저장] {out_csv} | {len(df_s)}행")
+        # 스케줄은 재수집 입력으로 그대로 쓰이므로 DataFrame도 반환(경기당 1행이라 작음)
+        df_s = pd.DataFrame(all_sched)[SCHEDULE_COLS]
+        if out_csv:
+            with ResultWriter(out_csv, SCHEDULE_COLS) as w:
+                w.write(df_s)
+            print(f"\n[저장] {out_csv} | {w.rows}행")
         return df_s
     else:
         print("\n[저장] 스케줄 없음")
-        return pd.DataFrame(columns=[
-            "로컬 PK","글로벌 PK","필터_일자","필터_종목코드","필터_종목명",
-            "종목정보","종별","세부종목","경기구분","상태","일시","경기장","시도"
-        ])
-
-
-# ================= PK 메타(행→글로벌PK) =================
-def _sport_label_from_tr(tr_el):
-    for xp in [
-        "ancestor::table/preceding::h5[@id='classNm' or contains(@class,'subTit')][1]",
-        "ancestor::table/preceding::h5[1]"
-    ]:
-        try:
-            h5 = tr_el.find_element(By.XPATH, xp)
-            return _normalize(h5.text)
-        except Exception:
-            continue
-    return ""
+        return pd.DataFrame(columns=SCHEDULE_COLS)
 
-def _pk_meta_from_tr(tr_el):
-    tds = tr_el.find_elements(By.TAG_NAME, "td")
-    kind = _cell_text_el(tds[0]) if len(tds) >= 1 else ""
-    subkind = _cell_text_el(tds[1]) if len(tds) >= 2 else ""
-    matchtype = _cell_text_el(tds[2]) if len(tds) >= 3 else ""
-    sport = _sport_label_from_tr(tr_el)
-    return sport, kind, subkind, matchtype
 
-# ================= 사이드(기록경기 2번째 표) =================
-def _get_onclick_call(td_elem):
+# ================= 병렬 수집(브라우저 여러 개) =================
+def _bucket_worker(worker_id, bucket_q, results, crawl_bucket, pool, lock):
+    """풀에서 드라이버를 빌려 큐의 묶음을 통째로 처리(묶음마다 반납 → 기준 초과 시 재시작)"""
+    done = 0
+    while True:
+        try:
+            idx, bucket = bucket_q.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            with pool.checkout() as driver:
+                rows = crawl_bucket(driver, bucket)
+        except Exception as e:
+            print(f"[W{worker_id}] 묶음 {bucket} 실패: {type(e).__name__}: {str(e)[:160]}", flush=True)
+            rows = []
+        with lock:
+            results[idx] = rows
+        done += 1
+    print(f"[W{worker_id}] 종료 | 처리 묶음 {done}개", flush=True)
+    return done
+
+def new_driver_pool(size=4, headless=True, sido=JEONNAM, **kw):
+    """시도 선택까지 마친 드라이버를 빌려주는 풀(단계 사이에 재사용하면 브라우저 기동 비용이 한 번뿐)"""
+    sido = regions.get(sido)
+    return DriverPool(size=size, headless=headless, on_start=lambda drv: open_sido_only(drv, sido), **kw)
+
+def run_buckets_parallel(buckets, crawl_bucket, workers=4, headless=True, pool=None, sido=JEONNAM):
+    """
+    buckets: 묶음 목록(예: (일자, 종목코드, 종목명, ...)).
+    crawl_bucket(driver, bucket) -> rows 를 워커 수만큼의 브라우저에서 나눠 실행한다.
+    pool: DriverPool(없으면 이번 호출용으로 만들고 끝나면 닫음)
+    반환: buckets와 같은 순서의 rows 목록(실패 묶음은 빈 목록).
+    """
+    if not buckets:
+        return []
+    workers = max(1, min(int(workers), len(buckets)))
+    own_pool = pool is None
+    if own_pool:
+        pool = new_driver_pool(size=workers, headless=headless, sido=sido)
+    bucket_q = queue.Queue()
+    for i, b in enumerate(buckets):
+        bucket_q.put((i, b))
+
+    results = [None] * len(buckets)
+    lock = threading.Lock()
+    t0 = time.perf_counter()
+    print(f"[PARALLEL] 묶음 {len(buckets)}개 | 워커 {workers}개", flush=True)
     try:
-        call = td_elem.get_attribute("onclick")
-        if call and "openSide" in call:
-            return call.strip().rstrip(";")
-    except Exception:
-        pass
-    return None
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(_bucket_worker, w + 1, bucket_q, results, crawl_bucket, pool, lock)
+                for w in range(workers)
+            ]
+            for f in futures:
+                f.result()
+    finally:
+        if own_pool:
+            pool.close()
+    print(f"[PARALLEL] 완료 | {time.perf_counter()-t0:.1f}s", flush=True)
+    return [r or [] for r in results]
+
 
+# ================= 사이드(기록경기 2번째 표) =================
 def _pick_second_record_table_fast(driver):
+    """사이드 패널 outerHTML만 한 번 읽어 파싱 → (표 노드, HTML)"""
     try:
-        side = driver.find_element(By.CSS_SELECTOR, "div.record-match-area, div.record")
+        side = driver.find_element(By.CSS_SELECTOR, SIDE_CSS)
         html = side.get_attribute("outerHTML")
     except Exception:
-        return None
-    side_soup = BeautifulSoup(html, "lxml")
+        return None, None
+    return _pick_second_record_table(parse_fragment(html)), html
+
+def _pick_second_record_table(side_soup):
     tables = []
     for t in side_soup.select("table.tablesaw.tablesaw-stack"):
         cap = t.select_one("caption")
@@ -392,6 +635,79 @@ def _pick_second_record_table_fast(driver):
         return None
     return tables[1] if len(tables) >= 2 else tables[0]
 
+def _parse_record_table(target, local_pk, meta):
+    """기록경기 표(<table>) → 선수 기록 행 목록. tbody가 없으면 None"""
+    tbody = target.find("tbody")
+    if not tbody:
+        return None
+    rows_out = []
+    for tr2 in tbody.find_all("tr"):
+        if tr2.find("td", class_="no-result"):
+            continue
+        tds = tr2.find_all("td")
+        if len(tds) < 7:
+            continue
+        rows_out.append({
+            "로컬 PK": local_pk,
+            "글로벌 PK": meta.get("글로벌 PK",""),
+            "필터_일자": meta.get("필터_일자",""),
+            "필터_종목코드": meta.get("필터_종목코드",""),
+            "필터_종목명": meta.get("필터_종목명",""),
+            "순위": _cell_content(tds[0]),
+            "시도": _cell_content(tds[1]),
+            "선수명": _cell_content(tds[2]),
+            "소속": _cell_content(tds[3]),
+            "학년": _cell_content(tds[4]),
+            "기록": _cell_content(tds[5]),
+            "신기록/비고": _cell_content(tds[6]),
+        })
+    return rows_out
+
+def _cache_side(html_cache, html, local_pk, meta):
+    if html_cache is not None and html:
+        html_cache.put(
+            "record_side", html,
+            global_pk=meta.get("글로벌 PK", ""),
+            filter=page_filter(meta.get("필터_일자", ""), meta.get("필터_종목코드", ""), meta.get("필터_종목명", "")),
+            local_pk=local_pk, meta=meta,
+        )
+
+def parse_side_html(html, local_pk, meta):
+    """사이드 패널 HTML → (rows, success, reason). 파싱 프로세스(pipeline)에서도 이 함수를 쓴다"""
+    target = _pick_second_record_table(parse_fragment(html, SIDE_STRAINER))
+    if target is None:
+        return [], False, "기록경기 표 없음"
+    rows_out = _parse_record_table(target, local_pk, meta)
+    if rows_out is None:
+        return [], False, "기록경기 tbody 없음"
+    if not rows_out:
+        return [], False, "표는 있었으나 데이터 행이 없음(미종료/빈값)"
+    return rows_out, True, ""
+
+def parse_one_match_http(http_client, side_call, local_pk, meta, log=True, html_cache=None):
+    """openSide 호출을 HTTP로 재현해 사이드 패널 조각을 받아 파싱. (rows, success, reason)"""
+    t0 = time.perf_counter()
+    ev = telemetry.attempt(local_pk, meta.get("글로벌 PK", ""), source="http")
+    try:
+        with ev.stage("http_fetch"):
+            html = http_client.side_html(side_call)
+        _cache_side(html_cache, html, local_pk, meta)
+    except HttpFetchError as e:
+        if log:
+            print(f"[{local_pk:04d}] HTTP FAIL | {e} → 브라우저 폴백", flush=True)
+        ev.finish(False, f"HTTP: {e}")
+        return [], False, f"HTTP: {e}"
+    with ev.stage("parse"):
+        target = _pick_second_record_table(parse_fragment(html, SIDE_STRAINER))
+        rows_out = _parse_record_table(target, local_pk, meta) if target is not None else None
+    if rows_out:
+        if log:
+            print(f"[{local_pk:04d}] OK(HTTP) | rows={len(rows_out):>2} | {meta.get('필터_일자','')} / {meta.get('필터_종목명','')} | {time.perf_counter()-t0:.2f}s", flush=True)
+        ev.finish(True, rows=len(rows_out))
+        return rows_out, True, ""
+    ev.finish(False, "HTTP: 기록 표 없음/빈 표")
+    return [], False, "HTTP: 기록 표 없음/빈 표"
+
 def parse_one_match_by_row_index(
     driver,
     row_index,
@@ -401,48 +717,69 @@ def parse_one_match_by_row_index(
     attempts=3,
     log=True,
     side_open_timeout=15,       # ✅ 추가
-    record_table_timeout=25     # ✅ 추가
+    record_table_timeout=25,    # ✅ 추가
+    html_cache=None,            # ✅ HtmlCache: 사이드 패널 원본 저장(재파싱용)
+    registry=None,              # ✅ RowRegistry: 화면 로딩 시 1회 찾아 둔 행 핸들(없으면 여기서 생성)
+    side_call=None,             # ✅ 스케줄의 사이드_호출(openSide) → 행 식별자
+    pipeline=None,              # ✅ ParsePipeline: 표가 채워지면 HTML만 넘기고 (None, True, "") 반환
+    scheduler=None,             # ✅ AdaptiveScheduler: 타임아웃/클릭 후 정지/재시도 간격을 관측값으로(위 값은 기본값)
 ):
-    row_xpath = "//table[.//caption[contains(normalize-space(),'시·도 토너먼트 경기일정')]]//tbody/tr"
+    """(rows, success, reason). pipeline에 넘긴 경우 rows=None(결과는 파이프라인 sink가 기록)"""
+    if registry is None:
+        registry = RowRegistry(driver, SCHEDULE_CAPTION)
 
     for attempt in range(1, attempts + 1):
         status, reason, title_txt, extracted = "FAIL", "", "", 0
+        if scheduler is not None:
+            open_timeout = scheduler.timeout("side_open", side_open_timeout)
+            table_timeout = scheduler.timeout("record_table", record_table_timeout)
+            pause = scheduler.settle("side_open", click_pause)
+        else:
+            open_timeout, table_timeout, pause = side_open_timeout, record_table_timeout, click_pause
         t0 = time.perf_counter()
+        ev = telemetry.attempt(local_pk, meta.get("글로벌 PK", ""), attempt=attempt)
         try:
-            rows = driver.find_elements(By.XPATH, row_xpath)
-            if row_index >= len(rows):
-                click_load_more_if_exists(driver, max_clicks=3)
-                rows = driver.find_elements(By.XPATH, row_xpath)
-                if row_index >= len(rows):
-                    reason = f"행 인덱스 {row_index}가 범위를 벗어남(len={len(rows)})"
-                    if log:
-                        print(f"[{local_pk:04d}] {status} | rows=0 | (attempt {attempt}/{attempts}) | {reason} | {time.perf_counter()-t0:.2f}s", flush=True)
-                    continue
-
-            tr = rows[row_index]
-            td1 = tr.find_element(By.XPATH, "./td[1]")
-
-            call = _get_onclick_call(td1)
-            if call:
-                try:
-                    driver.execute_script(call)
-                except JavascriptException:
-                    driver.execute_script("arguments[0].scrollIntoView({block:'center'});", td1)
-                    driver.execute_script("arguments[0].click();", td1)
-            else:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center'});", td1)
-                driver.execute_script("arguments[0].click();", td1)
+            # 목록은 화면을 열 때(ensure_page_loaded_for) 이미 끝까지 펼쳐 두었다
+            with ev.stage("navigate"):
+                i = registry.index_of(side_call, fallback=row_index)
+            if i is None:
+                reason = f"행 인덱스 {row_index}가 범위를 벗어남(len={len(registry)})"
+                if log:
+                    print(f"[{local_pk:04d}] {status} | rows=0 | (attempt {attempt}/{attempts}) | {reason} | {time.perf_counter()-t0:.2f}s", flush=True)
+                ev.finish(False, reason)
+                continue
+
+            with ev.stage("panel_open"):
+                # 직전 경기 패널 내용은 '이전 결과'로 표시 → 새 패널의 표만 대기
+                mark_stale(driver, f"div.record-match-area tr, div.record tr, {EMPTY_MARKERS}")
+                registry.open(i)
+                count_page(driver)
 
-            # 클릭 후 약간 정지(스크롤/애니메이션 안정화)
-            time.sleep(click_pause)
+                # 클릭 후 약간 정지(스크롤/애니메이션 안정화)
+                time.sleep(pause)
 
             # ✅ 사이드 패널/두번째 표를 '충분히' 기다림
-            target = wait_record_panel_and_table(
-                driver,
-                open_timeout=side_open_timeout,
-                table_timeout=record_table_timeout,
-                poll=0.25
-            )
+            if pipeline is not None:
+                # 행이 채워졌으면 HTML만 넘기고 바로 다음 경기로(파싱/기록은 파이프라인 단계에서)
+                state = wait_record_panel(driver, open_timeout, table_timeout, ev, scheduler)
+                if state == "ready":
+                    side_html = outer_html(driver, SIDE_CSS)
+                    _close_side_panel(driver, ev)
+                    _cache_side(html_cache, side_html, local_pk, meta)
+                    pipeline.submit((local_pk, meta), side_html, local_pk, meta,
+                                    fetch_ms=(time.perf_counter() - t0) * 1000)
+                    ev.finish(True)
+                    return None, True, ""
+                target, side_html = _pick_second_record_table_fast(driver) if state else (None, None)
+            else:
+                target, side_html = wait_record_panel_and_table(
+                    driver,
+                    open_timeout=open_timeout,
+                    table_timeout=table_timeout,
+                    ev=ev,
+                    scheduler=scheduler,
+                )
+            _cache_side(html_cache, side_html, local_pk, meta)
 
             # (로깅용 제목)
             try:
@@ -453,45 +790,16 @@ def parse_one_match_by_row_index(
 
             rows_out = []
             if target:
-                tbody = target.find("tbody")
-                if tbody:
-                    for tr2 in tbody.find_all("tr"):
-                        if tr2.find("td", class_="no-result"):
-                            continue
-                        tds = tr2.find_all("td")
-                        if len(tds) < 7:
-                            continue
-                        row = {
-                            "로컬 PK": local_pk,
-                            "글로벌 PK": meta.get("글로벌 PK",""),
-                            "필터_일자": meta.get("필터_일자",""),
-                            "필터_종목코드": meta.get("필터_종목코드",""),
-                            "필터_종목명": meta.get("필터_종목명",""),
-                            "순위": _cell_content(tds[0]),
-                            "시도": _cell_content(tds[1]),
-                            "선수명": _cell_content(tds[2]),
-                            "소속": _cell_content(tds[3]),
-                            "학년": _cell_content(tds[4]),
-                            "기록": _cell_content(tds[5]),
-                            "신기록/비고": _cell_content(tds[6]),
-                        }
-                        rows_out.append(row)
-                else:
+                with ev.stage("parse"):
+                    rows_out = _parse_record_table(target, local_pk, meta)
+                if rows_out is None:
+                    rows_out = []
                     reason = "기록경기 tbody 없음"
             else:
                 reason = "기록경기 두 번째 표 로딩 시간 초과"
 
             # 닫기
-            try:
-                close_btn = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(@class,'closeBtn')]"))
-                )
-                driver.execute_script("arguments[0].click();", close_btn)
-                WebDriverWait(driver, 5).until(
-                    EC.invisibility_of_element_located((By.CSS_SELECTOR, "div.record-match-area, div.record"))
-                )
-            except TimeoutException:
-                pass
+            _close_side_panel(driver, ev)
 
             extracted = len(rows_out)
             if extracted > 0:
@@ -499,7 +807,8 @@ def parse_one_match_by_row_index(
                 if log:
                     short = (title_txt[:80]+"…") if len(title_txt) > 80 else title_txt
                     print(f"[{local_pk:04d}] {status} | rows={extracted:>2} | {short} | {meta.get('필터_일자','')} / {meta.get('필터_종목명','')} | {time.perf_counter()-t0:.2f}s", flush=True)
-                return rows_out, True
+                ev.finish(True, rows=extracted)
+                return rows_out, True, ""
             else:
                 if not reason:
                     reason = "표는 있었으나 데이터 행이 없음(미종료/빈값)"
@@ -508,14 +817,20 @@ def parse_one_match_by_row_index(
             reason = "사이드 패널 대기 시간 초과"
         except StaleElementReferenceException:
             reason = "StaleElement(재렌더)"
+            registry.refresh()
         except Exception as e:
             reason = f"예외: {type(e).__name__}: {str(e)[:160]}"
 
         if log:
             print(f"[{local_pk:04d}] {status} | rows=0 | (attempt {attempt}/{attempts}) | {reason} | {time.perf_counter()-t0:.2f}s", flush=True)
-        time.sleep(0.3)
+        ev.finish(False, reason)
+        if attempt < attempts:
+            if scheduler is not None:
+                scheduler.backoff("side_panel", attempt)
+            else:
+                time.sleep(0.3)
 
-    return [], False
+    return [], False, reason
 
 
 # ================= 유틸: 누락 탐지/매핑 =================
@@ -562,7 +877,7 @@ def ensure_page_loaded_for(driver, date_str, code, name):
     if not ok:
         print("  - [WARN] 결과 표 없음(빈 결과일 수 있음)")
         return False
-    click_load_more_if_exists(driver, max_clicks=20)
+    click_load_more_if_exists(driver, max_clicks=40)
     return True
 
 # ================= 백필(backfill) =================
@@ -586,7 +901,7 @@ def backfill_missing_records(
     missing_ids = find_missing_ids(records_csv, total_max=total_max, col_name="로컬 PK")
     if not missing_ids:
         print("[INFO] 누락 없음. 종료.")
-        return
+        return 0
 
     seq_map = build_seq_to_page_index(s)
 
@@ -600,12 +915,13 @@ def backfill_missing_records(
         key = (info["필터_일자"], info["필터_종목코드"], info["필터_종목명"])
         buckets[key].append((seq_id, info))
 
-    results = []
+    writer = ResultWriter(out_csv, RECORD_COLS)  # 경기마다 흘려 씀(행을 모아 두지 않음)
     for (d, code, name), items in buckets.items():
         print(f"\n=== 백필 화면 오픈: 일자={d} | 종목={name}({code}) | 대상 {len(items)}건 ===")
         if not ensure_page_loaded_for(driver, d, code, name):
             print("  - 화면 로딩 실패 → 스킵")
             continue
+        registry = RowRegistry(driver, SCHEDULE_CAPTION)
 
         items.sort(key=lambda x: x[1]["row_index_in_page"])
         for local_pk, info in items:
@@ -615,7 +931,7 @@ def backfill_missing_records(
                 "필터_종목명": info["필터_종목명"],
                 "글로벌 PK": info["글로벌 PK"],
             }
-            rows_out, success = parse_one_match_by_row_index(
+            rows_out, success, _ = parse_one_match_by_row_index(
                 driver,
                 row_index=info["row_index_in_page"],
                 local_pk=local_pk,
@@ -623,24 +939,121 @@ def backfill_missing_records(
                 attempts=attempts_each,
                 click_pause=panel_settle_pause,           # ✅ 전달
                 side_open_timeout=side_open_timeout,      # ✅ 전달
-                record_table_timeout=record_table_timeout # ✅ 전달
+                record_table_timeout=record_table_timeout,# ✅ 전달
+                registry=registry,
             )
             if success:
-                results.extend(rows_out)
+                writer.write(rows_out)
             else:
                 print(f"[FAIL] 경기 {local_pk} 재수집 실패(최대 {attempts_each}회 시도)")
 
-    if results:
-        df = pd.DataFrame(results)[[
-            "로컬 PK","글로벌 PK","필터_일자","필터_종목코드","필터_종목명",
-            "순위","시도","선수명","소속","학년","기록","신기록/비고"
-        ]]
-        df.to_csv(out_csv, index=False, encoding="utf-8-sig")
-        print(f"\n[저장] backfill 결과: {out_csv} | {len(df)}행")
+    n = writer.close()
+    if n:
+        print(f"\n[저장] backfill 결과: {out_csv} | {n}행")
     else:
         print("\n[저장] backfill 결과 없음")
+    return n
 
 # ================= 전체 재수집(최초 실행 모드로 사용) =================
+def _recrawl_bucket(
+    driver, d, code, name, grp,
+    attempts_each=2,
+    side_open_timeout=15,
+    record_table_timeout=25,
+    panel_settle_pause=0.10,
+    http_client=None,
+    journal=None,
+    html_cache=None,
+    pipeline=None,
+    writer=None,
+    scheduler=None,
+):
+    """(일자, 종목) 화면 하나를 열고 그 안의 경기들을 모두 수집(http_client가 있으면 HTTP 우선)
+    journal이 있으면 경기마다 결과를 바로 기록하고, 이미 완료된 경기는 건너뛴다.
+    pipeline이 있으면 브라우저로 받은 경기는 파이프라인이 파싱/기록한다(반환 목록에는 없음).
+    writer(ResultWriter)나 journal이 있으면 행은 거기에만 쓰고 반환 목록에 모으지 않는다."""
+    print(f"\n=== 전체 재수집 화면: 일자={d} | 종목={name}({code}) | 경기 {len(grp)}건 ===")
+    page_ready = None  # 브라우저 화면은 폴백이 처음 필요할 때만 연다
+    registry = None
+
+    results = []
+    def keep(rows_out):
+        if writer is not None:
+            writer.write(rows_out)
+        elif journal is None:
+            results.extend(rows_out)
+    for _, r in grp.iterrows():
+        local_pk = int(r["로컬 PK"])
+        row_idx  = int(r["row_index_in_page"])
+        meta = {
+            "필터_일자": d,
+            "필터_종목코드": code,
+            "필터_종목명": name,
+            "글로벌 PK": r["글로벌 PK"],
+        }
+        if journal is not None and journal.is_done(local_pk, meta["글로벌 PK"]):
+            continue
+
+        side_call = r.get("사이드_호출")
+        if http_client is not None and isinstance(side_call, str) and side_call:
+            rows_out, success, reason = parse_one_match_http(http_client, side_call, local_pk, meta, html_cache=html_cache)
+            if success:
+                keep(rows_out)
+                if journal is not None:
+                    journal.record(local_pk, meta["글로벌 PK"], rows_out, True)
+                telemetry.match_done(local_pk, True)
+                continue
+
+        if page_ready is None:
+            t0 = time.perf_counter()
+            page_ready = ensure_page_loaded_for(driver, d, code, name)
+            telemetry.emit({
+                "type": "bucket", "filter": f"{d}|{code}|{name}", "ok": bool(page_ready),
+                "stages": {"bucket_navigate": round((time.perf_counter() - t0) * 1000, 1)},
+            })
+            if not page_ready:
+                print("  - 화면 로딩 실패 → 그룹 스킵")
+            else:
+                registry = RowRegistry(driver, SCHEDULE_CAPTION)
+        if not page_ready:
+            print(f"[FAIL] 경기 {local_pk} 화면 로딩 실패")
+            if journal is not None:
+                journal.record(local_pk, meta["글로벌 PK"], [], False, "화면 로딩 실패")
+            telemetry.emit({"type": "attempt", "local_pk": local_pk, "global_pk": meta["글로벌 PK"],
+                            "ok": False, "reason": "화면 로딩 실패", "failure": telemetry.classify("화면 로딩 실패")})
+            telemetry.match_done(local_pk, False)
+            continue
+
+        # 브라우저 경기 1건 = 스케줄러 슬롯 1개(사이트가 느려지면 동시에 패널을 여는 워커 수가 줄어든다)
+        with maybe_slot(scheduler, "side_panel") as call:
+            rows_out, success, reason = parse_one_match_by_row_index(
+                driver,
+                row_index=row_idx,
+                local_pk=local_pk,
+                meta=meta,
+                attempts=attempts_each,
+                click_pause=panel_settle_pause,           # ✅ 전달
+                side_open_timeout=side_open_timeout,      # ✅ 전달
+                record_table_timeout=record_table_timeout,# ✅ 전달
+                html_cache=html_cache,
+                registry=registry,
+                side_call=side_call if isinstance(side_call, str) else None,
+                pipeline=pipeline,
+                scheduler=scheduler,
+            )
+            if not success and "시간 초과" in reason:
+                call.fail("timeout")
+        if rows_out is None:
+            continue  # 파이프라인으로 넘어감
+        if journal is not None:
+            journal.record(local_pk, meta["글로벌 PK"], rows_out, success, reason)
+        telemetry.match_done(local_pk, success)
+        if success:
+            keep(rows_out)
+        else:
+            print(f"[FAIL] 경기 {local_pk} 재수집 실패(최대 {attempts_each}회 시도)")
+    return results
+
 def recrawl_all_with_retry(
     driver,
     schedule,
@@ -648,8 +1061,26 @@ def recrawl_all_with_retry(
     attempts_each=2,
     side_open_timeout=15,       # ✅ 추가
     record_table_timeout=25,    # ✅ 추가
-    panel_settle_pause=0.10     # ✅ 추가
+    panel_settle_pause=0.10,    # ✅ 추가
+    workers=1,                  # ✅ 병렬 브라우저 수(1이면 전달받은 driver로 순차 처리)
+    headless=True,
+    http_client=None,           # ✅ MeetHttpClient: 사이드 패널 HTTP 우선, 실패 시 브라우저
+    journal=None,               # ✅ 저널 경로/CrawlJournal: 경기별 체크포인트, 재실행 시 완료 경기 건너뜀
+    html_cache=None,            # ✅ HtmlCache/경로: 사이드 패널 원본 저장(재파싱용)
+    pool=None,                  # ✅ DriverPool: 병렬 수집 시 드라이버 재사용
+    only_pks=None,              # ✅ 이 로컬 PK들만 수집(증분 갱신용, 행 위치는 전체 스케줄 기준)
+    parse_procs=0,              # ✅ >0이면 브라우저는 HTML만 받고 파싱은 프로세스 풀(pipeline.py)에서
+    sido=JEONNAM,               # ✅ 시도. driver/pool은 이 시도가 선택된 상태여야 함(build_schedule_csv 뒤 그대로)
+    scheduler=None,             # ✅ AdaptiveScheduler: 타임아웃은 관측 p95로, 동시 패널 수는 AIMD로(politeness.py)
 ):
+    """
+    out_csv가 None이면 파일로 쓰지 않고 결과 DataFrame만 반환.
+    out_csv가 있으면 행을 모아 두지 않고 경기가 끝날 때마다 흘려 쓴 뒤(writers.ResultWriter, .parquet 가능)
+    기록한 행 수를 반환한다. 이때 파일은 수집 완료 순서이고, journal이 있으면 저널에서 로컬 PK 순서로 만든다.
+    parse_procs 사용 시 파싱 단계에서 실패한 경기는 재시도하지 않으므로 journal과 함께 쓰고 재실행으로 보완
+    """
+    journal = CrawlJournal.open(journal)
+    html_cache = HtmlCache.open(html_cache)
     if isinstance(schedule, str):
         s = pd.read_csv(schedule)
     else:
@@ -663,56 +1094,160 @@ def recrawl_all_with_retry(
 
     s = s.sort_values(["필터_일자","필터_종목코드","필터_종목명","로컬 PK"]).reset_index(drop=True)
     s["row_index_in_page"] = s.groupby(["필터_일자","필터_종목코드","필터_종목명"]).cumcount()
-
-    results = []
-    for (d, code, name), grp in s.groupby(["필터_일자","필터_종목코드","필터_종목명"], sort=False):
-        print(f"\n=== 전체 재수집 화면: 일자={d} | 종목={name}({code}) | 경기 {len(grp)}건 ===")
-        if not ensure_page_loaded_for(driver, d, code, name):
-            print("  - 화면 로딩 실패 → 그룹 스킵")
-            continue
-
-        for _, r in grp.iterrows():
-            local_pk = int(r["로컬 PK"])
-            row_idx  = int(r["row_index_in_page"])
-            meta = {
-                "필터_일자": d,
-                "필터_종목코드": code,
-                "필터_종목명": name,
-                "글로벌 PK": r["글로벌 PK"],
-            }
-            rows_out, success = parse_one_match_by_row_index(
-                driver,
-                row_index=row_idx,
-                local_pk=local_pk,
-                meta=meta,
-                attempts=attempts_each,
-                click_pause=panel_settle_pause,           # ✅ 전달
-                side_open_timeout=side_open_timeout,      # ✅ 전달
-                record_table_timeout=record_table_timeout # ✅ 전달
-            )
+    if journal is not None:
+        todo = ~s.apply(lambda r: journal.is_done(r["로컬 PK"], r["글로벌 PK"]), axis=1)
+        print(f"[JOURNAL] 대상 {len(s)}건 중 완료 {len(s) - int(todo.sum())}건 건너뜀", flush=True)
+        s = s[todo]
+    if only_pks is not None:
+        s = s[s["로컬 PK"].isin(set(only_pks))]
+    telemetry.set_total(len(s))
+
+    opts = dict(
+        attempts_each=attempts_each,
+        side_open_timeout=side_open_timeout,
+        record_table_timeout=record_table_timeout,
+        panel_settle_pause=panel_settle_pause,
+        http_client=http_client,
+        journal=journal,
+        html_cache=html_cache,
+        scheduler=scheduler,
+    )
+    buckets = [
+        (d, code, name, grp)
+        for (d, code, name), grp in s.groupby(["필터_일자","필터_종목코드","필터_종목명"], sort=False)
+    ]
+
+    # 저널이 있으면 최종 파일은 저널에서 만들므로 스트리밍 기록기는 저널이 없을 때만
+    writer = ResultWriter(out_csv, RECORD_COLS) if out_csv and journal is None else None
+    opts["writer"] = writer
+
+    piped = []  # 파이프라인 writer 스레드만 추가
+    if parse_procs:
+        def sink(key, rows_out, success, reason):
+            local_pk, meta = key
+            if journal is not None:
+                journal.record(local_pk, meta["글로벌 PK"], rows_out, success, reason)
+            telemetry.match_done(local_pk, success)
             if success:
-                results.extend(rows_out)
+                if writer is not None:
+                    writer.write(rows_out)
+                elif journal is None:
+                    piped.extend(rows_out)
+                print(f"[{local_pk:04d}] OK(파싱) | rows={len(rows_out):>2} | {meta['필터_일자']} / {meta['필터_종목명']}", flush=True)
             else:
-                print(f"[FAIL] 경기 {local_pk} 재수집 실패(최대 {attempts_each}회 시도)")
+                print(f"[FAIL] 경기 {local_pk} 파싱 실패: {reason}", flush=True)
+        opts["pipeline"] = ParsePipeline(parse_side_html, sink, processes=parse_procs, label="record")
 
-    if results:
-        df = pd.DataFrame(results)[[
-            "로컬 PK","글로벌 PK","필터_일자","필터_종목코드","필터_종목명",
-            "순위","시도","선수명","소속","학년","기록","신기록/비고"
-        ]]
-        df.to_csv(out_csv, index=False, encoding="utf-8-sig")
-        print(f"\n[저장] 전체 재수집 결과: {out_csv} | {len(df)}행")
-    else:
+    try:
+        if workers and workers > 1:
+            per_bucket = run_buckets_parallel(
+                buckets,
+                lambda drv, b: _recrawl_bucket(drv, *b, **opts),
+                workers=workers,
+                headless=headless,
+                pool=pool,
+                sido=sido,
+            )
+        else:
+            per_bucket = [_recrawl_bucket(driver, *b, **opts) for b in buckets]
+    except BaseException:
+        if writer is not None:
+            writer.abort()  # 이전 out_csv는 그대로 둔다
+        raise
+    finally:
+        if opts.get("pipeline") is not None:
+            opts["pipeline"].close()
+    per_bucket.append(piped)
+
+    # 저널이 있으면 이전 실행분까지 포함해 저널에서 최종 CSV를 만든다
+    if journal is not None:
+        return journal.materialize(out_csv, RECORD_COLS)
+    if writer is not None:
+        n = writer.close()
+        print(f"\n[저장] 전체 재수집 결과: {out_csv} | {n}행 ({writer.batches}묶음)")
+        return n
+
+    results = [row for rows in per_bucket for row in rows]
+    if not results:
         print("\n[저장] 전체 재수집 결과 없음")
+        return pd.DataFrame(columns=RECORD_COLS)
+    df = pd.DataFrame(results)
+    return df.sort_values(by="로컬 PK", kind="mergesort")[RECORD_COLS]
 
-def backfill_bracket_matches(driver):
-    # 전남만 선택(검색은 여기서 하지 않음)
-    open_jeonnam_only(driver)
-
-    # 스케줄/레코드 파일 경로를 문자열로 지정
-    schedule_path = "jeonnam_schedule_matches.csv"   
-    records_path  = "jeonnam_bracket_matches.csv" 
-    backfill_path = "jeonnam_bracket_backfill.csv"  
+# ================= 증분 갱신(상태 바뀐 경기만) =================
+def refresh_incremental(
+    driver,
+    schedule_csv="jeonnam_schedule_matches.csv",
+    records_csv="jeonnam_bracket_matches.csv",
+    schedule_opts=None,         # build_schedule_csv 추가 인자
+    recrawl_opts=None,          # recrawl_all_with_retry 추가 인자
+):
+    """
+    새 스케줄을 긁어 이전 스냅샷(schedule_csv)과 상태/일시를 비교 → 신규/변경/결과없음 경기만 재수집하고
+    기존 결과(records_csv)에 합친다. 두 CSV는 모두 끝난 뒤에 함께 덮어쓴다(중간에 죽어도 스냅샷 유지).
+    """
+    prev_s = pd.read_csv(schedule_csv, keep_default_na=False) if os.path.exists(schedule_csv) else None
+    prev_r = pd.read_csv(records_csv) if os.path.exists(records_csv) else None
+
+    cur_s = build_schedule_csv(driver, out_csv=None, **(schedule_opts or {}))
+    plan = diff_schedule(prev_s, cur_s, prev_results=prev_r)
+    todo = plan.loc[plan["변경"] != "", "로컬 PK"].tolist()
+    print(f"\n[INCREMENTAL] 스케줄 {len(cur_s)}건 | {summarize(plan)}", flush=True)
+
+    # 저널 없이 돌므로 파이프라인(parse_procs) 파싱 실패는 재시도되지 않는다 → 증분 갱신에서는 파싱도 브라우저 스레드에서
+    opts = {k: v for k, v in (recrawl_opts or {}).items() if k != "parse_procs"}
+    new_r = recrawl_all_with_retry(driver, schedule=cur_s, out_csv=None, only_pks=todo, **opts)
+    merged = merge_results(prev_r, new_r, prev_s, cur_s, refreshed_pks=todo)
+
+    cur_s.to_csv(schedule_csv, index=False, encoding="utf-8-sig")
+    merged.to_csv(records_csv, index=False, encoding="utf-8-sig")
+    print(f"[INCREMENTAL] 재수집 {len(todo)}경기 → {records_csv} {len(merged)}행", flush=True)
+    return plan, merged
+
+# ================= 재파싱(캐시 → CSV, 브라우저 없음) =================
+def reparse_from_cache(
+    html_cache,
+    schedule_csv="jeonnam_schedule_matches.csv",
+    records_csv="jeonnam_bracket_matches.csv",
+):
+    """캐시된 일정 표/사이드 패널 원본만으로 두 CSV를 다시 만든다(파서 수정 후 재수집 없이 반영)"""
+    cache = HtmlCache.open(html_cache)
+    t0 = time.perf_counter()
+
+    sched = sorted(cache.entries("record_schedule"), key=lambda e: e["meta"].get("order") or 0)
+    per_bucket = []
+    for e in sched:
+        m = e["meta"]
+        soup = parse_fragment(cache.get(e["hash"]), SCHEDULE_STRAINER)
+        rows, _ = parse_schedule_soup(soup, 0, m["필터_일자"], m["필터_종목코드"], m["필터_종목명"])
+        per_bucket.append(rows)
+    df_s = _save_schedule(per_bucket, schedule_csv) if sched else None
+
+    results, n_side = [], 0
+    for e, html in cache.iter_html("record_side"):
+        n_side += 1
+        target = _pick_second_record_table(parse_fragment(html, SIDE_STRAINER))
+        if target is None:
+            continue
+        results.extend(_parse_record_table(target, e["local_pk"], e["meta"]) or [])
+    df_r = pd.DataFrame(results, columns=RECORD_COLS)
+    if not df_r.empty:
+        df_r = df_r.sort_values(by="로컬 PK", kind="mergesort")
+    df_r.to_csv(records_csv, index=False, encoding="utf-8-sig")
+
+    dt = time.perf_counter() - t0
+    print(f"[REPARSE] 일정 {len(sched)}묶음 / 사이드 {n_side}건 → {len(df_r)}행 | {dt:.2f}s "
+          f"({(len(sched) + n_side) / dt if dt else 0:.0f}건/s)", flush=True)
+    return df_s, df_r
+
+def backfill_bracket_matches(driver, sido=JEONNAM, out_dir="."):
+    # 시도만 선택(검색은 여기서 하지 않음)
+    open_sido_only(driver, sido)
+
+    # 스케줄/레코드 파일 경로(시도별)
+    schedule_path = region_path(sido, "schedule_matches", out_dir)
+    records_path  = region_path(sido, "bracket_matches", out_dir)
+    backfill_path = region_path(sido, "bracket_backfill", out_dir)
     # 3) (옵션) 백필만 별도로 돌리고 싶으면 주석 해제
     backfill_missing_records(
         driver,
@@ -724,42 +1259,88 @@ def backfill_bracket_matches(driver):
         record_table_timeout=45,    # ← 두번째 표 최대 45초
         panel_settle_pause=0.15     # ← 클릭 후 살짝 더 길게 쉼
     )
-    split_df = pd.read_csv(records_path)
-    backfill_df = pd.read_csv(backfill_path)
-    df = (
-        pd.concat([split_df, backfill_df])
-        .sort_values(by="로컬 PK")
-        .reset_index(drop=True)
-    )
-    df.to_csv(records_path, index=False)
+    # 레코드 파일 전체를 다시 쓰지 않고 (로컬 PK, 글로벌 PK) 기준으로 백필분만 병합
+    if os.path.exists(backfill_path):
+        stats = upsert(records_path, pd.read_csv(backfill_path, encoding="utf-8-sig"), RECORD_COLS)
+        print(f"[저장] {records_path} 병합 | {stats}")
 
 # ================= 실행부 =================
 if __name__ == "__main__":
-    driver = setup_driver(headless=True)
+    # python sido_record_match_crawling.py reparse → 캐시에서 CSV만 다시 생성
+    # python sido_record_match_crawling.py refresh → 상태 바뀐 경기만 증분 갱신
+    # MEET_SIDO=경북 → 다른 시도 수집(기본 전남, 파일은 <시도>_*.csv). 여러 시도 동시 수집은 crawl_regions.py
+    sido = regions.get(os.environ.get("MEET_SIDO") or JEONNAM)
+    schedule_csv = region_path(sido, "schedule_matches")
+    records_csv = region_path(sido, "bracket_matches")
+    cache_dir = f"html_cache_record_{sido.slug}"
+    if sys.argv[1:2] == ["reparse"]:
+        reparse_from_cache(cache_dir, schedule_csv=schedule_csv, records_csv=records_csv)
+        sys.exit(0)
+
+    # 병렬 수집은 풀의 브라우저 4개로 하고, 이 브라우저는 일자/종목 목록 HTTP가 실패했을 때만 띄운다
+    driver = LazyDriver(headless=True, on_start=lambda drv: open_sido_only(drv, sido))
+    pool = new_driver_pool(size=4, sido=sido)  # 일정/재수집 두 단계가 같은 브라우저 4개를 재사용
+    # MEET_ADAPTIVE=0 이면 고정 타임아웃/동시 수(아래 값 그대로), 아니면 관측값으로 조정(아래 값은 기본/상한)
+    sched = None if os.environ.get("MEET_ADAPTIVE") == "0" else AdaptiveScheduler(max_concurrency=4)
+    # MEET_HTTP=0 이면 기존처럼 브라우저만 사용, MEET_RECORD=폴더 이면 응답을 replay_server용으로 저장
+    http = None if os.environ.get("MEET_HTTP") == "0" else MeetHttpClient(
+        record_dir=os.environ.get("MEET_RECORD") or None, scheduler=sched,
+    )
+    schedule_opts = dict(
+        search_result_timeout=60,   # 표 등장 최대 60초
+        max_load_more_clicks=40,    # 더보기 최대 40회
+        load_more_timeout=4,        # 더보기 후 행 증가 최대 4초
+        workers=4,                  # 병렬 브라우저 수(1이면 순차)
+        http_client=http,           # HTTP 우선, 실패 시 브라우저
+        html_cache=cache_dir,       # 일정 표 원본 저장(reparse용)
+        pool=pool,
+        sido=sido,
+    )
+    recrawl_opts = dict(
+        attempts_each=3,
+        side_open_timeout=20,       # ← 패널 등장 최대 20초
+        record_table_timeout=45,    # ← 두번째 표 최대 45초
+        panel_settle_pause=0.15,    # ← 클릭 후 살짝 더 길게 쉼
+        workers=4,                  # ← 병렬 브라우저 수(1이면 순차)
+        http_client=http,           # ← 사이드 패널 HTTP 우선
+        html_cache=cache_dir,       # ← 사이드 패널 원본 저장(reparse용)
+        pool=pool,
+        parse_procs=2,              # ← 패널 파싱은 별도 프로세스에서(브라우저는 HTML만 받고 다음 경기로)
+        sido=sido,
+        scheduler=sched,            # ← 위 타임아웃/정지는 기본값, 실제 값은 관측 p95로
+    )
+    # 경기별 구간 시간/실패 분류 → crawl_events_record_<시도>.jsonl, 10초마다 진행률/ETA, 종료 시 p50/p95 요약
+    telemetry.start(f"crawl_events_record_{sido.slug}.jsonl", label=f"record/{sido.name}")
     try:
-        # 1) 스케줄 생성(로컬 PK/글로벌 PK 포함)
-        schedule_df = build_schedule_csv(
-            driver,
-            out_csv="jeonnam_schedule_matches.csv",
-            search_result_timeout=60,   # 표 등장 최대 60초
-            results_settle_pause=1.2,   # 표 뜬 뒤 1.2초 더 대기
-            max_load_more_clicks=40,    # 더보기 최대 40회
-            load_more_pause=1.0         # 더보기 사이 1초 간격
-        )
+        if sys.argv[1:2] == ["refresh"]:
+            # 대회 기간 중 갱신: 이전 스케줄 대비 신규/상태 변경 경기만 재수집 후 병합
+            refresh_incremental(
+                driver,
+                schedule_csv=schedule_csv,
+                records_csv=records_csv,
+                schedule_opts=schedule_opts,
+                recrawl_opts=recrawl_opts,
+            )
+        else:
+            # 1) 스케줄 생성(로컬 PK/글로벌 PK 포함)
+            schedule_df = build_schedule_csv(driver, out_csv=schedule_csv, **schedule_opts)
 
-        # 2) 최초 실행 모드: 방금 생성한 스케줄로 전체 재수집
-        recrawl_all_with_retry(
-            driver,
-            schedule=schedule_df,       # DF 또는 CSV 경로 사용 가능
-            out_csv="jeonnam_bracket_matches.csv",
-            attempts_each=3,            
-            side_open_timeout=20,       # ← 패널 등장 최대 20초
-            record_table_timeout=45,    # ← 두번째 표 최대 45초
-            panel_settle_pause=0.15     # ← 클릭 후 살짝 더 길게 쉼
-        )
+            # 2) 최초 실행 모드: 방금 생성한 스케줄로 전체 재수집
+            recrawl_all_with_retry(
+                driver,
+                schedule=schedule_df,       # DF 또는 CSV 경로 사용 가능
+                out_csv=records_csv,
+                journal=region_path(sido, "bracket_matches", ext=".journal.sqlite"),  # ← 중단 후 재실행 시 이어서 수집
+                **recrawl_opts,
+            )
 
-        # backfill_bracket_matches(driver)
+        # backfill_bracket_matches(driver, sido=sido)
 
-        
     finally:
+        telemetry.finish()
+        if sched is not None:
+            print_polite_report(sched.report())
+        if http is not None:
+            http.close()
+        pool.close()
         driver.quit()
@@ -1,34 +1,48 @@
+import os
 import re
+import sys
 import time
 import logging
 import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.alert import Alert
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, UnexpectedAlertPresentException, JavascriptException
-
-URL = "https://meet.sports.or.kr/national/schedule/scheduleT.do"
+from driver_manager import setup_driver
+from dom import SCHEDULE_STRAINER, SIDE_STRAINER, outer_html, parse_fragment, schedule_tables_html
+from html_cache import HtmlCache
+from http_client import BASE_URL, HttpFetchError, MeetHttpClient
+from incremental import diff_schedule, merge_results, summarize
+from journal import CrawlJournal
+from pipeline import ParsePipeline
+from politeness import AdaptiveScheduler, print_report as print_polite_report
+import regions
+from regions import JEONNAM, region_path
+from writers import ResultWriter
+from row_registry import RowRegistry
+import telemetry
+from waits import expand_list, mark_stale, set_page_size, wait_caption_table, wait_rows_or_empty
+
+URL = f"{BASE_URL}/national/schedule/scheduleT.do"
+SCHEDULE_CAPTION = "시·도 토너먼트 경기일정"
+SCHEDULE_ROWS_CSS = "table.tablesaw.tablesaw-stack tbody > tr"
+LIST_PAGE_SIZE = 1000
+LOAD_MORE_XPATH = "//button[normalize-space()='더보기' or contains(.,'더보기')] | //a[normalize-space()='더보기' or contains(.,'더보기')]"
+# 사이드바 참가선수 행(PC 표 또는 모바일 목록)
+PLAYERS_ROWS_CSS = "table.pcView tbody tr, div.mobView ul.box-list > li"
 log = logging.getLogger("meet-sports")
 
+# 기본(전남) 산출물. 다른 시도는 region_path(sido, "schedule_tournament") 등
+SCHEDULE_CSV = region_path(JEONNAM, "schedule_tournament")
+BRACKET_CSV = region_path(JEONNAM, "bracket_tournament")
+HTML_CACHE_DIR = "html_cache_tournament"
+# 저장 컬럼 순서
+SCHEDULE_COLS = ["로컬 PK","글로벌 PK","종목정보","종별","세부종목","경기구분","상태","일시","경기장","시도"]
+BRACKET_COLS = ["로컬 PK","글로벌 PK","경기 제목","팀 구분","출전","선수명","소속[학년]","포지션"]
 
-# ================= 공통 =================
-def setup_driver(headless=True):
-    options = Options()
-    if headless:
-        options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1400,2400")
-    options.set_capability("unhandledPromptBehavior", "accept")
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    return driver
 
+# ================= 공통 =================
 def accept_alert_if_present(driver, timeout=2):
     try:
         WebDriverWait(driver, timeout).until(EC.alert_is_present())
@@ -47,20 +61,17 @@ def wait_ignoring_alerts(driver, condition, timeout=20, retries=2):
                 raise
     return WebDriverWait(driver, timeout).until(condition)
 
-def click_load_more_if_exists(driver, max_clicks=30):
-    wait_short = WebDriverWait(driver, 4)
-    clicks = 0
-    while clicks < max_clicks:
-        try:
-            more = wait_short.until(EC.element_to_be_clickable((
-                By.XPATH, "//button[normalize-space()='더보기' or contains(.,'더보기')] | //a[normalize-space()='더보기' or contains(.,'더보기')]"
-            )))
-            driver.execute_script("arguments[0].click();", more)
-            time.sleep(1.0)
-            clicks += 1
-        except Exception:
-            break
-    return clicks
+def click_load_more_if_exists(driver, max_clicks=30, grow_timeout=4):
+    """
+    '더보기'를 끝까지 펼친다(브라우저 안에서 클릭 → 행 증가 감지 → 다음 클릭, WebDriver 왕복 1회).
+    로드된 행 수와 '총 N건'을 비교해 출력하고 expand_list 결과 dict 반환
+    """
+    res = expand_list(driver, SCHEDULE_ROWS_CSS, LOAD_MORE_XPATH, max_clicks=max_clicks, grow_timeout=grow_timeout)
+    expected = res["expected"]
+    short = expected is not None and res["count"] < expected
+    print(f"  - [LIST] 행 {res['count']}/{expected if expected is not None else '?'} 로드 "
+          f"(더보기 {res['clicks']}회, {res['state']}){' ⚠ 덜 펼쳐짐' if short else ''}", flush=True)
+    return res
 
 def _normalize(s: str) -> str:
     if s is None:
@@ -103,20 +114,6 @@ def _cell_text_bs(td):
     txt = span.get_text(" ", strip=True) if span else td.get_text(" ", strip=True)
     return _normalize(txt)
 
-def _cell_text_el(td_el):
-    # 우선 content span의 textContent(숨김 포함) → 비면 td 자체의 textContent → 마지막 폴백 .text
-    try:
-        span = td_el.find_element(By.CSS_SELECTOR, "span.tablesaw-cell-content")
-        txt = span.get_attribute("textContent")
-        if not _normalize(txt):
-            txt = td_el.get_attribute("textContent")
-        return _normalize(txt)
-    except Exception:
-        try:
-            return _normalize(td_el.get_attribute("textContent"))
-        except Exception:
-            return _normalize(td_el.text)
-
 def _build_global_pk(sport, kind, subkind, matchtype):
     # 필요시 슬러그화 규칙 추가 가능(지금은 정규화만)
     return f"{_normalize(sport)}_{_normalize(kind)}_{_normalize(subkind)}_{_normalize(matchtype)}"
@@ -275,7 +272,8 @@ def _parse_team_pc_table(team_li, team_name, match_title, local_pk, global_pk):
     return rows
 
 # ================= 페이지 조작/목록 =================
-def open_and_select_jeonnam_all_dates(driver):
+def open_and_select_sido_all_dates(driver, sido=JEONNAM):
+    sido = regions.get(sido)
     wait = WebDriverWait(driver, 20)
     driver.get(URL)
 
@@ -284,22 +282,25 @@ def open_and_select_jeonnam_all_dates(driver):
         sido_btn.click()
     except Exception:
         sido_btn = wait.until(EC.element_to_be_clickable((
-            By.XPATH, "//button[contains(@class,'search-cities-provinces') and contains(.,'전남')]"
+            By.XPATH, "//button[contains(@class,'search-cities-provinces')]"
         )))
         sido_btn.click()
 
     try:
-        jeonnam_li = wait.until(EC.element_to_be_clickable((
-            By.XPATH, "//ul[@id='sidoCdList']//li[contains(@onclick, \"getGmDtList('13','전남')\")]"
+        sido_li = wait.until(EC.element_to_be_clickable((
+            By.XPATH, f"//ul[@id='sidoCdList']//li[contains(@onclick, \"getGmDtList('{sido.code}','{sido.name}')\")]"
         )))
-        jeonnam_li.click()
+        sido_li.click()
     except Exception:
-        jeonnam_li = wait.until(EC.element_to_be_clickable((
-            By.XPATH, "//ul[@id='sidoCdList']//li/a[normalize-space()='전남']/parent::li"
+        sido_li = wait.until(EC.element_to_be_clickable((
+            By.XPATH, f"//ul[@id='sidoCdList']//li/a[normalize-space()='{sido.name}']/parent::li"
         )))
-        jeonnam_li.click()
+        log.warning(f"[INIT] {sido.name} 코드 불일치 의심(onclick={sido_li.get_attribute('onclick')}) → regions.SIDOS 확인")
+        sido_li.click()
 
     accept_alert_if_present(driver, timeout=3)
+    # 폼에 페이지 크기 필드가 있으면 한 번에 받도록(없으면 더보기로 펼침)
+    set_page_size(driver, LIST_PAGE_SIZE)
 
     try:
         search_btn = wait.until(EC.element_to_be_clickable((
@@ -317,7 +318,8 @@ def open_and_select_jeonnam_all_dates(driver):
         timeout=20,
         retries=2
     )
-    time.sleep(1.0)
+    # 고정 1초 대기 대신 경기일정 표에 행이 채워지는 순간까지
+    wait_caption_table(driver, SCHEDULE_CAPTION, timeout=10)
 
 def _row_map_by_label_bs(tr):
     """
@@ -334,8 +336,14 @@ def _row_map_by_label_bs(tr):
         m[label] = val
     return m
 
-def parse_all_tables(driver):
-    soup = BeautifulSoup(driver.page_source, "lxml")
+def parse_all_tables(driver, html_cache=None):
+    # 페이지 전체 대신 일정 표(+종목 라벨)만 잘라 온다
+    html = schedule_tables_html(driver, SCHEDULE_CAPTION, allow_uncaptioned=True)
+    if html_cache is not None:
+        html_cache.put("tournament_schedule", html, filter="전체")
+    return parse_all_tables_soup(parse_fragment(html))
+
+def parse_all_tables_soup(soup):
     results = []
     seq = 1
 
@@ -394,68 +402,139 @@ def parse_all_tables(driver):
     return results
 
 
-# =============== (클릭용) tr에서 PK 구성에 필요한 메타 추출 ===============
-def _sport_label_from_tr(tr_el):
-    # 해당 tr 소속 table의 바로 앞쪽 h5 텍스트를 우선 시도
-    # 1) id='classNm' 또는 class='subTit'가 가장 신뢰도 높음
-    for xp in [
-        "ancestor::table/preceding::h5[@id='classNm' or contains(@class,'subTit')][1]",
-        "ancestor::table/preceding::h5[1]"
-    ]:
-        try:
-            h5 = tr_el.find_element(By.XPATH, xp)
-            return _normalize(h5.text)
-        except Exception:
-            continue
-    return ""
-
-def _row_map_by_label_el(tr_el):
+# =============== (클릭용) 행 메타 → PK 구성 요소 ===============
+def _pk_meta_from_row(row, last_kind=None):
+    """dom.schedule_rows()의 한 행(라벨 → 값, 종목 라벨) → (종목, 종별, 세부종목, 경기구분)"""
     m = {}
-    for td in tr_el.find_elements(By.TAG_NAME, "td"):
-        try:
-            label_el = td.find_element(By.CSS_SELECTOR, "b.tablesaw-cell-label")
-        except Exception:
-            continue
-        # 라벨도 .text가 아니라 textContent로! (PC뷰에서 숨겨져 있어도 읽힘)
-        label = _normalize(label_el.get_attribute("textContent"))
-        if not label:   # 빈 라벨은 스킵
-            continue
-        val = _cell_text_el(td)
-        m[label] = val
-    return m
-
-def _pk_meta_from_tr(tr_el, last_kind=None):
-    m = _row_map_by_label_el(tr_el)
+    for label, val in (row.get("labels") or {}).items():
+        label = _normalize(label)
+        if label:   # 빈 라벨은 스킵
+            m[label] = _normalize(val)
     kind      = m.get("종별") or (last_kind or "")
     subkind   = _clean_subkind(m.get("세부종목", ""), log)  # <-- 정제 적용
     matchtype = m.get("경기구분", "")
-    sport     = _sport_label_from_tr(tr_el)
+    sport     = _normalize(row.get("sport", ""))
     return sport, kind, subkind, matchtype
 
 
 
 # =============== 선수명단(대진표) 파싱 (PK 포함) ===============
+def parse_side_players(side_soup, local_pk, global_pk):
+    """사이드바 HTML → (경기 제목, 선수 행 목록, 실패 사유 또는 None)"""
+    title = _build_match_title(side_soup) or "(제목없음)"
+    rows = []
+    part = side_soup.select_one("div.participating-players > ul")
+    if not part:
+        return title, rows, "참가선수 섹션 없음(div.participating-players > ul 미존재)"
+    for team_li in part.find_all("li", recursive=False):
+        h6 = team_li.find("h6")
+        if not h6:
+            continue
+        m = re.search(r"\((.*?)\)", _normalize(h6.get_text(" ", strip=True)))
+        team_name = m.group(1) if m else _normalize(h6.get_text(" ", strip=True))
+
+        rows_pc = _parse_team_pc_table(team_li, team_name, title, local_pk, global_pk)
+        if rows_pc:
+            rows.extend(rows_pc)
+        else:
+            rows.extend(_parse_team_mob_list(team_li, team_name, title, local_pk, global_pk))
+    return title, rows, None
+
+
+def parse_side_html(html, local_pk, global_pk):
+    """사이드바 outerHTML → (선수 행 목록, 성공 여부, 실패 사유). 파싱 프로세스(pipeline.py)에서 호출"""
+    _, rows, reason = parse_side_players(parse_fragment(html), local_pk, global_pk)
+    if rows:
+        return rows, True, ""
+    return rows, False, reason or "선수 테이블 파싱 결과 0건"
+
+def fetch_side_http(http_client, side_call, local_pk, global_pk, sport="", kind="", html_cache=None):
+    """
+    openSide 호출을 HTTP로 재현해 사이드바를 받아 파싱 → (선수 행 목록, 실패 사유). 빈 목록이면 브라우저로 폴백.
+    폼 필드가 무시되면 다른 경기 사이드바가 올 수 있으므로 경기 제목에 종목/종별이 있어야 인정한다.
+    """
+    ev = telemetry.attempt(local_pk, global_pk, source="http")
+    try:
+        with ev.stage("http_fetch"):
+            html = http_client.side_html(side_call, endpoint="side_T")
+    except HttpFetchError as e:
+        ev.finish(False, f"HTTP: {e}")
+        return [], f"HTTP: {e}"
+    with ev.stage("parse"):
+        title, rows, reason = parse_side_players(parse_fragment(html, SIDE_STRAINER), local_pk, global_pk)
+    if rows and not all(x in title for x in (_normalize(sport), _normalize(kind)) if x):
+        rows, reason = [], f"경기 불일치(제목 '{title}')"
+    if not rows:
+        reason = f"HTTP: {reason or '선수 테이블 파싱 결과 0건'}"
+        ev.finish(False, reason)
+        return [], reason
+    if html_cache is not None:
+        html_cache.put("tournament_side", html, global_pk=global_pk, local_pk=local_pk)
+    ev.finish(True, rows=len(rows))
+    return rows, ""
+
 def parse_bracket_for_all_matches(
     driver,
     start_seq=1,
     max_rows=None,
     click_pause=0.2,
-    sidebar_wait=1.0,      # 사이드바 열리고 안정화 대기(초)
+    sidebar_wait=3.0,      # 사이드바 참가선수 행이 채워질 때까지 최대 대기(초)
     wait_timeout=12,       # WebDriverWait 타임아웃
     retries=1,             # 행 단위 재시도 횟수
     logger=None,
+    journal=None,          # 저널 경로/CrawlJournal: 경기별 체크포인트, 재실행 시 완료 경기 건너뜀
+    html_cache=None,       # HtmlCache/경로: 사이드바 원본 저장(재파싱용)
+    only_pks=None,         # 이 로컬 PK들만 수집(증분 갱신용)
+    parse_procs=0,         # >0이면 브라우저는 사이드바 HTML만 받고 파싱은 프로세스 풀(pipeline.py)에서
+    out_csv=None,          # 주면 행을 모아 두지 않고 이 파일(.csv/.parquet)로 흘려 쓰고 행 수 반환
+    scheduler=None,        # politeness.AdaptiveScheduler: wait_timeout/sidebar_wait/재시도 간격을 관측값으로(위 값은 기본값)
+    http_client=None,      # MeetHttpClient: 사이드바를 HTTP로 먼저 받고, 실패/불일치면 브라우저로
 ):
     """
     목록의 모든 경기(tr)에 대해 사이드바 '대진표' 정보를 수집한다.
     상세 로깅 포함: 어떤 종목/종별/세부종목/경기구분을 처리 중인지, 성공/실패 및 실패 사유를 출력.
+    http_client를 주면 경기마다 사이드바를 HTTP로 먼저 받고(fetch_side_http), 실패하거나 다른 경기 것이면 브라우저로 연다.
+    journal을 주면 경기마다 결과를 바로 기록하고, 반환값은 이전 실행분을 포함한 저널 전체 행이다.
+    out_csv를 주면 경기마다 writers.ResultWriter로 흘려 쓰고(journal이 있으면 끝난 뒤 저널에서 로컬 PK 순서로) 행 수를 반환한다.
+    parse_procs 사용 시 0건 경기는 행 단위 재시도 없이 실패로 기록된다(journal과 함께 쓰고 재실행으로 보완).
     """
     logger = logger or log
+    journal = CrawlJournal.open(journal)
+    html_cache = HtmlCache.open(html_cache)
+    if only_pks is not None:
+        only_pks = set(int(pk) for pk in only_pks)
     bracket_rows = []
-    row_xpath = ("//table[.//caption[contains(normalize-space(),'시·도 토너먼트 경기일정')]]//tbody/tr")
     seq = start_seq
     idx = 0
     last_kind = ""  # rowspan carry
 
+    # 경기 행은 한 번만 찾아 두고(openSide 인자로 식별), 다시 그려졌을 때만 재해석
+    registry = RowRegistry(driver, SCHEDULE_CAPTION)
+    telemetry.set_total(len(only_pks) if only_pks is not None else len(registry))
+
+    # 저널이 있으면 최종 파일은 저널에서 만들므로 스트리밍 기록기는 저널이 없을 때만
+    writer = ResultWriter(out_csv, BRACKET_COLS) if out_csv and journal is None else None
+
+    def keep(rows):
+        if writer is not None:
+            writer.write(rows)
+        elif journal is None:
+            bracket_rows.extend(rows)
+
+    pipeline = None
+    if parse_procs:
+        def sink(key, rows, ok, reason):
+            local_pk, global_pk = key
+            keep(rows)
+            if journal is not None:
+                journal.record(local_pk, global_pk, rows, ok, reason or None)
+            telemetry.match_done(local_pk, ok)
+            if ok:
+                logger.info(f"[#{local_pk}] 성공(파싱): 선수 {len(rows)}명 추출 완료")
+            else:
+                logger.warning(f"[#{local_pk}] 실패(파싱): {reason}")
+        pipeline = ParsePipeline(parse_side_html, sink, processes=parse_procs, label="tournament")
+
     def _close_sidebar_safely():
         try:
             close_btn = WebDriverWait(driver, 5).until(
@@ -471,168 +550,261 @@ def parse_bracket_for_all_matches(
         except Exception as e:
             return False, f"사이드 닫기 예외: {type(e).__name__}: {e}"
 
-    while True:
-        rows = driver.find_elements(By.XPATH, row_xpath)
-        if idx >= len(rows):
-            logger.info(f"대진표 파싱 종료: 총 {seq - start_seq}개 행 시도")
-            break
-        if max_rows and (seq - start_seq) >= max_rows:
-            logger.info(f"대진표 파싱 종료(최대 {max_rows}개): 총 {seq - start_seq}개 행 시도")
-            break
-
-        tr = rows[idx]
-        # 메타 추출(클릭 전) + 종별 carry
-        try:
-            sport, kind, subkind, matchtype = _pk_meta_from_tr(tr, last_kind)
-            if kind:
-                last_kind = kind
-            global_pk = _build_global_pk(sport, kind, subkind, matchtype)
-            logger.info(f"[#{seq}] 대상: 종목='{sport}', 종별='{kind}', 세부종목='{subkind}', 경기구분='{matchtype}', PK='{global_pk}'")
-        except Exception as e:
-            logger.error(f"[#{seq}] 메타 추출 실패: {type(e).__name__}: {e}")
-            # 실패해도 다음 행으로 이동
-            seq += 1
-            idx += 1
-            continue
-
-        # 행 처리 (재시도 포함)
-        attempt = 0
-        success_for_this_row = False
-        fail_reason = None
-        local_pk = seq
+    try:
+        while True:
+            if idx >= len(registry):
+                logger.info(f"대진표 파싱 종료: 총 {seq - start_seq}개 행 시도")
+                break
+            if max_rows and (seq - start_seq) >= max_rows:
+                logger.info(f"대진표 파싱 종료(최대 {max_rows}개): 총 {seq - start_seq}개 행 시도")
+                break
 
-        while attempt <= retries and not success_for_this_row:
+            # 메타 추출(클릭 전, 화면 로딩 시 함께 받아 둔 값) + 종별 carry
             try:
-                # 클릭 타겟 결정
-                try:
-                    td_click = tr.find_element(By.XPATH, ".//td[contains(@onclick,'openSide')][1]")
-                except Exception:
-                    td_click = tr.find_element(By.XPATH, "./td[1]")
-
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", td_click)
-                call = td_click.get_attribute("onclick")
-
-                # 사이드 열기
-                if call and "openSide" in call:
-                    try:
-                        driver.execute_script(call.strip().rstrip(";"))
-                    except JavascriptException:
-                        driver.execute_script("arguments[0].click();", td_click)
-                else:
-                    driver.execute_script("arguments[0].click();", td_click)
+                sport, kind, subkind, matchtype = _pk_meta_from_row(registry.items[idx], last_kind)
+                if kind:
+                    last_kind = kind
+                global_pk = _build_global_pk(sport, kind, subkind, matchtype)
+                if only_pks is not None and seq not in only_pks:
+                    seq += 1
+                    idx += 1
+                    continue
+                if journal is not None and journal.is_done(seq, global_pk):
+                    logger.info(f"[#{seq}] 저널에 완료 기록 있음 → 건너뜀 (PK='{global_pk}')")
+                    seq += 1
+                    idx += 1
+                    continue
+                logger.info(f"[#{seq}] 대상: 종목='{sport}', 종별='{kind}', 세부종목='{subkind}', 경기구분='{matchtype}', PK='{global_pk}'")
+            except Exception as e:
+                logger.error(f"[#{seq}] 메타 추출 실패: {type(e).__name__}: {e}")
+                # 실패해도 다음 행으로 이동
+                seq += 1
+                idx += 1
+                continue
 
-                # 사이드 가시성/콘텐츠 대기
-                WebDriverWait(driver, wait_timeout).until(
-                    EC.visibility_of_element_located((By.CSS_SELECTOR, "div.record"))
-                )
-                WebDriverWait(driver, wait_timeout).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.record .scoreTop"))
+            # 행 처리 (재시도 포함)
+            attempt = 0
+            success_for_this_row = False
+            fail_reason = None
+            local_pk = seq
+            match_rows = []
+            piped = False
+
+            if http_client is not None and registry.calls[idx]:
+                match_rows, fail_reason = fetch_side_http(
+                    http_client, registry.calls[idx], local_pk, global_pk, sport, kind, html_cache=html_cache,
                 )
-                # 참가선수 블록(있다면)도 기다려봄
+                if match_rows:
+                    logger.info(f"[#{seq}] 성공(HTTP): 선수 {len(match_rows)}명 추출 완료")
+                    success_for_this_row = True
+                else:
+                    logger.info(f"[#{seq}] {fail_reason} → 브라우저 폴백")
+                    fail_reason = None
+
+            while attempt <= retries and not success_for_this_row:
+                ev = telemetry.attempt(local_pk, global_pk, attempt=attempt + 1)
+                t0 = time.perf_counter()
+                open_timeout, rows_wait = wait_timeout, sidebar_wait
+                if scheduler is not None:
+                    open_timeout = scheduler.timeout("tournament_side", wait_timeout)
+                    rows_wait = scheduler.timeout("tournament_players", sidebar_wait)
                 try:
-                    WebDriverWait(driver, 3).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.participating-players > ul"))
-                    )
-                except TimeoutException:
-                    pass  # 없어도 진행
-
-                # 추가 안정화 대기(요청사항 반영)
-                time.sleep(sidebar_wait)
-
-                # 파싱
-                side_soup = BeautifulSoup(driver.page_source, "lxml")
-                title = _build_match_title(side_soup) or "(제목없음)"
-
-                extracted = 0
-                part = side_soup.select_one("div.participating-players > ul")
-                if part:
-                    for team_li in part.find_all("li", recursive=False):
-                        h6 = team_li.find("h6")
-                        if not h6:
-                            continue
-                        m = re.search(r"\((.*?)\)", _normalize(h6.get_text(" ", strip=True)))
-                        team_name = m.group(1) if m else _normalize(h6.get_text(" ", strip=True))
-
-                        rows_pc = _parse_team_pc_table(team_li, team_name, title, local_pk, global_pk)
-                        if rows_pc:
-                            bracket_rows.extend(rows_pc)
-                            extracted += len(rows_pc)
+                    with ev.stage("panel_open"):
+                        # 직전 경기의 사이드 내용은 '이전 결과'로 표시 → 새로 그려진 내용만 대기
+                        mark_stale(driver, "div.participating-players li, div.participating-players tr")
+
+                        # 사이드 열기(openSide 직접 호출, 안 되면 행 클릭)
+                        registry.open(idx)
+
+                        # 사이드 가시성/콘텐츠 대기
+                        t_open = time.perf_counter()
+                        WebDriverWait(driver, open_timeout).until(
+                            EC.visibility_of_element_located((By.CSS_SELECTOR, "div.record"))
+                        )
+                        WebDriverWait(driver, open_timeout).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "div.record .scoreTop"))
+                        )
+                        if scheduler is not None:
+                            scheduler.observe("tournament_side", time.perf_counter() - t_open)
+                    # 참가선수 행(있다면)이 채워지는 순간까지만 대기 — 없어도 진행
+                    with ev.stage("table_ready"):
+                        t_rows = time.perf_counter()
+                        rows_state = wait_rows_or_empty(
+                            driver, PLAYERS_ROWS_CSS, root="div.participating-players", timeout=rows_wait,
+                        )["state"]
+                        # 선수 목록이 아예 없는 경기도 있어 시간 초과는 파싱 결과가 0건일 때만 표본으로 넣는다(아래)
+                        if scheduler is not None and rows_state != "timeout":
+                            scheduler.observe("tournament_players", time.perf_counter() - t_rows)
+
+                    # 파싱
+                    # 페이지 전체(page_source) 대신 사이드바 컨테이너만
+                    with ev.stage("parse"):
+                        html = outer_html(driver, "div.record", "div.participating-players")
+                        if html_cache is not None:
+                            html_cache.put("tournament_side", html, global_pk=global_pk, local_pk=local_pk)
+                        if pipeline is None:
+                            title, match_rows, fail_reason = parse_side_players(parse_fragment(html), local_pk, global_pk)
+                    extracted = len(match_rows)
+
+                    # 사이드 닫기
+                    with ev.stage("close"):
+                        closed, close_reason = _close_sidebar_safely()
+                    if not closed:
+                        logger.warning(f"[#{seq}] 사이드 닫기 경고: {close_reason}")
+
+                    if pipeline is not None:
+                        # 파싱/저널 기록은 파이프라인 sink에서(브라우저는 바로 다음 경기로)
+                        pipeline.submit((local_pk, global_pk), html, local_pk, global_pk,
+                                        fetch_ms=(time.perf_counter() - t0) * 1000)
+                        success_for_this_row = piped = True
+                    elif extracted > 0:
+                        logger.info(f"[#{seq}] 성공: '{title}' 선수 {extracted}명 추출 완료")
+                        success_for_this_row = True
+                    else:
+                        if not fail_reason:
+                            fail_reason = "선수 테이블 파싱 결과 0건"
+                        logger.warning(f"[#{seq}] 실패: '{title}' — {fail_reason}")
+                        if scheduler is not None and rows_state == "timeout":
+                            scheduler.observe("tournament_players", rows_wait, ok=False)
+                        # 재시도 여부 결정
+                        if attempt < retries:
+                            logger.info(f"[#{seq}] 재시도({attempt+1}/{retries}) 대기 후 진행")
+                            if scheduler is not None:
+                                scheduler.backoff("tournament_side", attempt + 1)
+                            else:
+                                time.sleep(0.8)
                         else:
-                            mob_rows = _parse_team_mob_list(team_li, team_name, title, local_pk, global_pk)
-                            bracket_rows.extend(mob_rows)
-                            extracted += len(mob_rows)
-                else:
-                    fail_reason = "참가선수 섹션 없음(div.participating-players > ul 미존재)"
-
-                # 사이드 닫기
-                closed, close_reason = _close_sidebar_safely()
-                if not closed:
-                    logger.warning(f"[#{seq}] 사이드 닫기 경고: {close_reason}")
+                            break
 
-                if extracted > 0:
-                    logger.info(f"[#{seq}] 성공: '{title}' 선수 {extracted}명 추출 완료")
-                    success_for_this_row = True
-                else:
-                    if not fail_reason:
-                        fail_reason = "선수 테이블 파싱 결과 0건"
-                    logger.warning(f"[#{seq}] 실패: '{title}' — {fail_reason}")
-                    # 재시도 여부 결정
+                except UnexpectedAlertPresentException:
+                    accepted = accept_alert_if_present(driver, timeout=2)
+                    if accepted:
+                        fail_reason = "경고창 감지(확인 후 재시도)"
+                        logger.warning(f"[#{seq}] 경고창 감지 → 확인 처리 후 재시도")
+                    else:
+                        fail_reason = "경고창 처리 실패"
+                        logger.error(f"[#{seq}] {fail_reason}")
+                        break
+                except TimeoutException as e:
+                    fail_reason = f"타임아웃: {e}"
+                    logger.error(f"[#{seq}] {fail_reason}")
+                    if scheduler is not None:
+                        # 시간 초과 표본(쓴 타임아웃 값) → 다음 타임아웃이 늘어난다
+                        scheduler.observe("tournament_side", open_timeout, ok=False)
+                        scheduler.backoff("tournament_side", attempt + 1)
                     if attempt < retries:
-                        logger.info(f"[#{seq}] 재시도({attempt+1}/{retries}) 대기 후 진행")
-                        time.sleep(0.8)
+                        logger.info(f"[#{seq}] 재시도({attempt+1}/{retries})")
                     else:
                         break
-
-            except UnexpectedAlertPresentException:
-                accepted = accept_alert_if_present(driver, timeout=2)
-                if accepted:
-                    logger.warning(f"[#{seq}] 경고창 감지 → 확인 처리 후 재시도")
-                else:
-                    fail_reason = "경고창 처리 실패"
+                except StaleElementReferenceException as e:
+                    fail_reason = f"StaleElement: {e}"
+                    logger.warning(f"[#{seq}] {fail_reason}")
+                    # 행이 다시 그려졌으면 그때만 목록 재해석
+                    try:
+                        registry.refresh()
+                    except Exception:
+                        pass
+                    if attempt < retries:
+                        logger.info(f"[#{seq}] 재시도({attempt+1}/{retries})")
+                    else:
+                        break
+                except JavascriptException as e:
+                    fail_reason = f"JS 실행 오류: {e}"
+                    logger.error(f"[#{seq}] {fail_reason}")
+                    if attempt < retries:
+                        logger.info(f"[#{seq}] 재시도({attempt+1}/{retries})")
+                    else:
+                        break
+                except Exception as e:
+                    fail_reason = f"미처리 예외 {type(e).__name__}: {e}"
                     logger.error(f"[#{seq}] {fail_reason}")
                     break
-            except TimeoutException as e:
-                fail_reason = f"타임아웃: {e}"
-                logger.error(f"[#{seq}] {fail_reason}")
-                if attempt < retries:
-                    logger.info(f"[#{seq}] 재시도({attempt+1}/{retries})")
-                else:
-                    break
-            except StaleElementReferenceException as e:
-                fail_reason = f"StaleElement: {e}"
-                logger.warning(f"[#{seq}] {fail_reason}")
-                # 목록 다시 찾아 새 tr로 교체 시도
-                try:
-                    rows = driver.find_elements(By.XPATH, row_xpath)
-                    if idx < len(rows):
-                        tr = rows[idx]
-                except Exception:
-                    pass
-                if attempt < retries:
-                    logger.info(f"[#{seq}] 재시도({attempt+1}/{retries})")
-                else:
-                    break
-            except JavascriptException as e:
-                fail_reason = f"JS 실행 오류: {e}"
-                logger.error(f"[#{seq}] {fail_reason}")
-                if attempt < retries:
-                    logger.info(f"[#{seq}] 재시도({attempt+1}/{retries})")
-                else:
-                    break
-            except Exception as e:
-                fail_reason = f"미처리 예외 {type(e).__name__}: {e}"
-                logger.error(f"[#{seq}] {fail_reason}")
-                break
-            finally:
-                attempt += 1
+                finally:
+                    attempt += 1
+                    ev.finish(success_for_this_row, fail_reason, rows=len(match_rows))
 
-        # 다음 행으로 이동
-        seq += 1
-        idx += 1
+            if not piped:
+                keep(match_rows)
+                if journal is not None:
+                    journal.record(local_pk, global_pk, match_rows, success_for_this_row, fail_reason)
+                telemetry.match_done(local_pk, success_for_this_row)
 
+            # 다음 행으로 이동
+            seq += 1
+            idx += 1
+    except BaseException:
+        if writer is not None:
+            writer.abort()  # 이전 out_csv는 그대로 둔다
+        raise
+    finally:
+        # 예외로 빠져나가도 파싱 프로세스를 남기지 않도록
+        if pipeline is not None:
+            pipeline.close()
+
+    if journal is not None:
+        return journal.materialize(out_csv, BRACKET_COLS) if out_csv else journal.rows()
+    if writer is not None:
+        n = writer.close()
+        logger.info(f"저장 완료: {out_csv} {n}행 ({writer.batches}묶음)")
+        return n
     return bracket_rows
 
 
+# ================= 증분 갱신(상태 바뀐 경기만) =================
+def refresh_incremental(driver, schedule_csv=SCHEDULE_CSV, bracket_csv=BRACKET_CSV, html_cache=None, sido=JEONNAM,
+                        http_client=None):
+    """
+    새 스케줄을 이전 스냅샷(schedule_csv)과 상태/일시로 비교 → 신규/변경/결과없음 경기만 사이드바를 다시 긁고
+    기존 선수명단(bracket_csv)에 합친다. 두 CSV는 모두 끝난 뒤에 함께 덮어쓴다.
+    """
+    prev_s = pd.read_csv(schedule_csv, keep_default_na=False) if os.path.exists(schedule_csv) else None
+    prev_r = pd.read_csv(bracket_csv) if os.path.exists(bracket_csv) else None
+
+    open_and_select_sido_all_dates(driver, sido)
+    click_load_more_if_exists(driver, max_clicks=40)
+    cur_s = pd.DataFrame(parse_all_tables(driver, html_cache=HtmlCache.open(html_cache)), columns=SCHEDULE_COLS)
+    plan = diff_schedule(prev_s, cur_s, prev_results=prev_r)
+    todo = plan.loc[plan["변경"] != "", "로컬 PK"].tolist()
+    log.info(f"[INCREMENTAL] 스케줄 {len(cur_s)}건 | {summarize(plan)}")
+
+    # 저널은 완료 경기를 건너뛰므로(상태가 바뀌어도) 증분 갱신에는 쓰지 않는다
+    rows = parse_bracket_for_all_matches(
+        driver, start_seq=1, html_cache=html_cache, only_pks=todo, http_client=http_client,
+    ) if todo else []
+    new_r = pd.DataFrame(rows, columns=BRACKET_COLS)
+    merged = merge_results(prev_r, new_r, prev_s, cur_s, refreshed_pks=todo)
+
+    cur_s.to_csv(schedule_csv, index=False, encoding="utf-8-sig")
+    merged[BRACKET_COLS].to_csv(bracket_csv, index=False, encoding="utf-8-sig")
+    log.info(f"[INCREMENTAL] 재수집 {len(todo)}경기 → {bracket_csv} {len(merged)}행")
+    return plan, merged
+
+
+# ================= 재파싱(캐시 → CSV, 브라우저 없음) =================
+def reparse_from_cache(html_cache, schedule_csv=SCHEDULE_CSV, bracket_csv=BRACKET_CSV):
+    """캐시된 일정 페이지/사이드바 원본만으로 두 CSV를 다시 만든다(파서 수정 후 재수집 없이 반영)"""
+    cache = HtmlCache.open(html_cache)
+    t0 = time.perf_counter()
+
+    sched = cache.entries("tournament_schedule")
+    if sched:
+        rows = parse_all_tables_soup(parse_fragment(cache.get(sched[-1]["hash"]), SCHEDULE_STRAINER))
+        pd.DataFrame(rows, columns=SCHEDULE_COLS).to_csv(schedule_csv, index=False, encoding="utf-8-sig")
+
+    bracket_rows, n_side = [], 0
+    for e, html in cache.iter_html("tournament_side"):
+        n_side += 1
+        _, rows, _ = parse_side_players(parse_fragment(html, SIDE_STRAINER), e["local_pk"], e["global_pk"])
+        bracket_rows.extend(rows)
+    df_bracket = pd.DataFrame(bracket_rows, columns=BRACKET_COLS)
+    if not df_bracket.empty:
+        df_bracket = df_bracket.sort_values(by="로컬 PK", kind="mergesort")
+    df_bracket.to_csv(bracket_csv, index=False, encoding="utf-8-sig")
+
+    dt = time.perf_counter() - t0
+    log.info(f"[REPARSE] 일정 {len(sched[-1:])}페이지 / 사이드 {n_side}건 → 선수 {len(df_bracket)}행 | {dt:.2f}s")
+    return df_bracket
+
 
 # ================= 실행부 =================
 if __name__ == "__main__":
@@ -642,34 +814,63 @@ if __name__ == "__main__":
         format="%(asctime)s [%(levelname)s] %(message)s",
         datefmt="%H:%M:%S",
     )
+    # MEET_SIDO=경북 → 다른 시도 수집(기본 전남, 파일은 <시도>_*.csv). 여러 시도 동시 수집은 crawl_regions.py
+    sido = regions.get(os.environ.get("MEET_SIDO") or JEONNAM)
+    schedule_csv = region_path(sido, "schedule_tournament")
+    bracket_csv = region_path(sido, "bracket_tournament")
+    cache_dir = f"{HTML_CACHE_DIR}_{sido.slug}"
+    # python sido_tournament_crawling.py reparse → 캐시에서 CSV만 다시 생성
+    if sys.argv[1:2] == ["reparse"]:
+        reparse_from_cache(cache_dir, schedule_csv=schedule_csv, bracket_csv=bracket_csv)
+        sys.exit(0)
+
     driver = setup_driver(headless=True)
+    # MEET_ADAPTIVE=0 이면 고정 대기 시간(wait_timeout/sidebar_wait 기본값 그대로)
+    sched = None if os.environ.get("MEET_ADAPTIVE") == "0" else AdaptiveScheduler(max_concurrency=1)
+    # MEET_HTTP=0 이면 사이드바도 브라우저로만, MEET_RECORD=폴더 이면 응답을 replay_server용으로 저장
+    http = None if os.environ.get("MEET_HTTP") == "0" else MeetHttpClient(
+        record_dir=os.environ.get("MEET_RECORD") or None, scheduler=sched,
+    )
+    # 경기별 구간 시간/실패 분류 → crawl_events_tournament_<시도>.jsonl, 종료 시 p50/p95 요약
+    telemetry.start(f"crawl_events_tournament_{sido.slug}.jsonl", label=f"tournament/{sido.name}")
     try:
-        open_and_select_jeonnam_all_dates(driver)
+        # python sido_tournament_crawling.py refresh → 상태 바뀐 경기만 증분 갱신
+        if sys.argv[1:2] == ["refresh"]:
+            refresh_incremental(driver, schedule_csv, bracket_csv, html_cache=cache_dir, sido=sido, http_client=http)
+            sys.exit(0)
+
+        open_and_select_sido_all_dates(driver, sido)
         click_load_more_if_exists(driver, max_clicks=40)
 
         # 스케줄 수집 (PK 포함)
-        rows = parse_all_tables(driver)
-        df = pd.DataFrame(rows)
-        print(f"총 스케줄 행 수: {len(df)}")
-        if not df.empty:
-            # 저장 컬럼 순서
-            cols_sched = ["로컬 PK","글로벌 PK","종목정보","종별","세부종목","경기구분","상태","일시","경기장","시도"]
-            df = df[cols_sched]
-            df.to_csv("jeonnam_schedule_tournament.csv", index=False, encoding="utf-8-sig")
-            print("저장 완료: jeonnam_schedule_tournament.csv")
+        rows = parse_all_tables(driver, html_cache=HtmlCache(cache_dir))
+        print(f"총 스케줄 행 수: {len(rows)}")
+        if rows:
+            with ResultWriter(schedule_csv, SCHEDULE_COLS) as w:
+                w.write(rows)
+            print(f"저장 완료: {schedule_csv}")
         else:
             print("스케줄 수집 결과가 비었습니다. 흐름/셀렉터 점검 필요")
 
-        # 선수명단 수집 (PK 포함)
-        bracket_rows = parse_bracket_for_all_matches(driver, start_seq=1)
-        df_bracket = pd.DataFrame(bracket_rows)
-        if not df_bracket.empty:
-            cols_bracket = ["로컬 PK","글로벌 PK","경기 제목","팀 구분","출전","선수명","소속[학년]","포지션"]
-            df_bracket = df_bracket[cols_bracket]
-            df_bracket.to_csv("jeonnam_bracket_tournament.csv", index=False, encoding="utf-8-sig")
-            print("저장 완료: jeonnam_bracket_tournament.csv", len(df_bracket))
+        # 선수명단 수집 (PK 포함) → 저널에서 로컬 PK 순서로 흘려 씀
+        n_bracket = parse_bracket_for_all_matches(
+            driver, start_seq=1,
+            journal=region_path(sido, "bracket_tournament", ext=".journal.sqlite"),  # 중단 후 재실행 시 이어서 수집
+            html_cache=cache_dir,  # 사이드바 원본 저장(reparse용)
+            parse_procs=2,  # 사이드바 파싱은 별도 프로세스에서(브라우저는 다음 경기로)
+            out_csv=bracket_csv,
+            scheduler=sched,  # 사이드바 대기 시간은 관측 p95로, 재시도는 지수 백오프
+            http_client=http,  # 사이드바 HTTP 우선, 실패/불일치 시 브라우저
+        )
+        if n_bracket:
+            print(f"저장 완료: {bracket_csv}", n_bracket)
         else:
             print("선수명단 수집 결과가 비었습니다.")
 
     finally:
+        telemetry.finish()
+        if sched is not None:
+            print_polite_report(sched.report())
+        if http is not None:
+            http.close()
         driver.quit()
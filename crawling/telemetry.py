@@ -0,0 +1,264 @@
+"""
+크롤링 계측: 경기(시도)별 구간 시간을 JSON lines로 남기고, 진행률/ETA와 요약 리포트를 낸다.
+
+    telemetry.start("crawl_events.jsonl", label="record")   # 실행부 맨 앞
+    telemetry.set_total(len(schedule))                      # 대상 수를 알게 되면
+    ev = telemetry.attempt(local_pk, global_pk, attempt=1, source="browser")
+    with ev.stage("panel_open"):
+        ...
+    ev.finish(ok, reason, rows=len(rows))                   # 시도 1건 기록
+    telemetry.match_done(local_pk, ok)                      # 경기 최종 결과 → 진행률 갱신
+    telemetry.finish()                                      # 요약 출력
+
+병렬 워커(스레드)들이 같이 쓰므로 현재 계측 대상은 프로세스 전역 하나이고,
+start 없이 호출되면 모든 함수가 아무 일도 하지 않는다.
+사후 요약: python telemetry.py crawl_events.jsonl
+"""
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+PROGRESS_EVERY_S = 10
+
+# (분류, 사유 문자열/예외 이름에서 찾을 패턴) — 위에서부터 먼저 맞는 것
+FAILURE_CLASSES = [
+    ("timeout", r"시간 초과|타임아웃|Timeout"),
+    ("stale", r"Stale"),
+    ("alert", r"경고창|Alert"),
+    ("js_error", r"JS|Javascript"),
+    ("http", r"HTTP"),
+    ("row_missing", r"범위를 벗어남|매핑 없음|화면 로딩 실패"),
+    ("empty", r"데이터 행이 없음|0건|tbody 없음|표 없음|섹션 없음|빈 "),
+]
+
+_current = None
+_lock = threading.Lock()
+
+
+def classify(reason):
+    if not reason:
+        return None
+    text = reason if isinstance(reason, str) else type(reason).__name__
+    for name, pattern in FAILURE_CLASSES:
+        if re.search(pattern, text):
+            return name
+    return "other"
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    s = sorted(values)
+    k = (len(s) - 1) * q / 100
+    lo = int(k)
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+
+class Telemetry:
+    def __init__(self, path, label="", total=None, progress_every=PROGRESS_EVERY_S):
+        self.path = path
+        self.label = label
+        self.total = total
+        self.progress_every = progress_every
+        self.t0 = time.time()
+        self.done = 0
+        self.ok = 0
+        self._last_progress = 0.0
+        self._lock = threading.Lock()
+        self._f = open(path, "a", encoding="utf-8") if path else None
+
+    def emit(self, event):
+        event.setdefault("ts", round(time.time(), 3))
+        if self.label:
+            event.setdefault("crawler", self.label)
+        if self._f is None:
+            return
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._f.write(line)
+            self._f.flush()
+
+    def match_done(self, local_pk, ok):
+        with self._lock:
+            self.done += 1
+            self.ok += int(bool(ok))
+            now = time.time()
+            due = now - self._last_progress >= self.progress_every
+            if due:
+                self._last_progress = now
+        self.emit({"type": "match", "local_pk": local_pk, "ok": bool(ok)})
+        if due:
+            print(self.progress_line(), flush=True)
+
+    def progress_line(self):
+        elapsed = max(time.time() - self.t0, 1e-6)
+        rate = self.done / elapsed * 60
+        head = f"{self.done}/{self.total} ({self.done / self.total:.0%})" if self.total else f"{self.done}"
+        eta = ""
+        if self.total and self.done:
+            left = (self.total - self.done) / (self.done / elapsed)
+            eta = f" | ETA {int(left // 60):02d}:{int(left % 60):02d}"
+        return (f"[PROGRESS{' ' + self.label if self.label else ''}] {head} | ok {self.ok} fail {self.done - self.ok} "
+                f"| {rate:.1f}경기/분{eta}")
+
+    def close(self):
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+
+
+class Attempt:
+    """경기 1회 시도. 계측이 꺼져 있으면(tel=None) 시간만 재고 기록하지 않는다."""
+
+    def __init__(self, tel, local_pk, global_pk="", attempt=1, source="browser"):
+        self.tel = tel
+        self.event = {
+            "type": "attempt", "local_pk": local_pk, "global_pk": global_pk,
+            "attempt": attempt, "source": source, "stages": {},
+        }
+        self.t0 = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            ms = (time.perf_counter() - t0) * 1000
+            stages = self.event["stages"]
+            stages[name] = round(stages.get(name, 0) + ms, 1)
+
+    def finish(self, ok, reason=None, rows=0):
+        if self.tel is None:
+            return
+        self.event.update({
+            "ok": bool(ok),
+            "rows": rows,
+            "total_ms": round((time.perf_counter() - self.t0) * 1000, 1),
+            "reason": None if ok else (reason or ""),
+            "failure": None if ok else (classify(reason) or "other"),
+        })
+        self.tel.emit(self.event)
+
+
+# ---------- 전역 진입점 ----------
+def start(path="crawl_events.jsonl", label="", total=None, progress_every=PROGRESS_EVERY_S):
+    global _current
+    with _lock:
+        if _current is not None:
+            _current.close()
+        _current = Telemetry(path, label=label, total=total, progress_every=progress_every)
+    return _current
+
+
+def current():
+    return _current
+
+
+def set_total(n):
+    if _current is not None:
+        _current.total = n
+
+
+def attempt(local_pk, global_pk="", attempt=1, source="browser"):
+    return Attempt(_current, local_pk, global_pk, attempt, source)
+
+
+def match_done(local_pk, ok):
+    if _current is not None:
+        _current.match_done(local_pk, ok)
+
+
+def emit(event):
+    if _current is not None:
+        _current.emit(event)
+
+
+def finish():
+    """계측 종료 + 요약 출력. 요약 dict 반환"""
+    global _current
+    with _lock:
+        tel, _current = _current, None
+    if tel is None:
+        return None
+    print(tel.progress_line(), flush=True)
+    tel.close()
+    if not tel.path:
+        return None
+    report = summarize(load_events(tel.path, since=tel.t0))
+    print_summary(report)
+    return report
+
+
+# ---------- 요약 ----------
+def load_events(path, since=None):
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                e = json.loads(line)
+            except ValueError:
+                continue
+            if since is None or e.get("ts", 0) >= since:
+                events.append(e)
+    return events
+
+
+def summarize(events):
+    stages = defaultdict(list)
+    failures = Counter()
+    reasons = Counter()
+    attempts = [e for e in events if e.get("type") == "attempt"]
+    matches = [e for e in events if e.get("type") == "match"]
+    for e in events:
+        for name, ms in (e.get("stages") or {}).items():
+            stages[name].append(ms)
+    for e in attempts:
+        if e.get("total_ms") is not None:
+            stages["total"].append(e["total_ms"])
+        if not e.get("ok"):
+            failures[e.get("failure") or "other"] += 1
+            reasons[(e.get("reason") or "")[:80]] += 1
+    ts = [e["ts"] for e in events if "ts" in e]
+    minutes = (max(ts) - min(ts)) / 60 if len(ts) > 1 else 0
+    return {
+        "attempts": len(attempts),
+        "matches": len(matches),
+        "matches_ok": sum(1 for e in matches if e.get("ok")),
+        "matches_per_min": round(len(matches) / minutes, 2) if minutes else None,
+        "stages": {
+            name: {
+                "n": len(v),
+                "p50_ms": round(percentile(v, 50), 1),
+                "p95_ms": round(percentile(v, 95), 1),
+                "max_ms": round(max(v), 1),
+            }
+            for name, v in stages.items()
+        },
+        "failures": dict(failures.most_common()),
+        "top_reasons": reasons.most_common(10),
+    }
+
+
+def print_summary(report):
+    print(f"\n[TELEMETRY] 경기 {report['matches']}건(성공 {report['matches_ok']}) | 시도 {report['attempts']}회 "
+          f"| {report['matches_per_min'] or '-'}경기/분")
+    print(f"{'stage':>12} {'n':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'max(ms)':>9}")
+    for name, s in sorted(report["stages"].items(), key=lambda kv: kv[0] == "total"):
+        print(f"{name:>12} {s['n']:>6} {s['p50_ms']:>9.0f} {s['p95_ms']:>9.0f} {s['max_ms']:>9.0f}")
+    if report["failures"]:
+        print("  실패 분류: " + ", ".join(f"{k} {v}" for k, v in report["failures"].items()))
+        for reason, n in report["top_reasons"]:
+            print(f"    {n:>4} × {reason}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python telemetry.py crawl_events.jsonl")
+        sys.exit(1)
+    print_summary(summarize(load_events(sys.argv[1])))
@@ -0,0 +1,77 @@
+"""시도별 파티션 통합: 글로벌 PK 중복 제거, 통합 로컬 PK로 일정/결과 맞추기, 출처 컬럼"""
+import os
+
+import pandas as pd
+
+import regions
+from crawl_regions import SOURCE_COL, combine
+from regions import region_path
+
+JEONNAM, GYEONGBUK = regions.get("전남"), regions.get("경북")
+
+
+def _save(out_dir, sido, dataset, rows, columns):
+    pd.DataFrame(rows, columns=columns).to_csv(region_path(sido, dataset, out_dir), index=False, encoding="utf-8-sig")
+
+
+def _schedule(out_dir, sido, rows):
+    _save(out_dir, sido, "schedule_tournament", rows, ["로컬 PK", "글로벌 PK", "경기"])
+
+
+def _bracket(out_dir, sido, rows):
+    _save(out_dir, sido, "bracket_tournament", rows, ["로컬 PK", "글로벌 PK", "선수명"])
+
+
+def _all(out_dir, dataset):
+    return pd.read_csv(os.path.join(out_dir, f"all_{dataset}.csv"), encoding="utf-8-sig", dtype=str)
+
+
+def test_combine_dedups_shared_matches_and_renumbers(tmp_path):
+    out = str(tmp_path)
+    # 전남-경북 결승(F)은 양쪽 시도 목록에 모두 나옴. X는 여러 날에 걸쳐 전남 목록에 두 번
+    _schedule(out, JEONNAM, [(1, "F", "결승"), (2, "X", "1일차"), (3, "X", "2일차")])
+    _bracket(out, JEONNAM, [(1, "F", "김전남"), (2, "X", "박전남")])
+    _schedule(out, GYEONGBUK, [(1, "S", "준결승"), (2, "F", "결승")])
+    _bracket(out, GYEONGBUK, [(1, "S", "이경북"), (2, "F", "최경북")])
+
+    stats = combine(out, [JEONNAM, GYEONGBUK])
+    assert stats["schedule_tournament"] == (5, 4) and stats["bracket_tournament"] == (4, 3)
+
+    sched = _all(out, "schedule_tournament")
+    assert sched[["로컬 PK", "글로벌 PK", SOURCE_COL]].values.tolist() == [
+        ["1", "F", "전남"], ["2", "X", "전남"], ["3", "X", "전남"], ["4", "S", "경북"],
+    ]
+    bracket = _all(out, "bracket_tournament")
+    assert bracket[["로컬 PK", "글로벌 PK", "선수명"]].values.tolist() == [
+        ["1", "F", "김전남"], ["2", "X", "박전남"], ["4", "S", "이경북"],
+    ]
+
+
+def test_combine_order_sets_priority(tmp_path):
+    out = str(tmp_path)
+    _schedule(out, JEONNAM, [(1, "F", "결승")])
+    _bracket(out, JEONNAM, [(1, "F", "김전남")])
+    _schedule(out, GYEONGBUK, [(1, "F", "결승")])
+    _bracket(out, GYEONGBUK, [(1, "F", "최경북")])
+
+    combine(out, [GYEONGBUK, JEONNAM])
+    assert _all(out, "bracket_tournament")[[SOURCE_COL, "선수명"]].values.tolist() == [["경북", "최경북"]]
+
+
+def test_combine_takes_next_region_when_first_has_no_results(tmp_path):
+    out = str(tmp_path)
+    # 전남 목록이 먼저지만 F 사이드바 수집은 실패 → 결과가 있는 경북이 주인
+    _schedule(out, JEONNAM, [(1, "F", "결승"), (2, "X", "8강")])
+    _bracket(out, JEONNAM, [(2, "X", "박전남")])
+    _schedule(out, GYEONGBUK, [(1, "S", "준결승"), (2, "F", "결승")])
+    _bracket(out, GYEONGBUK, [(1, "S", "이경북"), (2, "F", "최경북")])
+
+    combine(out, [JEONNAM, GYEONGBUK])
+    sched = _all(out, "schedule_tournament")
+    assert sched[["로컬 PK", "글로벌 PK", SOURCE_COL]].values.tolist() == [
+        ["1", "X", "전남"], ["2", "S", "경북"], ["3", "F", "경북"],
+    ]
+    bracket = _all(out, "bracket_tournament")
+    assert bracket[["로컬 PK", "글로벌 PK", SOURCE_COL, "선수명"]].values.tolist() == [
+        ["1", "X", "전남", "박전남"], ["2", "S", "경북", "이경북"], ["3", "F", "경북", "최경북"],
+    ]
@@ -0,0 +1,73 @@
+"""드라이버 관리: 재시작 기준은 연 페이지 수(count_page), LazyDriver는 처음 쓰일 때만 브라우저를 띄움"""
+import pytest
+
+import driver_manager
+from driver_manager import DriverPool, LazyDriver, count_page
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.calls.append(url)
+
+    def execute_script(self, script, *args):
+        return 0
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def started(monkeypatch):
+    drivers = []
+
+    def fake_setup(headless=True, block=None, page_load_strategy="eager"):
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(driver_manager, "setup_driver", fake_setup)
+    return drivers
+
+
+def test_pool_recycles_by_pages_not_checkouts(started):
+    pool = DriverPool(size=1, max_pages=3, max_heap_mb=0)
+    for _ in range(2):
+        with pool.checkout() as drv:  # 대여만으로는 세지 않음
+            pass
+    with pool.checkout() as drv:
+        for _ in range(3):            # 묶음 하나에서 사이드 패널 3개
+            count_page(drv)
+    assert len(started) == 1
+    with pool.checkout() as drv:
+        assert drv is started[1]      # 기준 초과 → 다음 대여 전에 새 브라우저
+    assert started[0].quit_called
+    pool.close()
+
+
+def test_count_page_ignores_unmanaged_driver():
+    count_page(FakeDriver())
+
+
+def test_lazy_driver_starts_on_first_use(started):
+    driver = LazyDriver(on_start=lambda drv: drv.get("sido"))
+    driver.quit()
+    assert not started and not driver.started
+
+    driver.get("page")
+    driver.get("page2")
+    assert len(started) == 1 and started[0].calls == ["sido", "page", "page2"]
+    driver.quit()
+    assert started[0].quit_called and not driver.started
+
+
+def test_lazy_driver_failed_start_quits_browser(started):
+    def boom(drv):
+        raise RuntimeError("시도 선택 실패")
+
+    driver = LazyDriver(on_start=boom)
+    with pytest.raises(RuntimeError):
+        driver.start()
+    assert started[0].quit_called and not driver.started
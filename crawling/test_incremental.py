@@ -0,0 +1,63 @@
+"""증분 갱신: 스케줄 비교(diff_schedule)와 결과 병합(merge_results)"""
+import io
+
+import pandas as pd
+
+from incremental import diff_schedule, merge_results
+
+
+def _schedule(rows):
+    return pd.DataFrame(rows, columns=["로컬 PK", "글로벌 PK", "상태", "일시"])
+
+
+def _results(rows):
+    return pd.DataFrame(rows, columns=["로컬 PK", "글로벌 PK", "선수명"])
+
+
+PREV_S = _schedule([
+    (1, "A", "종료", "10/17 10:00"),
+    (2, "B", "", ""),
+    (3, "C", "예정", "10/18 09:00"),
+])
+# 새 스케줄: 맨 앞에 경기 하나가 끼어들어 로컬 PK가 1씩 밀림, C는 상태 변경
+CUR_S = _schedule([
+    (1, "N", "예정", "10/17 09:00"),
+    (2, "A", "종료", "10/17 10:00"),
+    (3, "B", "", ""),
+    (4, "C", "종료", "10/18 09:00"),
+])
+PREV_R = _results([(1, "A", "김선수"), (3, "C", "이선수")])
+
+
+def test_diff_marks_new_and_changed():
+    plan = diff_schedule(PREV_S, CUR_S)
+    assert dict(zip(plan["글로벌 PK"], plan["변경"])) == {"N": "신규", "A": "", "B": "", "C": "변경"}
+
+
+def test_diff_blank_cells_survive_csv_roundtrip():
+    buf = io.StringIO()
+    PREV_S.to_csv(buf, index=False)
+    buf.seek(0)
+    plan = diff_schedule(pd.read_csv(buf), CUR_S)  # 빈 칸 → NaN 으로 읽혀도 "변경" 아님
+    assert plan.set_index("글로벌 PK").loc["B", "변경"] == ""
+
+
+def test_merge_renumbers_kept_rows_and_replaces_refreshed():
+    new_r = _results([(1, "N", "박선수"), (4, "C", "최선수")])
+    merged = merge_results(PREV_R, new_r, PREV_S, CUR_S, refreshed_pks=[1, 4])
+    assert merged.values.tolist() == [[1, "N", "박선수"], [2, "A", "김선수"], [4, "C", "최선수"]]
+
+
+def test_merge_keeps_previous_rows_when_recrawl_failed():
+    # C(새 로컬 PK 4)를 다시 긁었지만 결과가 없음 → 이전 결과 유지
+    new_r = _results([(1, "N", "박선수")])
+    merged = merge_results(PREV_R, new_r, PREV_S, CUR_S, refreshed_pks=[1, 4])
+    assert merged.values.tolist() == [[1, "N", "박선수"], [2, "A", "김선수"], [4, "C", "이선수"]]
+    merged = merge_results(PREV_R, _results([]), PREV_S, CUR_S, refreshed_pks=[1, 4])
+    assert merged["선수명"].tolist() == ["김선수", "이선수"]
+
+
+def test_merge_drops_rows_of_removed_matches():
+    cur_s = CUR_S[CUR_S["글로벌 PK"] != "A"]
+    merged = merge_results(PREV_R, _results([]), PREV_S, cur_s, refreshed_pks=[])
+    assert merged["글로벌 PK"].tolist() == ["C"]
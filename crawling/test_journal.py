@@ -0,0 +1,39 @@
+"""경기 단위 저널: 다시 열면 성공한 경기만 완료로 이어받고, 최종 CSV는 로컬 PK 순서"""
+import pandas as pd
+
+from journal import CrawlJournal
+
+
+def _rows(pk, *names):
+    return [{"로컬 PK": pk, "선수명": n} for n in names]
+
+
+def test_resume_skips_only_latest_successes(tmp_path):
+    path = str(tmp_path / "j.sqlite")
+    j = CrawlJournal(path)
+    j.record(2, "B", _rows(2, "이선수"), True)
+    j.record(1, "A", _rows(1, "김선수", "박선수"), True)
+    j.record(3, "C", [], False, "사이드 패널 없음")
+    j.record(4, "D", _rows(4, "최선수"), True)
+    j.record(4, "D", [], False, "기록표 시간 초과")  # 다시 긁다 실패 → 최신 상태는 실패
+    j.close()
+
+    j = CrawlJournal(path)  # 중간에 죽은 뒤 재실행
+    assert [pk for pk in (1, 2, 3, 4) if j.is_done(pk)] == [1, 2]
+    assert not j.is_done(2, "B2")  # 스케줄이 바뀌어 같은 로컬 PK가 다른 경기
+    assert [(f["로컬 PK"], f["시도 횟수"]) for f in j.failures()] == [(3, 1), (4, 2)]
+
+    j.record(3, "C", _rows(3, "정선수"), True)  # 재실행에서 성공
+    assert j.is_done(3, "C") and j.done_count() == 3
+    assert [r["선수명"] for r in j.rows()] == ["김선수", "박선수", "이선수", "정선수"]
+    j.close()
+
+
+def test_materialize_streams_in_local_pk_order(tmp_path):
+    j = CrawlJournal(str(tmp_path / "j.sqlite"))
+    for pk in (3, 1, 2):
+        j.record(pk, f"G{pk}", _rows(pk, f"선수{pk}"), True)
+    out = str(tmp_path / "out.csv")
+    assert j.materialize(out, ["로컬 PK", "선수명"]) == 3
+    assert pd.read_csv(out, encoding="utf-8-sig")["로컬 PK"].tolist() == [1, 2, 3]
+    j.close()
@@ -0,0 +1,48 @@
+"""파싱 파이프라인: 파싱 프로세스가 죽으면(BrokenProcessPool) 그 조각만 실패로 넘기고 풀을 다시 띄워 계속 처리"""
+import os
+import threading
+
+from pipeline import ParsePipeline
+
+
+def _parse(html, local_pk):
+    if html == "crash":
+        os._exit(1)  # lxml segfault/OOM kill 흉내
+    return [{"로컬 PK": local_pk, "html": html}], True, ""
+
+
+def _sink():
+    got, first = {}, threading.Event()
+
+    def sink(key, rows, ok, reason):
+        got[key] = (rows, ok, reason)
+        first.set()
+
+    return got, first, sink
+
+
+def test_parse_worker_crash_restarts_pool():
+    got, first, sink = _sink()
+    pipe = ParsePipeline(_parse, sink, processes=1, label="test")
+    pipe.submit(1, "crash", 1)
+    assert first.wait(60)
+    for pk in (2, 3):
+        pipe.submit(pk, f"<p>{pk}</p>", pk)
+    report = pipe.close()
+
+    rows, ok, reason = got[1]
+    assert (rows, ok) == ([], False) and "파싱 프로세스 오류" in reason
+    # 풀이 깨진 뒤 들어온 조각은 새 풀에서 정상 처리
+    assert {k: v[1] for k, v in got.items() if k != 1} == {2: True, 3: True}
+    assert got[3][0] == [{"로컬 PK": 3, "html": "<p>3</p>"}]
+    assert report["pool_restarts"] == 1
+
+
+def test_sink_receives_every_fragment_in_thread_mode():
+    got, _, sink = _sink()
+    pipe = ParsePipeline(_parse, sink, processes=0)
+    for pk in range(1, 6):
+        pipe.submit(pk, str(pk), pk)
+    report = pipe.close()
+    assert sorted(got) == [1, 2, 3, 4, 5] and all(ok for _, ok, _ in got.values())
+    assert report["stages"]["write"]["n"] == 5
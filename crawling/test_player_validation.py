@@ -0,0 +1,61 @@
+"""player.do HTTP 검색: replay_server로 녹화 응답을 돌려 적중/빈 결과/성명 불일치를 확인"""
+import pytest
+
+from http_client import PLAYER_FORM
+from player_validation import search_name_keys_http
+from regions import JEONNAM
+from replay_server import fixture_key
+
+PLAYER_PATH = "/national/search/player.do"
+HEADERS = ("종목", "종별", "세부종목", "소속", "선수명", "성별")
+
+
+def _row(*cells):
+    tds = "".join(
+        f'<td><b class="tablesaw-cell-label">{h}</b><span class="tablesaw-cell-content">{c}</span></td>'
+        for h, c in zip(HEADERS, cells)
+    )
+    return f"<tr>{tds}</tr>"
+
+
+def _page(rows):
+    body = "".join(rows) or '<tr><td class="nodata" colspan="6">검색 결과가 없습니다.</td></tr>'
+    return (
+        '<html><body><table class="tablesaw tablesaw-stack"><caption>선수명 검색 결과</caption>'
+        f'<thead><tr>{"".join(f"<th>{h}</th>" for h in HEADERS)}</tr></thead>'
+        f"<tbody>{body}</tbody></table></body></html>"
+    )
+
+
+def _form(name):
+    return {PLAYER_FORM["sido"]: JEONNAM.code, PLAYER_FORM["name"]: name, PLAYER_FORM["page_size"]: 1000}
+
+
+@pytest.fixture
+def client(replay):
+    pages = {
+        "홍길동": _page([_row("육상", "남자고등부", "100m", "전남체고", "홍길동", "남"),
+                         _row("육상", "남자일반부", "200m", "전남도청", "홍길동", "남")]),
+        "김없음": _page([]),
+        # 성명 필드가 무시되어 다른 선수 목록이 온 경우
+        "이몽룡": _page([_row("수영", "여자중등부", "자유형 50m", "목포중", "성춘향", "여")]),
+    }
+    return replay({fixture_key("POST", PLAYER_PATH, _form(name)): html for name, html in pages.items()})
+
+
+def test_hit_returns_keys(client):
+    keys, reason = search_name_keys_http(client, "홍길동", sido=JEONNAM)
+    assert reason == ""
+    assert keys == {("육상", "남자고등부", "홍길동"), ("육상", "남자일반부", "홍길동")}
+
+
+def test_empty_result_falls_back_to_browser(client):
+    keys, reason = search_name_keys_http(client, "김없음", sido=JEONNAM)
+    assert keys is None
+    assert reason == "HTTP: 결과 없음/성명 불일치"  # 404(fixture 없음)가 아니라 표를 읽고 폴백
+
+
+def test_name_mismatch_falls_back_to_browser(client):
+    keys, reason = search_name_keys_http(client, "이몽룡", sido=JEONNAM)
+    assert keys is None
+    assert reason == "HTTP: 결과 없음/성명 불일치"
@@ -0,0 +1,120 @@
+"""적응형 스케줄러: AIMD 동시 수, 회로 차단기 상태 전이, 프로세스 합계 상한, replay_server 장애 주입으로 HTTP 경로 차단 확인"""
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from http_client import HttpFetchError
+from politeness import AdaptiveScheduler, CircuitOpen
+from replay_server import Faults, fetch_stats, fixture_key
+
+
+def _run(sched, name="side", kind=None):
+    with sched.slot(name, wait=False) as call:
+        if kind:
+            call.fail(kind)
+
+
+def test_aimd_additive_increase_multiplicative_decrease():
+    sched = AdaptiveScheduler(max_concurrency=4, initial_concurrency=2, cooldown_s=60, log=False)
+    _run(sched)
+    assert sched.limit == pytest.approx(2.5)          # 성공마다 +1/현재값
+    _run(sched, kind="throttle")
+    assert sched.limit == pytest.approx(1.25)         # 과부하 → 절반
+    _run(sched, kind="timeout")
+    assert sched.limit == pytest.approx(1.25)         # cooldown 안에서는 한 번만 줄임
+    _run(sched, kind="error")
+    assert sched.decreases == 1                       # 일반 실패는 동시 수를 건드리지 않음
+    for _ in range(20):
+        _run(sched)
+    assert sched.limit == 4 and sched.limit_low == pytest.approx(1.25)
+
+
+def test_breaker_opens_probes_once_and_closes():
+    sched = AdaptiveScheduler(breaker_failures=2, open_s=0.05, log=False)
+    _run(sched, kind="error")
+    _run(sched, kind="error")
+    with pytest.raises(CircuitOpen):
+        _run(sched)
+    _run(sched, name="other")                         # 엔드포인트별로 따로 막힘
+
+    time.sleep(0.06)
+    with sched.slot("side", wait=False):              # half-open: 시험 요청 하나만 통과
+        with pytest.raises(CircuitOpen):
+            _run(sched)
+    assert sched.report()["endpoints"]["side"]["state"] == "closed"
+
+
+def test_failed_probe_reopens_with_longer_wait():
+    sched = AdaptiveScheduler(breaker_failures=1, open_s=0.05, log=False)
+    _run(sched, kind="error")
+    time.sleep(0.06)
+    _run(sched, kind="error")                         # 시험 요청 실패 → 다시 차단(2회째, 2배)
+    st = sched._stats["side"]
+    assert (st.state, st.trips) == ("open", 2)
+    assert st.open_until - time.monotonic() > 0.06
+
+
+def test_http_errors_trip_breaker_without_hitting_server(replay):
+    sched = AdaptiveScheduler(max_concurrency=4, breaker_failures=3, open_s=60, cooldown_s=0, log=False)
+    key = fixture_key("POST", "/national/schedule/getClassCdList.do", {"gmDt": "2025/10/17", "gmDtNm": "2025/10/17"})
+    client = replay({key: "<ul id='classCdList'></ul>"}, faults=Faults(rates={"error": 1.0}), scheduler=sched)
+    for _ in range(3):
+        with pytest.raises(HttpFetchError) as e:
+            client.class_cd_list_html("2025/10/17")
+        assert e.value.kind == "throttle"             # HTTP 500 → 과부하로 분류
+    assert sched.limit == 1                           # 2 → 1(하한)
+
+    with pytest.raises(HttpFetchError, match="회로 차단"):
+        client.class_cd_list_html("2025/10/17")       # 막혀 있는 동안은 서버에 보내지 않고 바로 폴백
+    assert fetch_stats(client.base_url)["error"] == 3
+
+
+def _hold_slots(shared, n, hold_s):
+    """시도 프로세스 하나 흉내: 로컬 동시 2개로 slot n번, 각 slot 안에 머문 (시작, 끝) 반환"""
+    sched = AdaptiveScheduler(max_concurrency=2, initial_concurrency=2, shared=shared, log=False)
+    spans, lock = [], threading.Lock()
+
+    def one():
+        with sched.slot("side"):
+            t = time.time()
+            time.sleep(hold_s)
+            with lock:
+                spans.append((t, time.time()))
+
+    threads = [threading.Thread(target=one) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return spans
+
+
+def _max_overlap(spans):
+    events = sorted([(a, 1) for a, _ in spans] + [(b, -1) for _, b in spans], key=lambda e: (e[0], e[1]))
+    cur = peak = 0
+    for _, d in events:
+        cur += d
+        peak = max(peak, cur)
+    return peak
+
+
+def test_shared_limit_caps_all_schedulers_in_process():
+    shared = threading.Semaphore(2)
+    spans = []
+    threads = [threading.Thread(target=lambda: spans.extend(_hold_slots(shared, 4, 0.05))) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(spans) == 12 and _max_overlap(spans) == 2  # 로컬 2 × 3개여도 합계 2
+
+
+def test_shared_limit_across_region_processes():
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Manager() as manager, ProcessPoolExecutor(max_workers=3, mp_context=ctx) as ex:
+        shared = manager.Semaphore(3)
+        spans = [s for f in [ex.submit(_hold_slots, shared, 4, 0.2) for _ in range(3)] for s in f.result()]
+    assert len(spans) == 12 and _max_overlap(spans) <= 3
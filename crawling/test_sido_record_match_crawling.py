@@ -0,0 +1,114 @@
+"""기록경기 HTTP 경로: 일자 목록/종목 목록/일정 표/사이드 패널을 replay_server 녹화 응답으로 확인"""
+import pytest
+
+import driver_manager
+from driver_manager import LazyDriver
+from http_client import ENDPOINTS, SCHEDULE_FORM, HttpFetchError
+from regions import JEONNAM
+from replay_server import fixture_key
+from sido_record_match_crawling import (
+    SCHEDULE_CAPTION, _list_schedule_buckets_http, _search_schedule_bucket_http, list_schedule_buckets,
+    parse_one_match_http,
+)
+
+DATE = "2025/10/18"
+SIDE_CALL = "openSide('2025','23','0101','7')"
+
+
+def _key(name, form):
+    return fixture_key("POST", ENDPOINTS[name]["path"], form)
+
+
+def _td(text, onclick=None):
+    attr = f' onclick="{onclick}"' if onclick else ""
+    return f'<td{attr}><b class="tablesaw-cell-label">-</b><span class="tablesaw-cell-content">{text}</span></td>'
+
+
+def _schedule(sport, rows):
+    trs = "".join("<tr>" + "".join(_td(c, SIDE_CALL if i == 0 else None) for i, c in enumerate(r)) + "</tr>" for r in rows)
+    return (
+        f'<h5 id="classNm">{sport}</h5><table class="tablesaw tablesaw-stack"><caption>{SCHEDULE_CAPTION}</caption>'
+        f"<tbody>{trs}</tbody></table>"
+    )
+
+
+def _schedule_form(date, class_cd):
+    return {SCHEDULE_FORM["sido"]: JEONNAM.code, SCHEDULE_FORM["date"]: date,
+            SCHEDULE_FORM["class_cd"]: class_cd, SCHEDULE_FORM["page_size"]: 1000}
+
+
+def _side(rows):
+    trs = "".join("<tr>" + "".join(_td(c) for c in r) + "</tr>" for r in rows)
+    table = '<table class="tablesaw tablesaw-stack"><caption>기록경기 결과</caption><tbody>{}</tbody></table>'
+    return f'<div class="record">{table.format("")}{table.format(trs)}</div>'
+
+
+@pytest.fixture
+def client(replay):
+    return replay({
+        _key("gm_dt_list", {"sidoCd": JEONNAM.code, "sidoNm": JEONNAM.name}):
+            '<ul id="gmDtList"><li class="all"><a>전체</a></li><li><a>2025/10/17</a></li><li><a>2025/10/18</a></li></ul>',
+        _key("class_cd_list", {"gmDt": "2025/10/17", "gmDtNm": "2025/10/17"}):
+            '<ul id="classCdList"><li class="all">전체</li><li onclick="selectClassCd(\'21\',\'사격\')">사격</li></ul>',
+        # 종목 목록 대신 다른 조각이 온 경우(#classCdList 없음)
+        _key("class_cd_list", {"gmDt": DATE, "gmDtNm": DATE}): "<li>궁도</li>",
+        _key("schedule_R", _schedule_form(DATE, "23")): _schedule("궁도", [
+            ("남자일반부", "개인전 70m", "결승", "종료", f"{DATE} 08:30 ~ 18:00", "순천 팔마궁도장", ""),
+        ]),
+        # 일자/종목 필드가 무시되어 서버 기본 일정이 온 경우
+        _key("schedule_R", _schedule_form(DATE, "99")): _schedule("체조", [
+            ("남자18세이하부", "단체종합", "결승", "종료", "2025/09/25 10:00 ~ 20:20", "사직체육관", ""),
+        ]),
+        _key("schedule_R", _schedule_form("2025/09/26", "24")): _schedule("카누", [
+            ("여자일반부", "K-1 500m", "결승", "종료", "2025/09/25 09:00 ~ 2025/09/27 12:00", "서낙동강", ""),
+        ]),
+        _key("side", {"gmCd": "2025", "classCd": "23", "detailClassCd": "0101", "gameSeq": "7"}): _side([
+            ("1", "전남", "김궁수", "전남도청", "", "680", ""),
+            ("2", "경북", "이궁수", "경북도청", "", "675", ""),
+        ]),
+    })
+
+
+def test_date_and_sport_lists(client):
+    buckets = _list_schedule_buckets_http(client, limit_dates=1, sido=JEONNAM)
+    assert buckets == [("2025/10/17", "21", "사격")]
+
+
+def test_sport_list_without_container_raises(client):
+    with pytest.raises(HttpFetchError, match="classCdList"):
+        _list_schedule_buckets_http(client, sido=JEONNAM)
+
+
+def test_schedule_rows_for_requested_bucket(client):
+    rows = _search_schedule_bucket_http(client, DATE, "23", "궁도", sido=JEONNAM)
+    assert [(r["글로벌 PK"], r["필터_일자"], r["사이드_호출"]) for r in rows] == [
+        ("궁도_남자일반부_개인전 70m_결승", DATE, SIDE_CALL),
+    ]
+
+
+def test_schedule_multi_day_match_within_range(client):
+    assert len(_search_schedule_bucket_http(client, "2025/09/26", "24", "카누", sido=JEONNAM)) == 1
+
+
+def test_schedule_for_other_bucket_falls_back(client):
+    with pytest.raises(HttpFetchError, match="불일치"):
+        _search_schedule_bucket_http(client, DATE, "99", "궁도", sido=JEONNAM)
+
+
+def test_side_panel_rows(client):
+    meta = {"글로벌 PK": "궁도_남자일반부_개인전 70m_결승", "필터_일자": DATE, "필터_종목코드": "23", "필터_종목명": "궁도"}
+    rows, ok, reason = parse_one_match_http(client, SIDE_CALL, 5, meta, log=False)
+    assert ok and reason == ""
+    assert [(r["로컬 PK"], r["순위"], r["선수명"], r["기록"]) for r in rows] == [(5, "1", "김궁수", "680"), (5, "2", "이궁수", "675")]
+
+
+def test_side_panel_missing_falls_back(client):
+    rows, ok, reason = parse_one_match_http(client, "openSide('2025','23','0101','8')", 6, {}, log=False)
+    assert (rows, ok) == ([], False) and reason.startswith("HTTP:")
+
+
+def test_http_listing_does_not_start_browser(client, monkeypatch):
+    monkeypatch.setattr(driver_manager, "setup_driver", lambda **kw: pytest.fail("브라우저를 띄움"))
+    driver = LazyDriver()
+    assert list_schedule_buckets(driver, limit_dates=1, http_client=client, sido=JEONNAM) == [("2025/10/17", "21", "사격")]
+    assert not driver.started
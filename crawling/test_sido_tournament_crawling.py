@@ -0,0 +1,55 @@
+"""토너먼트 사이드바 HTTP 경로: replay_server 녹화 응답으로 적중/다른 경기/요청 실패 시 폴백을 확인"""
+import pytest
+
+from http_client import ENDPOINTS
+from replay_server import fixture_key
+from sido_tournament_crawling import fetch_side_http
+
+SIDE_CALL = "openSide('2025','31','0203','12')"
+GLOBAL_PK = "축구_남자고등부_축구_결승"
+
+
+def _side_key(args):
+    fields = ENDPOINTS["side_T"]["fields"]
+    return fixture_key("POST", ENDPOINTS["side_T"]["path"], dict(zip(fields, args)))
+
+
+def _sidebar(title, team, players):
+    trs = "".join(f"<tr><td><img src='/img/check_on.png'></td><td>{n}</td><td>{a}</td><td>{p}</td></tr>"
+                  for n, a, p in players)
+    return (
+        f'<div class="record"><div class="scoreTop"><span>{title}</span><span>결승</span></div></div>'
+        f'<div class="participating-players"><ul><li><h6>참가선수 ({team})</h6>'
+        '<div class="boardTable01"><table class="pcView"><thead><tr><th>출전</th><th>선수명</th>'
+        f"<th>소속[학년]</th><th>포지션</th></tr></thead><tbody>{trs}</tbody></table></div></li></ul></div>"
+    )
+
+
+@pytest.fixture
+def client(replay):
+    return replay({
+        _side_key(["2025", "31", "0203", "12"]): _sidebar("축구 > 남자고등부", "전남", [
+            ("김공격", "광양제철고[3]", "FW"), ("이수비", "광양제철고[2]", "DF"),
+        ]),
+        # 인자가 무시되어 다른 경기 사이드바가 온 경우
+        _side_key(["2025", "31", "0203", "13"]): _sidebar("농구 > 여자일반부", "경북", [("박가드", "경북도청", "G")]),
+    })
+
+
+def test_sidebar_rows(client):
+    rows, reason = fetch_side_http(client, SIDE_CALL, 3, GLOBAL_PK, sport="축구", kind="남자고등부")
+    assert reason == ""
+    assert [(r["로컬 PK"], r["경기 제목"], r["팀 구분"], r["출전"], r["선수명"], r["포지션"]) for r in rows] == [
+        (3, "축구>남자고등부>결승", "전남", "Y", "김공격", "FW"),
+        (3, "축구>남자고등부>결승", "전남", "Y", "이수비", "DF"),
+    ]
+
+
+def test_sidebar_for_other_match_falls_back(client):
+    rows, reason = fetch_side_http(client, "openSide('2025','31','0203','13')", 4, GLOBAL_PK, "축구", "남자고등부")
+    assert rows == [] and "경기 불일치" in reason
+
+
+def test_sidebar_fetch_error_falls_back(client):
+    rows, reason = fetch_side_http(client, "openSide('2025','31','0203','99')", 5, GLOBAL_PK, "축구", "남자고등부")
+    assert rows == [] and reason.startswith("HTTP:")
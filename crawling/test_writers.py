@@ -0,0 +1,57 @@
+"""스트리밍 기록기와 (로컬 PK, 글로벌 PK) upsert: 교체 경기는 제자리, 새 경기는 뒤, 실패 시 기존 파일 유지"""
+import os
+
+import pandas as pd
+import pytest
+
+from writers import ResultWriter, upsert
+
+COLS = ["로컬 PK", "글로벌 PK", "선수명"]
+
+
+def _write(path, rows, batch_rows=2):
+    with ResultWriter(path, COLS, batch_rows=batch_rows) as w:
+        w.write([dict(zip(COLS, r)) for r in rows])
+
+
+def _read(path):
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path, encoding="utf-8-sig", dtype=str)
+    return [tuple(str(v) for v in r) for r in df[COLS].itertuples(index=False)]
+
+
+@pytest.fixture(params=[".csv", ".parquet"])
+def existing(tmp_path, request):
+    path = str(tmp_path / f"bracket{request.param}")
+    _write(path, [(1, "A", "a1"), (2, "B", "b1"), (2, "B", "b2"), (3, "C", "c1")])
+    return path
+
+
+def test_upsert_replaces_match_in_place_and_appends_new(existing):
+    stats = upsert(existing, [dict(zip(COLS, r)) for r in [(4, "D", "d1"), (2, "B", "B1")]], COLS, batch_rows=2)
+    assert stats == {"rows": 2, "replaced": 1, "rewritten": True}
+    assert _read(existing) == [("1", "A", "a1"), ("2", "B", "B1"), ("3", "C", "c1"), ("4", "D", "d1")]
+
+
+def test_upsert_without_overlap_appends(existing):
+    stats = upsert(existing, [dict(zip(COLS, (5, "E", "e1")))], COLS)
+    assert stats["replaced"] == 0
+    assert _read(existing)[-1] == ("5", "E", "e1")
+
+
+def test_upsert_matches_float_local_pk(tmp_path):
+    path = str(tmp_path / "bracket.csv")
+    pd.DataFrame([[1.0, "A", "a1"]], columns=COLS).to_csv(path, index=False, encoding="utf-8-sig")
+    assert upsert(path, [dict(zip(COLS, (1, "A", "A1")))], COLS)["replaced"] == 1
+    assert _read(path) == [("1", "A", "A1")]
+
+
+def test_failed_write_keeps_previous_file(existing):
+    before = _read(existing)
+    with pytest.raises(RuntimeError):
+        with ResultWriter(existing, COLS, batch_rows=1) as w:
+            w.write([dict(zip(COLS, (9, "Z", "z")))])
+            raise RuntimeError("crawl died")
+    assert _read(existing) == before and not os.path.exists(existing + ".tmp")
@@ -0,0 +1,279 @@
+"""
+이벤트 기반 대기 엔진.
+
+고정 sleep/폴링(outerHTML 재직렬화 + BeautifulSoup 재파싱) 대신, 페이지 안에
+MutationObserver를 걸어 두고 조건이 맞는 순간 execute_async_script 콜백으로 바로 돌아온다.
+결과는 {"state": "ready"|"empty"|"done"|"mutated"|"timeout", "count": n} 형태의 dict.
+
+조건(predicate)은 JS 함수 소스 문자열로, 인자 객체 하나를 받아 조건 충족 시 객체를,
+아니면 null을 반환한다. 재사용하는 조건은 아래 상수로 둔다.
+목록 펼치기(expand_list)도 같은 방식으로, 더보기 클릭 → 행 증가 감지 루프를 브라우저 안에서 한 번에 돈다.
+"""
+import time
+
+from selenium.webdriver.common.alert import Alert
+from selenium.common.exceptions import UnexpectedAlertPresentException, TimeoutException
+
+# 빈 결과 표시(사이트 공통 클래스). 필요시 호출부에서 empty 인자로 덮어쓴다.
+EMPTY_MARKERS = "td.no-result, .no-result, .nodata, .no-data"
+
+# data-wait-stale 이 붙은 요소(또는 그 하위)는 '이전 결과'로 보고 무시.
+# 사이트가 컨테이너는 재사용하고 내용만 갈아끼울 수 있으므로 표가 아니라 행/빈 결과 표시에 붙인다.
+_FRESH_JS = "const fresh = el => !el.closest('[data-wait-stale]');"
+
+# a = {root, rows, empty, min}
+ROWS_OR_EMPTY = """function(a) {
+    %s
+    const root = a.root ? document.querySelector(a.root) : document;
+    if (!root) return null;
+    const rows = Array.from(root.querySelectorAll(a.rows)).filter(fresh);
+    if (rows.length >= (a.min || 1)) return {state: 'ready', count: rows.length};
+    if (a.empty) {
+        const e = Array.from(root.querySelectorAll(a.empty)).filter(fresh);
+        if (e.length) return {state: 'empty', count: 0};
+    }
+    return null;
+}""" % _FRESH_JS
+
+# a = {caption, rows, empty, min}: 캡션 문구로 표를 고른 뒤 (새로 그려진) 행/빈 결과 판정
+CAPTION_TABLE_ROWS = """function(a) {
+    %s
+    const tables = Array.from(document.querySelectorAll('table.tablesaw.tablesaw-stack')).filter(t => {
+        const cap = t.querySelector('caption');
+        return cap && cap.textContent.includes(a.caption);
+    });
+    let n = 0;
+    for (const t of tables) n += Array.from(t.querySelectorAll(a.rows || 'tbody > tr')).filter(fresh).length;
+    if (n >= (a.min || 1)) return {state: 'ready', count: n};
+    // 검색 결과가 없으면 표 안/밖에 빈 결과 표시만 그려지는 경우
+    if (a.empty && Array.from(document.querySelectorAll(a.empty)).filter(fresh).length) return {state: 'empty', count: 0};
+    return null;
+}""" % _FRESH_JS
+
+# a = {side, caption, pick, empty}: 사이드 패널 안 caption 표들 중 pick번째(없으면 첫 번째) 표의 데이터 행
+SIDE_CAPTION_TABLE = """function(a) {
+    %s
+    const side = document.querySelector(a.side);
+    if (!side) return null;
+    const tables = Array.from(side.querySelectorAll('table.tablesaw.tablesaw-stack')).filter(t => {
+        const cap = t.querySelector('caption');
+        return cap && cap.textContent.includes(a.caption);
+    });
+    if (!tables.length) return null;
+    const t = tables.length > a.pick ? tables[a.pick] : tables[0];
+    if (Array.from(t.querySelectorAll(a.empty)).filter(fresh).length) return {state: 'empty', count: 0};
+    const n = Array.from(t.querySelectorAll('tbody > tr')).filter(fresh).length;
+    return n ? {state: 'ready', count: n} : null;
+}""" % _FRESH_JS
+
+# a = {sel, than, gone}: sel 개수가 than 보다 커지거나, gone 셀렉터(예: 더보기 버튼)가 사라지면 종료
+COUNT_GROWS = """function(a) {
+    const n = document.querySelectorAll(a.sel).length;
+    if (n > a.than) return {state: 'ready', count: n};
+    if (a.gone && !document.querySelector(a.gone)) return {state: 'done', count: n};
+    return null;
+}"""
+
+_ASYNC_WAIT = """
+const done = arguments[arguments.length - 1];
+const args = arguments[0];
+const timeoutMs = arguments[1];
+const pred = (%s);
+let finished = false;
+function finish(r) {
+    if (finished) return;
+    finished = true;
+    try { obs.disconnect(); } catch (e) {}
+    clearTimeout(timer);
+    done(r);
+}
+function check() {
+    try { return pred(args); } catch (e) { return null; }
+}
+const obs = new MutationObserver(() => { const r = check(); if (r) finish(r); });
+const timer = setTimeout(() => finish(check() || {state: 'timeout', count: 0}), timeoutMs);
+const first = check();
+if (first) { finish(first); }
+else { obs.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true}); }
+"""
+
+_ASYNC_MUTATION = """
+const done = arguments[arguments.length - 1];
+const sel = arguments[0];
+const timeoutMs = arguments[1];
+const target = document.querySelector(sel);
+if (!target) { done({state: 'timeout', count: 0}); return; }
+const obs = new MutationObserver((muts) => {
+    obs.disconnect(); clearTimeout(timer);
+    done({state: 'mutated', count: muts.length});
+});
+const timer = setTimeout(() => { obs.disconnect(); done({state: 'timeout', count: 0}); }, timeoutMs);
+obs.observe(target, {childList: true, subtree: true});
+"""
+
+
+# a = {rows, more, max, grow}: '더보기'(more XPath)를 브라우저 안에서 직접 누르고, 행 수가 늘어나는 순간
+# (MutationObserver) 다음 클릭 → 버튼이 사라지거나 grow ms 안에 늘지 않으면 종료. WebDriver 왕복은 1회
+_ASYNC_EXPAND = """
+const done = arguments[arguments.length - 1];
+const a = arguments[0];
+const deadline = Date.now() + arguments[1];
+const rows = () => document.querySelectorAll(a.rows).length;
+let clicks = 0;
+function moreButton() {
+    const r = document.evaluate(a.more, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < r.snapshotLength; i++) {
+        const el = r.snapshotItem(i);
+        if (el.offsetWidth > 0 || el.offsetHeight > 0) return el;
+    }
+    return null;
+}
+function finish(state) { done({state: state, count: rows(), clicks: clicks}); }
+function step() {
+    if (clicks >= a.max) return finish('max');
+    if (Date.now() >= deadline) return finish('timeout');
+    const btn = moreButton();
+    if (!btn) return finish('done');
+    const before = rows();
+    let settled = false;
+    const next = (grew) => {
+        if (settled) return;
+        settled = true;
+        obs.disconnect();
+        clearTimeout(timer);
+        grew ? step() : finish('stalled');
+    };
+    const obs = new MutationObserver(() => { if (rows() > before) next(true); });
+    obs.observe(document.documentElement, {childList: true, subtree: true});
+    const timer = setTimeout(() => next(rows() > before), Math.max(0, Math.min(a.grow, deadline - Date.now())));
+    btn.click();
+    clicks++;
+    if (rows() > before) next(true);
+}
+step();
+"""
+
+# 목록 상단/하단의 '총 N건' 표기(없으면 null)
+_TOTAL_COUNT_JS = """
+const m = (document.body.innerText || '').match(/총\\s*([\\d,]+)\\s*건/);
+return m ? parseInt(m[1].replace(/,/g, ''), 10) : null;
+"""
+
+# 검색 폼의 페이지 크기 필드 후보(있는 것만 값 변경)
+PAGE_SIZE_FIELDS = ("pageSize", "recordCountPerPage", "pageUnit", "listSize")
+
+
+def _accept_alert(driver):
+    try:
+        Alert(driver).accept()
+        return True
+    except Exception:
+        return False
+
+
+def _run_async(driver, script, args, timeout):
+    """경고창이 끼어들면 확인 처리 후 남은 시간만큼 다시 대기"""
+    end = time.time() + timeout
+    while True:
+        remaining = end - time.time()
+        if remaining <= 0:
+            return {"state": "timeout", "count": 0}
+        driver.set_script_timeout(remaining + 5)
+        try:
+            return driver.execute_async_script(script, args, int(remaining * 1000)) or {"state": "timeout", "count": 0}
+        except UnexpectedAlertPresentException:
+            _accept_alert(driver)
+        except TimeoutException:
+            return {"state": "timeout", "count": 0}
+
+
+def wait_for(driver, predicate_js, args=None, timeout=10):
+    """predicate_js(args)가 객체를 반환하는 순간 그 값을 반환. 시간 초과 시 state='timeout'."""
+    return _run_async(driver, _ASYNC_WAIT % predicate_js, args or {}, timeout)
+
+
+def wait_for_mutation(driver, selector, timeout=5):
+    """selector 요소 하위에 DOM 변경이 한 번이라도 생기면 반환(목록 갱신 감지용)."""
+    return _run_async(driver, _ASYNC_MUTATION, selector, timeout)
+
+
+def mark_stale(driver, selector):
+    """현재 화면의 결과 요소를 '이전 결과'로 표시 → 다시 그려진 새 요소만 대기 대상이 된다."""
+    driver.execute_script(
+        "document.querySelectorAll(arguments[0]).forEach(el => el.setAttribute('data-wait-stale', '1'));",
+        selector,
+    )
+
+
+def wait_rows_or_empty(driver, rows, root=None, empty=EMPTY_MARKERS, min_count=1, timeout=10):
+    return wait_for(driver, ROWS_OR_EMPTY, {"root": root, "rows": rows, "empty": empty, "min": min_count}, timeout)
+
+
+def wait_caption_table(driver, caption, rows="tbody > tr", empty=EMPTY_MARKERS, min_count=1, timeout=10):
+    return wait_for(
+        driver, CAPTION_TABLE_ROWS,
+        {"caption": caption, "rows": rows, "empty": empty, "min": min_count},
+        timeout,
+    )
+
+
+def wait_side_table(driver, side, caption, pick=0, empty=EMPTY_MARKERS, timeout=10):
+    return wait_for(driver, SIDE_CAPTION_TABLE, {"side": side, "caption": caption, "pick": pick, "empty": empty}, timeout)
+
+
+def wait_count_grows(driver, selector, than, gone=None, timeout=4):
+    return wait_for(driver, COUNT_GROWS, {"sel": selector, "than": than, "gone": gone}, timeout)
+
+
+def count(driver, selector):
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length;", selector)
+
+
+def set_page_size(driver, size=1000, fields=PAGE_SIZE_FIELDS):
+    """검색 전에 호출: 폼에 페이지 크기 필드가 있으면 size로 바꿔 한 번에 받도록 한다. 바꾼 필드명 목록 반환"""
+    try:
+        changed = driver.execute_script(
+            """
+            const changed = [];
+            for (const name of arguments[0]) {
+                document.querySelectorAll(`input[name="${name}"], select[name="${name}"]`).forEach(el => {
+                    if (el.tagName === 'SELECT' && !Array.from(el.options).some(o => o.value == arguments[1])) {
+                        el.add(new Option(arguments[1], arguments[1]));
+                    }
+                    el.value = arguments[1];
+                    changed.push(name);
+                });
+            }
+            return changed;
+            """,
+            list(fields), str(size),
+        )
+    except UnexpectedAlertPresentException:
+        _accept_alert(driver)
+        return []
+    return changed or []
+
+
+def expected_total(driver):
+    try:
+        return driver.execute_script(_TOTAL_COUNT_JS)
+    except Exception:
+        return None
+
+
+def expand_list(driver, rows, more_xpath, max_clicks=40, grow_timeout=4):
+    """
+    '더보기'를 끝까지 펼친다(브라우저 안 루프 1회, 고정 sleep/클릭 대기 없음).
+    {"state": "done"|"stalled"|"max"|"timeout", "count": 로드된 행, "clicks": n, "expected": '총 N건' 또는 None}
+    """
+    res = _run_async(
+        driver, _ASYNC_EXPAND,
+        {"rows": rows, "more": more_xpath, "max": max_clicks, "grow": int(grow_timeout * 1000)},
+        max_clicks * grow_timeout + 5,
+    )
+    res.setdefault("clicks", 0)
+    if res["state"] == "timeout" and not res.get("count"):
+        res["count"] = count(driver, rows)
+    res["expected"] = expected_total(driver)
+    return res
+
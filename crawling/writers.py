@@ -0,0 +1,194 @@
+"""
+크롤링 결과 스트리밍 기록기 + (로컬 PK, 글로벌 PK) 기준 upsert 병합.
+
+경기가 끝날 때마다 행을 write()로 넘기면 batch_rows 단위로 타입을 고정한 DataFrame을 만들어
+CSV(이어쓰기) 또는 Parquet(row group)으로 바로 내보낸다. 전체 행을 리스트로 모아 두지 않으므로
+경기 수가 늘어도 메모리는 batch_rows 수준으로 일정하다. 확장자가 .parquet이면 Parquet(pyarrow).
+
+    with ResultWriter("jeonnam_bracket_matches.csv", RECORD_COLS) as w:
+        w.write(rows_out)          # 경기마다(여러 스레드에서 불러도 됨)
+
+    upsert("jeonnam_bracket_matches.csv", backfill_rows, RECORD_COLS)
+
+기록 중에는 "<경로>.tmp"에 쓰고 close() 때 교체하므로, 중간에 죽어도 이전 파일은 그대로 남는다.
+upsert는 기존 파일의 키 컬럼만 읽어 겹치는 경기가 없으면(백필처럼 빠진 경기만 채우는 경우)
+CSV 끝에 이어 붙이기만 하고, 겹치면 기존 파일을 묶음 단위로 흘려 읽으며 그 경기 행만 제자리에서 바꿔 다시 쓴다.
+"""
+import os
+import threading
+
+import pandas as pd
+
+KEY_COLS = ("로컬 PK", "글로벌 PK")
+DEFAULT_DTYPES = {"로컬 PK": "Int64"}  # 나머지 컬럼은 string(빈 값은 <NA>)
+
+
+def typed_frame(rows, columns, dtypes=None):
+    """행(dict 목록 또는 DataFrame) → 컬럼 순서/타입을 고정한 DataFrame(배치마다 스키마가 같도록)"""
+    dtypes = {**DEFAULT_DTYPES, **(dtypes or {})}
+    df = rows.reindex(columns=columns) if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=columns)
+    for c in columns:
+        dt = dtypes.get(c, "string")
+        if dt != "string" and pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dt)):
+            df[c] = pd.to_numeric(df[c], errors="coerce")  # 다시 읽은 CSV 묶음은 "12" 같은 문자열
+        df[c] = df[c].astype(dt)
+    return df
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith((".parquet", ".pq"))
+
+
+class ResultWriter:
+    def __init__(self, path, columns, dtypes=None, batch_rows=2000):
+        self.path = path
+        self.columns = list(columns)
+        self.dtypes = dtypes
+        self.batch_rows = batch_rows
+        self.parquet = _is_parquet(path)
+        self.rows = 0
+        self.batches = 0
+        self._tmp = f"{path}.tmp"
+        self._buf = []
+        self._pq = None
+        self._lock = threading.Lock()
+        self._closed = False
+        if os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    @classmethod
+    def open(cls, writer, columns, **kw):
+        """경로 문자열/ResultWriter/None 을 받아 ResultWriter 또는 None 반환"""
+        if writer is None or isinstance(writer, ResultWriter):
+            return writer
+        return cls(writer, columns, **kw)
+
+    def write(self, rows):
+        """경기 하나(또는 여러 경기)의 행 추가. 쌓인 행이 batch_rows를 넘으면 바로 내보낸다"""
+        if rows is None or len(rows) == 0:
+            return
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict("records")
+        with self._lock:
+            self._buf.extend(rows)
+            if len(self._buf) >= self.batch_rows:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self, force=False):
+        if not self._buf and not (force and self.batches == 0):
+            return
+        df = typed_frame(self._buf, self.columns, self.dtypes)
+        self._buf = []
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._pq is None:
+                self._pq = pq.ParquetWriter(self._tmp, table.schema)
+            self._pq.write_table(table.cast(self._pq.schema))
+        else:
+            first = self.batches == 0
+            df.to_csv(
+                self._tmp, mode="w" if first else "a", header=first, index=False,
+                encoding="utf-8-sig" if first else "utf-8",
+            )
+        self.rows += len(df)
+        self.batches += 1
+
+    def close(self):
+        """남은 행을 내보내고 임시 파일을 최종 경로로 교체. 기록한 행 수 반환"""
+        with self._lock:
+            if self._closed:
+                return self.rows
+            self._closed = True
+            self._flush(force=True)  # 0행이어도 헤더/스키마만 있는 파일은 남긴다
+            if self._pq is not None:
+                self._pq.close()
+        os.replace(self._tmp, self.path)
+        return self.rows
+
+    def abort(self):
+        """기록 중단: 임시 파일만 지우고 기존 파일은 건드리지 않는다"""
+        with self._lock:
+            self._closed = True
+            self._buf = []
+            if self._pq is not None:
+                self._pq.close()
+        if os.path.exists(self._tmp):
+            os.remove(self._tmp)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def iter_batches(path, columns=None, batch_rows=50000):
+    """CSV/Parquet 파일을 batch_rows 행씩 DataFrame으로 흘려 읽기(columns만 읽으면 더 가볍다)"""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows, columns=columns):
+            yield batch.to_pandas()
+        return
+    yield from pd.read_csv(path, usecols=columns, chunksize=batch_rows, encoding="utf-8-sig", dtype=str)
+
+
+def _keys(df, key):
+    cols = [df[c].astype("string").fillna("") for c in key]
+    # 로컬 PK가 "12"/"12.0"/12 어느 쪽으로 읽혀도 같은 키가 되도록
+    cols[0] = cols[0].str.replace(r"\.0$", "", regex=True)
+    return list(zip(*cols))
+
+
+def upsert(path, rows, columns, key=KEY_COLS, dtypes=None, batch_rows=50000):
+    """
+    rows(dict 목록/DataFrame)를 path에 (로컬 PK, 글로벌 PK) 기준으로 병합한다.
+    같은 키의 기존 행은 그 경기가 있던 자리에서 모두 새 행으로 바뀌고(경기 단위 교체), 새 키는 뒤에 붙는다.
+    반환: {"rows": 새로 쓴 행 수, "replaced": 교체된 경기 수, "rewritten": 기존 파일을 다시 썼는지}
+    """
+    new = typed_frame(rows, columns, dtypes)
+    key = list(key)
+    new_keys = set(_keys(new, key))
+    if not os.path.exists(path):
+        with ResultWriter(path, columns, dtypes) as w:
+            w.write(new)
+        return {"rows": len(new), "replaced": 0, "rewritten": True}
+
+    # 1) 기존 파일에서 키 컬럼만 훑어 겹치는 경기 찾기
+    overlap = set()
+    for chunk in iter_batches(path, columns=key, batch_rows=batch_rows):
+        overlap.update(k for k in _keys(chunk, key) if k in new_keys)
+
+    # 2) 겹치는 경기가 없으면 CSV는 끝에 이어 붙이기만
+    if not overlap and not _is_parquet(path):
+        header = pd.read_csv(path, nrows=0, encoding="utf-8-sig").columns  # 기존 파일 컬럼 순서에 맞춤
+        new.reindex(columns=header).to_csv(path, mode="a", header=False, index=False, encoding="utf-8")
+        return {"rows": len(new), "replaced": 0, "rewritten": False}
+
+    # 3) 겹치면(또는 Parquet이면) 기존 행을 묶음 단위로 흘려 다시 쓰면서 해당 경기 행만 그 자리에서 교체
+    positions = {}  # 키 → 새 행 위치 목록(입력 순서)
+    for i, k in enumerate(_keys(new, key)):
+        positions.setdefault(k, []).append(i)
+    emitted = set()
+    with ResultWriter(path, columns, dtypes, batch_rows=batch_rows) as w:
+        for chunk in iter_batches(path, batch_rows=batch_rows):
+            start = 0
+            for i, k in enumerate(_keys(chunk, key) if overlap else ()):
+                if k not in overlap:
+                    continue
+                w.write(chunk.iloc[start:i])
+                start = i + 1
+                if k not in emitted:  # 그 경기의 첫 기존 행 자리에 새 행을 한 번만
+                    emitted.add(k)
+                    w.write(new.iloc[positions[k]])
+            w.write(chunk.iloc[start:])
+        w.write(new.iloc[[i for k, pos in positions.items() if k not in emitted for i in pos]])
+    return {"rows": len(new), "replaced": len(overlap), "rewritten": True}
@@ -0,0 +1,190 @@
+"""
+스냅샷 하나로 대시보드 전체(통계 기준별 표/그래프 + 학생별 페이지)를
+정적 HTML/JSON 묶음으로 미리 렌더링한다. 결과 폴더는 아무 정적 파일 서버로 서빙하면 된다.
+
+    python export_static.py --snapshot snapshot.parquet --out dist
+    python export_static.py --save-snapshot snapshot.parquet --out dist   # 시트에서 새로 받아 스냅샷도 저장
+"""
+import argparse
+import html
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+from charts import create_radar_chart, make_melted_df, create_group_bar_chart, create_player_line_chart
+from load_data import PersonalSheet, SnapshotSheet
+from preprocess import (
+    LEVEL_COLS, NUMERIC_COLS, PER_GAME_COLS, PER_STUDENT_COLS,
+    add_key_cols, add_rate_cols, detect_date_col, get_agg_df, get_tabular_data,
+)
+
+LEVEL_SLUGS = {"학년": "grade", "반": "class", "팀": "team", "성별": "gender"}
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{root}plotly.min.js"></script>
+<style>
+body {{ font-family: "Malgun Gothic", sans-serif; margin: 24px; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ddd; padding: 4px 8px; text-align: right; }}
+.figs {{ display: flex; flex-wrap: wrap; gap: 16px; }}
+.figs > div {{ flex: 1 1 480px; }}
+</style>
+</head>
+<body>
+<p><a href="{root}index.html">🏐 처음으로</a></p>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _write_json(path, obj):
+    _write(path, json.dumps(obj, ensure_ascii=False))
+
+
+def _native(v):
+    """numpy 스칼라 → 파이썬 int/float/str(json.dumps용). 결측은 None"""
+    if v is None or (np.ndim(v) == 0 and pd.isna(v)):
+        return None
+    return v.item() if isinstance(v, np.generic) else v
+
+
+def _records(df):
+    return json.loads(df.to_json(orient="records", force_ascii=False, date_format="iso"))
+
+
+def _page(title, body, root):
+    return PAGE_TEMPLATE.format(title=html.escape(title), body=body, root=root)
+
+
+def _figs_html(figs):
+    # plotly.js는 묶음 최상단에 한 번만 두고 각 페이지에서 공유
+    parts = [pio.to_html(fig, full_html=False, include_plotlyjs=False) for fig in figs]
+    return '<div class="figs">' + "".join(f"<div>{p}</div>" for p in parts) + "</div>"
+
+
+def _table_html(df):
+    return df.to_html(index=False, float_format=lambda v: f"{v:.2f}", border=0)
+
+
+def build_level_view(df, level):
+    """app.py의 각 탭과 같은 (집계표, 그래프 목록)을 만든다."""
+    selected_col, match_agg_cols = LEVEL_COLS[level]
+    grouped = get_agg_df(df, selected_col, match_agg_cols)
+    figs = {}
+    if grouped.empty:
+        return grouped, figs
+
+    if level == "학년":
+        grouped = add_rate_cols(grouped)
+        figs["경기당 평균"] = create_radar_chart(grouped, PER_GAME_COLS, title="경기당 평균")
+        figs["인원당 평균"] = create_radar_chart(grouped, PER_STUDENT_COLS, title="인원당 평균")
+        grouped = grouped.drop(columns=PER_GAME_COLS + PER_STUDENT_COLS)
+    elif level == "반":
+        grouped = add_rate_cols(grouped)
+        game_avg_df = make_melted_df(grouped, PER_GAME_COLS, value_name="경기당 평균", suffix="_경기당")
+        student_avg_df = make_melted_df(grouped, PER_STUDENT_COLS, value_name="인원당 평균", suffix="_인원당")
+        figs["경기당 평균"] = create_group_bar_chart(game_avg_df, "경기당 평균", title="반별 경기당 평균 지표")
+        figs["인원당 평균"] = create_group_bar_chart(student_avg_df, "인원당 평균", title="반별 인원당 평균 지표")
+        grouped = grouped.drop(columns=PER_GAME_COLS + PER_STUDENT_COLS)
+    return grouped, figs
+
+
+def export_levels(df, out_dir):
+    links = []
+    for level, slug in LEVEL_SLUGS.items():
+        grouped, figs = build_level_view(df, level)
+        body = _figs_html(figs.values()) if figs else ""
+        body += f"<h2>📊 {html.escape(level)} 기준 집계표</h2>" + _table_html(grouped)
+        _write(os.path.join(out_dir, "levels", f"{slug}.html"), _page(f"{level} 기준 통계", body, "../"))
+        _write_json(os.path.join(out_dir, "levels", f"{slug}.json"), {
+            "level": level,
+            "table": _records(grouped),
+            "figures": {name: json.loads(pio.to_json(fig)) for name, fig in figs.items()},
+        })
+        links.append((f"levels/{slug}.html", f"{level} 기준"))
+    return links
+
+
+def export_students(df, out_dir, date_col=None):
+    table = get_tabular_data(df).sort_values("학년-반-번호")
+    index = []
+    for _, row in table.iterrows():
+        sid = row["학년-반-번호"]
+        name = f"{row['이름']} ({sid})"
+        player_df = df[df["학년-반-번호"] == sid]
+        if date_col:
+            player_df = player_df.sort_values(by=date_col)
+
+        figs = {}
+        if date_col and not player_df.empty:
+            figs["추이"] = create_player_line_chart(player_df, date_col, title=f"{name} - 날짜별 통계 추이")
+
+        summary = row.to_frame().T
+        body = _table_html(summary) + (_figs_html(figs.values()) if figs else "")
+        body += "<h2>경기별 기록</h2>" + _table_html(player_df.drop(columns=["학년-반", "학년-반-번호"], errors="ignore"))
+
+        _write(os.path.join(out_dir, "students", f"{sid}.html"), _page(name, body, "../"))
+        _write_json(os.path.join(out_dir, "students", f"{sid}.json"), {
+            "student": _records(summary)[0],
+            "history": _records(player_df),
+            "figures": {k: json.loads(pio.to_json(fig)) for k, fig in figs.items()},
+        })
+        index.append({
+            "id": _native(sid), "이름": _native(row["이름"]), "팀명": _native(row["팀명"]),
+            **{c: _native(row[c]) for c in NUMERIC_COLS},
+        })
+
+    _write_json(os.path.join(out_dir, "students", "index.json"), index)
+    return index
+
+
+def export_static(df, out_dir):
+    df = add_key_cols(df)
+    date_col = detect_date_col(df)
+
+    _write(os.path.join(out_dir, "plotly.min.js"), get_plotlyjs())
+    level_links = export_levels(df, out_dir)
+    students = export_students(df, out_dir, date_col=date_col)
+
+    items = "".join(f'<li><a href="{href}">{html.escape(label)}</a></li>' for href, label in level_links)
+    body = f"<h2>📌 통계 기준</h2><ul>{items}</ul>"
+    body += "<h2>개인별 통계</h2><ul>" + "".join(
+        f'<li><a href="students/{html.escape(s["id"])}.html">{html.escape(str(s["이름"]))} ({html.escape(s["id"])})</a></li>'
+        for s in students
+    ) + "</ul>"
+    _write(os.path.join(out_dir, "index.html"), _page("2025. JFLH 츄크볼 리그전 누가기록", body, ""))
+    print(f"[EXPORT] {out_dir} | 통계 기준 {len(level_links)}개 | 학생 {len(students)}명")
+    return out_dir
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 정적 내보내기")
+    parser.add_argument("--snapshot", help="SnapshotSheet parquet 경로 (없으면 시트에서 새로 받음)")
+    parser.add_argument("--save-snapshot", help="시트에서 받은 데이터를 이 경로에 스냅샷으로 저장")
+    parser.add_argument("--out", default="dist")
+    args = parser.parse_args()
+
+    if args.snapshot:
+        personal_df = SnapshotSheet(args.snapshot).fetch_df()
+    else:
+        personal_df = PersonalSheet().fetch_df()
+        if args.save_snapshot:
+            SnapshotSheet.save(personal_df, args.save_snapshot)
+
+    export_static(personal_df, args.out)
@@ -0,0 +1,102 @@
+import math
+
+import pandas as pd
+import streamlit as st
+from st_aggrid import AgGrid, GridOptionsBuilder, JsCode
+from profiling import timed
+
+PAGE_SIZES = [20, 50, 100]
+
+# 소수 컬럼(경기당/인원당 평균 등)은 소수점 둘째 자리까지만 표시
+FLOAT_FORMATTER = JsCode(
+    """
+    function(params) {
+        if (params.value === null || params.value === undefined) { return ''; }
+        return Number(params.value).toFixed(2);
+    }
+    """
+)
+
+
+def filter_df(df, text):
+    """모든 컬럼을 문자열로 보고 부분일치(대소문자 무시)하는 행만 남긴다."""
+    text = (text or "").strip()
+    if not text:
+        return df
+    mask = pd.Series(False, index=df.index)
+    for col in df.columns:
+        mask |= df[col].astype(str).str.contains(text, case=False, regex=False, na=False)
+    return df[mask]
+
+
+def sort_df(df, sort_col, ascending=True):
+    if not sort_col or sort_col not in df.columns:
+        return df
+    return df.sort_values(by=sort_col, ascending=ascending, kind="mergesort")
+
+
+def slice_page(df, page, page_size):
+    """page는 1부터 시작. 범위를 벗어나면 마지막 페이지로 맞춘다."""
+    total = len(df)
+    n_pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, int(page)), n_pages)
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size], page, n_pages
+
+
+def _grid_options(page_df):
+    gb = GridOptionsBuilder.from_dataframe(page_df)
+    # 정렬/필터는 서버에서 처리하므로 그리드 자체 기능은 끈다
+    gb.configure_default_column(sortable=False, filter=False, resizable=True)
+    for col in page_df.select_dtypes(include="float").columns:
+        gb.configure_column(col, valueFormatter=FLOAT_FORMATTER)
+    return gb.build()
+
+
+@timed("grid.paged_grid")
+def paged_grid(df, key, default_sort=None, page_sizes=PAGE_SIZES):
+    """
+    큰 표를 페이지 단위로만 브라우저에 보내는 AgGrid 표.
+    df는 캐시된 집계 결과를 그대로 넘기면 되고, 검색/정렬/페이지 이동은
+    위젯 값으로 서버에서 계산해 현재 페이지 행만 AgGrid로 렌더링한다.
+    """
+    if df is None or df.empty:
+        st.info("표시할 데이터가 없습니다.")
+        return None
+
+    cols = list(df.columns)
+    c1, c2, c3, c4 = st.columns([3, 2, 1, 1])
+    with c1:
+        filter_text = st.text_input("🔍 검색", key=f"{key}_filter")
+    with c2:
+        sort_idx = cols.index(default_sort) if default_sort in cols else 0
+        sort_col = st.selectbox("정렬 기준", cols, index=sort_idx, key=f"{key}_sort")
+    with c3:
+        descending = st.toggle("내림차순", key=f"{key}_desc")
+    with c4:
+        page_size = st.selectbox("행 수", page_sizes, key=f"{key}_size")
+
+    view = sort_df(filter_df(df, filter_text), sort_col, ascending=not descending)
+    n_pages = max(1, math.ceil(len(view) / page_size))
+    page_key = f"{key}_page"
+    # 검색어/행 수가 바뀌면 1쪽부터. 그대로여도 쪽수가 줄었으면 저장된 값이 max_value를 넘지 않게 맞춘다
+    view_state = (filter_text, page_size)
+    if st.session_state.get(f"{key}_view") != view_state:
+        st.session_state[f"{key}_view"] = view_state
+        st.session_state[page_key] = 1
+    elif st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    page = st.number_input(
+        f"페이지 (총 {n_pages}쪽, {len(view)}행)",
+        min_value=1, max_value=n_pages, step=1, key=page_key,
+    )
+    page_df, _, _ = slice_page(view, page, page_size)
+
+    return AgGrid(
+        page_df.reset_index(drop=True),
+        gridOptions=_grid_options(page_df),
+        height=min(40 + 35 * max(len(page_df), 1), 600),
+        allow_unsafe_jscode=True,
+        fit_columns_on_grid_load=True,
+        key=f"{key}_grid",
+    )
@@ -2,6 +2,7 @@ import gspread
 import pandas as pd
 import streamlit as st
 from google.oauth2.service_account import Credentials
+from profiling import stage, timed
 
 SCOPES = [
     'https://www.googleapis.com/auth/spreadsheets',
@@ -14,6 +15,7 @@ class PersonalSheet:
     def __init__(self):
         pass
 
+    @timed("load.clean_dataframe")
     def clean_dataframe(self, df):
     
         if '날짜' in df.columns:
@@ -33,6 +35,7 @@ class PersonalSheet:
 
         return df
 
+    @timed("load.PersonalSheet.fetch_df")
     def fetch_df(self):
         
         if "google" in st.secrets:
@@ -51,8 +54,9 @@ class PersonalSheet:
         combined_dfs = []
 
         for sheet_name in target_sheets:        
-            ws = spreadsheet.worksheet(sheet_name)
-            values = ws.get_all_values()
+            with stage("load.sheets_fetch"):
+                ws = spreadsheet.worksheet(sheet_name)
+                values = ws.get_all_values()
 
             # A~H (0~7): 2행 헤더, 3행부터 데이터
             header_normal = values[1][0:8]
@@ -81,12 +85,32 @@ class PersonalSheet:
         final_df = self.clean_dataframe(final_df)
 
         return final_df
+
+
+class SnapshotSheet:
+    """
+    PersonalSheet().fetch_df() 결과를 파일로 고정해 둔 스냅샷.
+    시트 호출 없이 같은 데이터를 다시 쓰거나(정적 내보내기 등) 로컬에서 재현할 때 사용.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def save(df, path):
+        df.to_parquet(path, index=False)
+        return path
+
+    def fetch_df(self):
+        return pd.read_parquet(self.path)
+
     
 class MatchSheet:
 
     def __init__(self):
         pass
 
+    @timed("load.MatchSheet.fetch_df")
     def fetch_df(self):
         
         if "google" in st.secrets:
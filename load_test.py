@@ -0,0 +1,297 @@
+"""
+app.py 동시 접속 부하 테스트.
+
+실제 `streamlit run` 서버 하나를 띄우고, 브라우저 대신 웹소켓 세션 N개가 동시에 접속해
+사용 흐름(데이터 가져오기 → 통계 기준 전환 → 학생 둘러보기)을 재현한다. 세션들이 서버 하나의
+st.cache_data/GIL/메모리를 함께 쓰므로 "서버 한 대가 몇 명까지 버티는가"를 그대로 잰다.
+구성(세션 수)마다 서버를 새로 띄워(빈 캐시에서 시작) 재실행 지연 백분위수 / 서버 최대 RSS / 처리량 / 실패 수를 출력한다.
+데이터는 시트 대신 로컬 스냅샷(JFLH_SNAPSHOT)을 쓴다.
+
+    python load_test.py --snapshot snapshot.parquet --sessions 1 4 8 16 --script mixed
+    python load_test.py --snapshot snapshot.parquet --sessions 8 --json load_result.json
+
+재실행 하나 = 위젯 값을 담은 rerun_script 요청을 보내고 script_finished를 받을 때까지.
+실패 = 시간 초과/연결 끊김, 또는 스크립트 예외·st.error가 그려진 재실행(app.py는 가져오기 예외를 st.error로 보여 준다).
+서버 RSS는 /proc/<pid>/status의 VmHWM(Linux)이고, 다른 OS에서는 표시하지 않는다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.websocket import websocket_connect
+
+LEVELS = ['학년', '반', '팀', '성별']
+FETCH_BUTTON = "📥 데이터 가져오기"
+LEVEL_RADIO = "📌 통계 기준 선택"
+PLAYER_SELECT = "개인 선택"
+WIDGET_TYPES = ("button", "radio", "selectbox")
+
+
+# ---------- 서버 ----------
+class AppServer:
+    """streamlit run 서버 하나(헤드리스). peak_rss_mb()는 지금까지의 최대 RSS"""
+
+    def __init__(self, app_path, env=None, startup_timeout=60):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", app_path,
+             "--server.headless=true", f"--server.port={self.port}", "--server.address=127.0.0.1",
+             "--server.fileWatcherType=none", "--browser.gatherUsageStats=false"],
+            env={**os.environ, **(env or {})}, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        self._wait_ready(startup_timeout)
+
+    @property
+    def ws_url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def _wait_ready(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"streamlit 서버 종료(코드 {self.proc.returncode})")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=2) as r:
+                    if r.status == 200:
+                        return
+            except OSError:
+                pass
+            time.sleep(0.3)
+        self.stop()
+        raise TimeoutError(f"streamlit 서버가 {timeout}s 안에 뜨지 않음")
+
+    def peak_rss_mb(self):
+        try:
+            with open(f"/proc/{self.proc.pid}/status", encoding="ascii") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return int(line.split()[1]) / 1024  # kB
+        except OSError:
+            pass
+        return None
+
+    def stop(self):
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+
+# ---------- 세션(브라우저 탭 하나) ----------
+class Session:
+    def __init__(self, url, timeout):
+        self.url = url
+        self.timeout = timeout
+        self.ws = None
+        self.page_hash = ""
+        self.widgets = {}   # 라벨 → 위젯 proto(마지막으로 그려진 것)
+        self.states = {}    # 위젯 id → WidgetState(값을 바꾼 위젯만, 나머지는 서버 기본값)
+
+    async def connect(self):
+        self.ws = await websocket_connect(self.url, subprotocols=["streamlit"])
+
+    def close(self):
+        if self.ws is not None:
+            self.ws.close()
+
+    def widget(self, label):
+        return self.widgets.get(label)
+
+    def set_index(self, label, index):
+        wid = self.widgets[label].id
+        self.states[wid] = WidgetState(id=wid, int_value=index)
+
+    async def rerun(self, trigger=None):
+        """재실행 1회 → (ms, 오류 메시지 목록)"""
+        msg = BackMsg()
+        client = msg.rerun_script
+        client.page_script_hash = self.page_hash
+        for state in self.states.values():
+            client.widget_states.widgets.add().CopyFrom(state)
+        if trigger is not None:
+            pressed = client.widget_states.widgets.add()
+            pressed.id = self.widgets[trigger].id
+            pressed.trigger_value = True
+
+        t0 = time.perf_counter()
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+        errors = []
+        while True:
+            raw = await asyncio.wait_for(self.ws.read_message(), self.timeout)
+            if raw is None:
+                raise ConnectionError("웹소켓 연결 끊김")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "new_session":
+                self.page_hash = fwd.new_session.page_script_hash
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                el = fwd.delta.new_element
+                etype = el.WhichOneof("type")
+                if etype in WIDGET_TYPES:
+                    proto = getattr(el, etype)
+                    self.widgets[proto.label] = proto
+                elif etype == "exception":
+                    errors.append(f"{el.exception.type}: {el.exception.message}")
+                elif etype == "alert" and el.alert.format == Alert.ERROR:
+                    errors.append(el.alert.body)
+            elif kind == "script_finished":
+                return (time.perf_counter() - t0) * 1000, errors
+
+
+async def _timed_run(session, latencies, failures, label, trigger=None):
+    ms, errors = await session.rerun(trigger)
+    latencies.append((label, ms))
+    if errors:
+        failures.append(f"{label}: {errors[0][:200]}")
+        raise RuntimeError(f"{label}: {errors[0][:200]}")
+
+
+async def _fetch(s, lat, fail):
+    await _timed_run(s, lat, fail, "initial")
+    await _timed_run(s, lat, fail, "fetch", trigger=FETCH_BUTTON)
+
+
+async def _browse_levels(s, lat, fail):
+    for level in LEVELS:
+        s.set_index(LEVEL_RADIO, list(s.widget(LEVEL_RADIO).options).index(level))
+        await _timed_run(s, lat, fail, f"level:{level}")
+
+
+async def _browse_students(s, lat, fail, max_students=10):
+    s.set_index(LEVEL_RADIO, list(s.widget(LEVEL_RADIO).options).index('개인'))
+    await _timed_run(s, lat, fail, "level:개인")
+    player = s.widget(PLAYER_SELECT)
+    if player is None:
+        return
+    for i in range(min(max_students, len(player.options))):
+        s.set_index(PLAYER_SELECT, i)
+        await _timed_run(s, lat, fail, "student")
+
+
+async def _mixed(s, lat, fail):
+    await _fetch(s, lat, fail)
+    await _browse_levels(s, lat, fail)
+    await _browse_students(s, lat, fail)
+
+
+async def _levels(s, lat, fail):
+    await _fetch(s, lat, fail)
+    await _browse_levels(s, lat, fail)
+
+
+async def _students(s, lat, fail):
+    await _fetch(s, lat, fail)
+    await _browse_students(s, lat, fail)
+
+
+SCRIPTS = {"levels": _levels, "students": _students, "mixed": _mixed}
+
+
+async def run_session(url, script, iterations, timeout):
+    """세션 하나: 반복마다 새로 접속(새 탭)해 스크립트 실행. 실패한 반복은 거기서 멈추고 다음 반복으로"""
+    latencies, failures = [], []
+    for _ in range(iterations):
+        session = Session(url, timeout)
+        try:
+            await session.connect()
+            await SCRIPTS[script](session, latencies, failures)
+        except RuntimeError:
+            pass  # 오류 요소가 그려진 재실행(failures에 기록됨)
+        except Exception as e:
+            failures.append(f"{type(e).__name__}: {str(e)[:200]}")
+        finally:
+            session.close()
+    return {"latencies": latencies, "errors": failures}
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    k = (len(values) - 1) * p / 100
+    lo, hi = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+
+async def _run_sessions(url, sessions, script, iterations, timeout):
+    return await asyncio.gather(*[run_session(url, script, iterations, timeout) for _ in range(sessions)])
+
+
+def run_config(app_path, sessions, script="mixed", iterations=1, timeout=60, env=None):
+    """서버 하나를 새로 띄우고 세션 sessions개를 동시에 돌린 결과"""
+    server = AppServer(app_path, env=env)
+    try:
+        t0 = time.perf_counter()
+        results = asyncio.run(_run_sessions(server.ws_url, sessions, script, iterations, timeout))
+        wall = time.perf_counter() - t0
+        rss = server.peak_rss_mb()
+    finally:
+        server.stop()
+
+    ms = [v for r in results for _, v in r["latencies"]]
+    errors = [e for r in results for e in r["errors"]]
+    return {
+        "sessions": sessions,
+        "script": script,
+        "reruns": len(ms),
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "p50_ms": percentile(ms, 50),
+        "p90_ms": percentile(ms, 90),
+        "p99_ms": percentile(ms, 99),
+        "max_ms": max(ms) if ms else None,
+        "over_1s": sum(1 for v in ms if v > 1000),
+        "server_peak_rss_mb": rss,
+        "throughput_rps": len(ms) / wall if wall else None,
+        "wall_s": wall,
+    }
+
+
+def _fmt(v, spec=".0f"):
+    return "-" if v is None else format(v, spec)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="app.py 동시 세션 부하 테스트(streamlit 서버 1대)")
+    parser.add_argument("--snapshot", required=True, help="SnapshotSheet parquet 경로")
+    parser.add_argument("--app", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py"))
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--script", choices=sorted(SCRIPTS), default="mixed")
+    parser.add_argument("--iterations", type=int, default=1, help="세션당 스크립트 반복 횟수")
+    parser.add_argument("--timeout", type=float, default=60, help="재실행 1회 최대 대기(초)")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    server_env = {"JFLH_SNAPSHOT": os.path.abspath(args.snapshot)}
+
+    rows = []
+    print(f"{'sessions':>8} {'reruns':>7} {'p50':>7} {'p90':>7} {'p99':>7} {'>1s':>5} {'rss(srv)':>9} {'rps':>7} {'err':>4}")
+    for n in args.sessions:
+        r = run_config(args.app, n, script=args.script, iterations=args.iterations, timeout=args.timeout,
+                       env=server_env)
+        rows.append(r)
+        print(
+            f"{n:>8} {r['reruns']:>7} {_fmt(r['p50_ms']):>7} {_fmt(r['p90_ms']):>7} {_fmt(r['p99_ms']):>7} "
+            f"{r['over_1s']:>5} {_fmt(r['server_peak_rss_mb'], '.1f'):>9} {_fmt(r['throughput_rps'], '.2f'):>7} {r['errors']:>4}",
+            flush=True,
+        )
+        for e in r["error_samples"]:
+            print(f"    ! {e}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
@@ -1,3 +1,49 @@
+import pandas as pd
+from profiling import timed
+
+NUMERIC_COLS = ["수비성공", "패스시도", "공격시도"]
+
+# 통계 기준(탭) → (집계 기준 컬럼, 경기수 산정용 그룹 컬럼)
+LEVEL_COLS = {
+    "학년": ("학년", ["학년", "반", "팀명"]),
+    "반": ("학년-반", ["학년-반", "팀명"]),
+    "팀": ("팀명", ["학년-반", "팀명"]),
+    "성별": ("성별", ["학년-반", "팀명"]),
+}
+
+PER_GAME_COLS = [f"{c}_경기당" for c in NUMERIC_COLS]
+PER_STUDENT_COLS = [f"{c}_인원당" for c in NUMERIC_COLS]
+
+
+def add_key_cols(personal_df):
+    personal_df["학년-반"] = personal_df["학년"].astype(str) + "_" + personal_df["반"].astype(str)
+    personal_df["학년-반-번호"] = (
+        personal_df["학년"].astype(str) + "-" + personal_df["반"].astype(str) + "-" + personal_df["번호"].astype(str)
+    )
+    return personal_df
+
+
+def detect_date_col(df):
+    """'날짜'/'date'가 들어간 첫 컬럼을 datetime으로 바꾸고 그 이름을 반환(없으면 None)."""
+    for col in df.columns:
+        if '날짜' in col or 'date' in col.lower():
+            try:
+                df[col] = pd.to_datetime(df[col])
+                return col
+            except Exception:
+                pass
+    return None
+
+
+def add_rate_cols(grouped):
+    for c in NUMERIC_COLS:
+        grouped[f"{c}_경기당"] = grouped[c] / grouped["경기수"]
+    for c in NUMERIC_COLS:
+        grouped[f"{c}_인원당"] = grouped[c] / grouped["학생수"]
+    return grouped
+
+
+@timed("preprocess.get_tabular_data")
 def get_tabular_data(df):
     table_df = (
         df.groupby(["학년", "반", "학년-반","학년-반-번호","번호", "팀명", "이름", "성별"])
@@ -22,9 +68,8 @@ def get_tabular_data(df):
     )
     return table_df
 
+@timed("preprocess.get_agg_df")
 def get_agg_df(personal_df, selected_col, match_agg_cols):
-    NUMERIC_COLS = ["수비성공", "패스시도", "공격시도"]
-
     df = get_tabular_data(personal_df)
     grouped_a = df.groupby(selected_col)[NUMERIC_COLS].sum().reset_index()
     if selected_col != "성별":
@@ -0,0 +1,129 @@
+"""
+재실행(rerun) 단위의 가벼운 구간 계측.
+
+    rec = start_run(trace_memory=True)   # 스크립트 맨 앞
+    with stage("app.figures"):           # 또는 @timed("preprocess.get_agg_df")
+        ...
+    finish_run(rec, extra={"tab": "학년"})  # 스크립트 맨 끝 → JSON lines 로그에 추가(아래 LOG_PATH 참고)
+
+Streamlit은 세션마다 별도 스레드에서 스크립트를 돌리므로 현재 계측 대상은
+thread-local로 둔다. start_run 없이 호출되면 stage/timed는 아무 일도 하지 않는다.
+tracemalloc은 프로세스 전역이라 한 번 켜면 끄지 않는다(디버그 모드에서만 켤 것).
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# 파일 기록: debug 재실행(?debug=1/JFLH_DEBUG=1)은 기본으로 DEBUG_LOG_PATH에, 일반 재실행은 JFLH_PERF_LOG=경로 를 줄 때만
+# (배포된 대시보드의 모든 재실행을 쓰면 파일이 끝없이 커지므로). JFLH_PERF_LOG=0 이면 debug여도 기록하지 않는다.
+_PERF_LOG = os.environ.get("JFLH_PERF_LOG", "")
+LOG_OFF = _PERF_LOG.lower() in ("0", "off", "false")
+LOG_PATH = None if LOG_OFF else (_PERF_LOG or None)
+DEBUG_LOG_PATH = "perf_log.jsonl"
+
+_local = threading.local()
+
+
+class Recorder:
+    def __init__(self, trace_memory=False, debug=False):
+        self.trace_memory = trace_memory
+        self.debug = debug
+        self.stages = []
+        self.metrics = {}
+        self._stack = []
+        self.t0 = time.perf_counter()
+        self.ts = time.time()
+
+    def total_ms(self):
+        return (time.perf_counter() - self.t0) * 1000
+
+
+def start_run(trace_memory=False, debug=False):
+    """debug=True면 비용이 큰 부가 계측(debugging() 참고)도 기록한다."""
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    rec = Recorder(trace_memory=trace_memory and tracemalloc.is_tracing(), debug=debug)
+    _local.recorder = rec
+    return rec
+
+
+def current():
+    return getattr(_local, "recorder", None)
+
+
+def debugging():
+    """현재 재실행이 debug 계측 중인지. 계측 자체가 무거운 값(그래프 JSON 직렬화 등)은 이때만 잰다."""
+    rec = current()
+    return rec is not None and rec.debug
+
+
+@contextmanager
+def stage(name):
+    rec = current()
+    if rec is None:
+        yield
+        return
+
+    # 중첩 구간: 자식이 reset_peak 하므로 부모 peak는 자식들의 최대값과 합쳐서 계산
+    frame = {"name": name, "depth": len(rec._stack), "child_peak": 0}
+    if rec.trace_memory:
+        frame["outer_peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+    rec._stack.append(frame)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        ms = (time.perf_counter() - t0) * 1000
+        rec._stack.pop()
+        entry = {"name": name, "depth": frame["depth"], "ms": round(ms, 2)}
+        if rec.trace_memory:
+            peak = max(tracemalloc.get_traced_memory()[1], frame["child_peak"])
+            entry["peak_kb"] = round(peak / 1024, 1)
+            if rec._stack:
+                parent = rec._stack[-1]
+                parent["child_peak"] = max(parent["child_peak"], peak, frame["outer_peak"])
+        rec.stages.append(entry)
+
+
+def note(name, value):
+    """구간 시간 외의 수치(예: 그래프 JSON 바이트 수)를 현재 재실행 기록에 남긴다."""
+    rec = current()
+    if rec is not None:
+        rec.metrics[name] = value
+
+
+def timed(name):
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def finish_run(rec, extra=None, log_path=None):
+    """
+    계측 결과를 dict로 반환하고 JSON 한 줄로 덧붙인다.
+    기록 경로: log_path > JFLH_PERF_LOG > (debug 재실행이면) DEBUG_LOG_PATH. 모두 없으면 기록하지 않는다.
+    """
+    if log_path is None and not LOG_OFF:
+        log_path = LOG_PATH or (DEBUG_LOG_PATH if rec.debug else None)
+    if getattr(_local, "recorder", None) is rec:
+        _local.recorder = None
+    record = {
+        "ts": round(rec.ts, 3),
+        "total_ms": round(rec.total_ms(), 2),
+        "stages": rec.stages,
+        "metrics": rec.metrics,
+        **(extra or {}),
+    }
+    if log_path:
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return record